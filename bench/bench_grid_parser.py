@@ -0,0 +1,42 @@
+"""
+Parse time per pick-grid page: single-pass grid parser vs the BeautifulSoup path.
+
+    python -m bench.bench_grid_parser
+"""
+import logging
+import timeit
+
+from bs4 import BeautifulSoup
+
+from bench.fixtures import pick_grid_html
+from espn.PickEmClient import PickEmClient
+from espn.grid_parser import parse_grid
+
+
+def parse_with_soup(html):
+    client = PickEmClient("bench")
+    tables = BeautifulSoup(html, "html.parser").find_all("table")
+    idx_to_name = client._parse_team_names(tables)
+    client._parse_picks(tables, idx_to_name, 1)
+
+
+def parse_with_grid_parser(html):
+    client = PickEmClient("bench")
+    client._parse_pages({1: [html]})
+
+
+def main():
+    # The soup path logs every pick cell; keep that out of the timings
+    logging.disable(logging.CRITICAL)
+    print(f"{'entries':>8} {'bytes':>10} {'html.parser ms':>15} {'grid parser ms':>15} {'speedup':>8}")
+    for num_entries in (10, 100, 1000):
+        html = pick_grid_html(num_entries)
+        assert parse_grid(html) is not None
+        runs = max(3, 300 // num_entries)
+        soup_ms = min(timeit.repeat(lambda: parse_with_soup(html), number=runs, repeat=3)) / runs * 1000
+        fast_ms = min(timeit.repeat(lambda: parse_with_grid_parser(html), number=runs, repeat=3)) / runs * 1000
+        print(f"{num_entries:>8} {len(html):>10} {soup_ms:>15.2f} {fast_ms:>15.2f} {soup_ms / fast_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
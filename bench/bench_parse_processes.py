@@ -0,0 +1,76 @@
+"""
+Re-parse time for a cached season as the number of parse processes grows,
+and the page count below which the process pool is not worth starting.
+
+    python -m bench.bench_parse_processes
+
+The threshold compares the cost of starting the spawn pool (once per run)
+with the in-process parse time per page: parsing fewer pages than
+startup / per-page time in this process is faster than waiting for the
+workers, whatever the core count. MIN_PAGES_FOR_PROCESSES in
+espn/PickEmClient.py is set from the json figure, the default extraction and
+the cheaper page to parse.
+"""
+import logging
+import math
+import os
+import tempfile
+import time
+
+from bench.fixtures import week_pages
+from espn.grid_parser import parse_records
+from espn.PickEmClient import PickEmClient, get_parse_pool, shutdown_parse_pool
+from espn.snapshots import SnapshotStore
+
+
+def pool_threshold(extraction="json", num_entries=1000, pages_per_week=20, repeat=3):
+    """
+    Returns (pool startup seconds, in-process seconds per page, page count at
+    which parsing in this process takes as long as starting the pool) for
+    pages of one extraction.
+    """
+    pages = week_pages(num_entries, 1, entries_per_page=num_entries // pages_per_week, extraction=extraction)
+    start = time.perf_counter()
+    for page in pages:
+        parse_records(1, page)
+    per_page = (time.perf_counter() - start) / len(pages)
+
+    startups = []
+    for _ in range(repeat):
+        shutdown_parse_pool()
+        start = time.perf_counter()
+        # The first result back means a worker has started and imported the parser
+        get_parse_pool(2).submit(parse_records, 1, pages[0]).result()
+        startups.append(time.perf_counter() - start)
+    shutdown_parse_pool()
+    startup = min(startups)
+    return startup, per_page, math.ceil(startup / per_page)
+
+
+def main(num_entries=1000, pages_per_week=2):
+    logging.disable(logging.CRITICAL)
+    for extraction in ("json", "html"):
+        startup, per_page, threshold = pool_threshold(extraction)
+        print(f"{extraction}: pool startup {startup * 1000:.0f} ms, in-process parse {per_page * 1000:.1f} ms/page, "
+              f"processes pay off from about {threshold} pages")
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        store = SnapshotStore(snapshot_dir, "bench")
+        for week in range(1, 19):
+            store.save_week(week, week_pages(num_entries, week, entries_per_page=num_entries // pages_per_week))
+
+        baseline = None
+        processes = 1
+        while processes <= (os.cpu_count() or 1):
+            client = PickEmClient("bench", snapshot_store=store, parse_processes=processes)
+            start = time.perf_counter()
+            client.run_from_snapshots()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{processes:>3} processes: {elapsed:.2f}s ({baseline / elapsed:.1f}x)")
+            processes *= 2
+    shutdown_parse_pool()
+
+
+if __name__ == "__main__":
+    main()
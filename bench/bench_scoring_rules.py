@@ -0,0 +1,29 @@
+"""
+Time to score a season under many scoring rules at once.
+
+    python -m bench.bench_scoring_rules
+"""
+import itertools
+import time
+
+from bench.fixtures import synthetic_teams
+from scoreboard.scoring_rules import ScoringRule, evaluate_rules
+from scoreboard.season_matrix import SeasonMatrix
+
+
+def main():
+    rules = [
+        ScoringRule(f"+{c}/{i}/{t}", c, i, t)
+        for c, i, t in itertools.product(range(1, 6), range(-1, -11, -1), (0, 0.5, 1, 2, 3, 4))
+    ]
+    for num_entries in (100, 1000, 5000):
+        season = SeasonMatrix(synthetic_teams(num_entries))
+        start = time.perf_counter()
+        standings = evaluate_rules(season, rules)
+        leaders = [standings[rule.name].rows(limit=1) for rule in rules]
+        elapsed = time.perf_counter() - start
+        print(f"{num_entries:>6} entries x {len(rules)} rules: {elapsed * 1000:.1f} ms ({len(leaders)} leaders)")
+
+
+if __name__ == "__main__":
+    main()
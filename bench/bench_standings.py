@@ -0,0 +1,48 @@
+"""
+Cost of live score updates: applying one pick's delta and reading the top
+of the table, incrementally versus re-sorting every total each time.
+
+    python -m bench.bench_standings
+"""
+import random
+import time
+
+from bench.fixtures import synthetic_teams
+from scoreboard.season_matrix import SeasonMatrix
+from scoreboard.standings import Standings
+
+
+def resorted_top(totals, n):
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return ranked[:n]
+
+
+def main(updates=2000, top_n=25):
+    rng = random.Random(0)
+    for num_entries in (1000, 5000, 20000):
+        season = SeasonMatrix(synthetic_teams(num_entries, weeks=4))
+        standings = Standings.from_season(season)
+        totals = {name: standings.total(name) for name in season.names}
+        changes = [(rng.choice(season.names), rng.randint(1, 18), rng.choice((1, -2, 3))) for _ in range(updates)]
+
+        start = time.perf_counter()
+        for name, week, delta in changes:
+            standings.apply_delta(name, week, delta)
+            standings.top(top_n)
+            standings.rank(name)
+        incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name, week, delta in changes:
+            totals[name] += delta
+            resorted_top(totals, top_n)
+        resorted = time.perf_counter() - start
+
+        print(
+            f"{num_entries:>6} entries, {updates} updates: incremental {incremental * 1e6 / updates:.0f} us/update, "
+            f"re-sort {resorted * 1e6 / updates:.0f} us/update ({resorted / incremental:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
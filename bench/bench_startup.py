@@ -0,0 +1,71 @@
+"""
+Wall time of driver.py from process start to exit for --help and for
+--render_only against a stored season, plus which scraping modules each
+one imported (there should be none).
+
+    python -m bench.bench_startup
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.fixtures import synthetic_teams
+from espn.season_data import SeasonData
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRAPING_MODULES = ("selenium", "splinter", "bs4", "requests", "websockets", "espn.PickEmClient")
+
+# Runs driver.py as __main__, then reports the scraping modules it pulled in
+RUNNER = """
+import runpy, sys
+sys.argv = ["driver.py"] + sys.argv[1:]
+try:
+    runpy.run_path("driver.py", run_name="__main__")
+except SystemExit:
+    pass
+loaded = sorted({m for m in sys.modules for s in %r if m == s or m.startswith(s + ".")} & set(%r))
+print(",".join(loaded), file=sys.stderr)
+""" % (SCRAPING_MODULES, SCRAPING_MODULES)
+
+
+def time_driver(args, runs):
+    timings = []
+    loaded = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", RUNNER, *args],
+            cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+        )
+        timings.append(time.perf_counter() - start)
+        loaded = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+    return timings, loaded
+
+
+def main(runs=5, num_entries=500):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        season_file = os.path.join(tmp_dir, "season.json")
+        season_data = SeasonData(season_file)
+        season_data.update_from_teams(synthetic_teams(num_entries), range(1, 19))
+        season_data.save()
+
+        cases = [
+            ("--help", ["--help"]),
+            (f"--render_only ({num_entries} entries)", [
+                "--group_id", "bench", "--render_only", "--season_file", season_file,
+                "--output_path", os.path.join(tmp_dir, "index.html"),
+            ]),
+        ]
+        for name, args in cases:
+            timings, loaded = time_driver(args, runs)
+            print(
+                f"{name:>28}: median {statistics.median(timings) * 1000:.0f} ms, "
+                f"best {min(timings) * 1000:.0f} ms; scraping imports: {loaded or 'none'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import json
+import random
+
+from espn.grid_parser import CORRECT_FLAG, INCORRECT_FLAG, LINK_FLAG, NO_PICK_FLAG
+from espn.models import Outcome, Pick, Team
+
+TEAM_NAMES = [
+    "Arizona Cardinals", "Atlanta Falcons", "Baltimore Ravens", "Buffalo Bills",
+    "Carolina Panthers", "Chicago Bears", "Cincinnati Bengals", "Cleveland Browns",
+    "Dallas Cowboys", "Denver Broncos", "Detroit Lions", "Green Bay Packers",
+    "Houston Texans", "Indianapolis Colts", "Jacksonville Jaguars", "Kansas City Chiefs",
+    "Las Vegas Raiders", "Los Angeles Chargers", "Los Angeles Rams", "Miami Dolphins",
+    "Minnesota Vikings", "New England Patriots", "New Orleans Saints", "New York Giants",
+    "New York Jets", "Philadelphia Eagles", "Pittsburgh Steelers", "San Francisco 49ers",
+    "Seattle Seahawks", "Tampa Bay Buccaneers", "Tennessee Titans", "Washington Commanders",
+]
+
+
+# Share of pick cells with each result, by name. "in_progress" is a week
+# with some games still to play; "final" has every game decided
+OUTCOME_MIXES = {
+    "in_progress": {"correct": 0.45, "incorrect": 0.40, "undecided": 0.10, "no_pick": 0.05},
+    "final": {"correct": 0.52, "incorrect": 0.45, "undecided": 0.0, "no_pick": 0.03},
+    "pregame": {"correct": 0.0, "incorrect": 0.0, "undecided": 0.97, "no_pick": 0.03},
+}
+
+# ESPN marks results with either readable or hashed class names, and has
+# used both on one element
+RESULT_CLASSES = {
+    "semantic": {"correct": "PickCorrect-checkMark", "incorrect": "PickIncorrect-crossMark"},
+    "hashed": {"correct": "css-1skkwww", "incorrect": "css-8wf538"},
+    "both": {"correct": "PickCorrect-checkMark css-1skkwww", "incorrect": "PickIncorrect-crossMark css-8wf538"},
+}
+
+ENTRIES_PER_PAGE = 50
+
+
+def _outcome_weights(outcome_mix):
+    mix = OUTCOME_MIXES[outcome_mix] if isinstance(outcome_mix, str) else outcome_mix
+    kinds = ["correct", "incorrect", "undecided", "no_pick"]
+    return kinds, [mix.get(kind, 0) for kind in kinds]
+
+
+def _grid_rows(num_entries, games, seed, outcome_mix, class_variant, first_entry):
+    """
+    Returns (matchups, rows) for one page: each row is (data-idx, entry number,
+    [(team, kind, result classes)]) with kind one of the OUTCOME_MIXES keys.
+    """
+    rng = random.Random(seed)
+    matchups = [rng.sample(TEAM_NAMES, 2) for _ in range(games)]
+    kinds, weights = _outcome_weights(outcome_mix)
+    variants = list(RESULT_CLASSES) if class_variant == "mixed" else [class_variant]
+    rows = []
+    for idx in range(num_entries):
+        cells = []
+        for home, away in matchups:
+            team = rng.choice((home, away))
+            kind = rng.choices(kinds, weights)[0]
+            classes = RESULT_CLASSES[rng.choice(variants)].get(kind)
+            cells.append((team, kind, classes))
+        rows.append((idx, first_entry + idx, cells))
+    return matchups, rows
+
+
+def pick_grid_html(num_entries, games=16, seed=0, outcome_mix="in_progress", class_variant="mixed", first_entry=0):
+    """
+    Returns synthetic GroupPickGrid HTML shaped like one captured page: an
+    entries table and a picks table sharing data-idx rows.
+
+    outcome_mix is a name from OUTCOME_MIXES or a dict of the same shape.
+    class_variant picks the result class names from RESULT_CLASSES, or
+    "mixed" for a random one per cell. Entries are named from first_entry
+    on, so several pages of one week hold different entries.
+    """
+    matchups, rows = _grid_rows(num_entries, games, seed, outcome_mix, class_variant, first_entry)
+    entry_rows = []
+    pick_rows = []
+    for idx, entry, cells in rows:
+        entry_rows.append(
+            f'<tr data-idx="{idx}" class="Table__TR">'
+            f'<td class="Table__TD GroupPickGrid-column--rank">{idx + 1}</td>'
+            f'<td class="Table__TD GroupPickGrid-column--entryName">'
+            f'<a class="GroupPickGrid-entryLink" href="/entry?id={entry}">Entry {entry}</a>'
+            f'<span class="GroupPickGrid-memberName">member{entry}</span></td></tr>'
+        )
+        tds = []
+        for team, kind, classes in cells:
+            if kind == "no_pick":
+                tds.append('<td class="Table__TD GroupPickGrid-column--pick noPick">--</td>')
+                continue
+            mark = f'<svg class="{classes}"></svg>' if classes else ""
+            tds.append(
+                f'<td class="Table__TD GroupPickGrid-column--pick">'
+                f'<a href="#"><img class="Image" alt="{team}" src="/i/{team[:3]}.png"/></a>{mark}</td>'
+            )
+        pick_rows.append(f'<tr data-idx="{idx}" class="Table__TR">{"".join(tds)}</tr>')
+
+    headers = "".join(f'<th class="Table__TH">{home[:3]} @ {away[:3]}</th>' for home, away in matchups)
+    return (
+        '<div class="GroupPickGrid-tableWrapper">'
+        '<table class="Table GroupPickGrid-entries"><thead>'
+        '<tr><th colspan="2">Group Entries</th></tr><tr><th>Rank</th><th>Entry</th></tr>'
+        f'</thead><tbody>{"".join(entry_rows)}</tbody></table>'
+        '<table class="Table GroupPickGrid-picks"><thead>'
+        f'<tr><th colspan="{len(matchups)}">Picks</th></tr><tr>{headers}</tr>'
+        f'</thead><tbody>{"".join(pick_rows)}</tbody></table></div>'
+    )
+
+
+def pick_grid_payload(num_entries, games=16, seed=0, outcome_mix="in_progress", first_entry=0):
+    """
+    Returns the same page as pick_grid_html, as the GRID_EXTRACT_JS payload
+    the json extraction captures instead of HTML.
+    """
+    _, rows = _grid_rows(num_entries, games, seed, outcome_mix, "mixed", first_entry)
+    flags = {"correct": CORRECT_FLAG | LINK_FLAG, "incorrect": INCORRECT_FLAG | LINK_FLAG,
+             "undecided": LINK_FLAG, "no_pick": NO_PICK_FLAG}
+    return json.dumps({
+        "v": 1,
+        "entries": [[idx, f"Entry {entry}"] for idx, entry, _ in rows],
+        "rows": [
+            [idx, [[None if kind == "no_pick" else team, flags[kind]] for team, kind, _ in cells]]
+            for idx, _, cells in rows
+        ],
+    }, separators=(",", ":"))
+
+
+def week_pages(num_entries, week, games=16, outcome_mix="in_progress", class_variant="mixed",
+               entries_per_page=ENTRIES_PER_PAGE, extraction="html", seed=0):
+    """
+    Returns the pick-grid pages of one week for a group of num_entries,
+    entries_per_page at a time, as the scrapers capture them: HTML, or
+    payloads with extraction="json".
+    """
+    pages = []
+    for first in range(0, num_entries, entries_per_page):
+        page_seed = seed * 10007 + week * 1009 + first // entries_per_page
+        size = min(entries_per_page, num_entries - first)
+        if extraction == "json":
+            pages.append(pick_grid_payload(size, games, page_seed, outcome_mix, first_entry=first))
+        else:
+            pages.append(pick_grid_html(size, games, page_seed, outcome_mix, class_variant, first_entry=first))
+    return pages
+
+
+def season_pages(num_entries, weeks=18, **kwargs):
+    """
+    Maps week to week_pages() for every week of a season.
+    """
+    return {week: week_pages(num_entries, week, **kwargs) for week in range(1, weeks + 1)}
+
+
+def synthetic_teams(num_entries, weeks=18, games=16, seed=0, outcome_mix=None):
+    """
+    Returns Team objects with a full season of random picks, built directly
+    rather than parsed from HTML. Picks are correct or incorrect at even odds
+    unless an outcome_mix is given; its no_pick share is left out.
+    """
+    rng = random.Random(seed)
+    if outcome_mix is None:
+        outcomes, weights = [Outcome.CORRECT, Outcome.INCORRECT], None
+    else:
+        kinds, weights = _outcome_weights(outcome_mix)
+        by_kind = {"correct": Outcome.CORRECT, "incorrect": Outcome.INCORRECT, "undecided": Outcome.UNDECIDED}
+        outcomes = [by_kind.get(kind) for kind in kinds]
+    teams = []
+    for idx in range(num_entries):
+        team = Team(f"Entry {idx}", "owner")
+        for week in range(1, weeks + 1):
+            for game in range(games):
+                outcome = rng.choice(outcomes) if weights is None else rng.choices(outcomes, weights)[0]
+                if outcome is not None:
+                    team.add_weekly_pick(week, Pick(rng.choice(TEAM_NAMES), outcome, game))
+        teams.append(team)
+    return teams
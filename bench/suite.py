@@ -0,0 +1,275 @@
+"""
+Offline benchmark suite: parsing, scoring, rendering and a full season for a
+synthetic group, checked against stored baselines.
+
+    python -m bench.suite                    # compare with bench/baselines.json
+    python -m bench.suite --save             # record new baselines
+    python -m bench.suite --entries 500 --only parse_json score
+
+Each case runs once to warm up, then --repeat times; its fastest run is compared with the
+baseline for the same entry count. A case slower than its baseline by more
+than --threshold is a regression, and the run exits with status 1.
+Baselines are only comparable on the machine that recorded them; the host
+they came from is stored with them and a mismatch is warned about.
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from bench.fixtures import season_pages, synthetic_teams, week_pages
+from espn.PickEmClient import PickEmClient
+from scoreboard.scoreboard import Scoreboard
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_ENTRIES = 5000
+DEFAULT_THRESHOLD = 0.25
+WEEKS = range(1, 19)
+
+
+def host_info():
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def parse(pages_by_week):
+    client = PickEmClient("bench")
+    client._parse_pages(pages_by_week)
+    return client.get_teams()
+
+
+def scoreboard_for(teams):
+    scoreboard = Scoreboard(teams)
+    scoreboard.submit_weeks(WEEKS)
+    return scoreboard
+
+
+class Fixtures:
+    """
+    Synthetic inputs for one entry count, generated on first use and shared
+    by every case.
+    """
+
+    def __init__(self, num_entries, out_dir):
+        self.num_entries = num_entries
+        self.out_file = os.path.join(out_dir, "index.html")
+        self._cache = {}
+
+    def _get(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    @property
+    def html_week(self):
+        return self._get("html_week", lambda: {1: week_pages(self.num_entries, 1, outcome_mix="final")})
+
+    @property
+    def json_week(self):
+        return self._get("json_week", lambda: {
+            1: week_pages(self.num_entries, 1, outcome_mix="final", extraction="json"),
+        })
+
+    @property
+    def json_season(self):
+        # A season in progress: settled weeks, the current week live, the rest not yet played
+        def build():
+            pages = season_pages(self.num_entries, weeks=10, outcome_mix="final", extraction="json")
+            pages[11] = week_pages(self.num_entries, 11, outcome_mix="in_progress", extraction="json")
+            pages[12] = week_pages(self.num_entries, 12, outcome_mix="pregame", extraction="json")
+            return pages
+        return self._get("json_season", build)
+
+    @property
+    def teams(self):
+        return self._get("teams", lambda: synthetic_teams(self.num_entries))
+
+    @property
+    def scoreboard(self):
+        return self._get("scoreboard", lambda: scoreboard_for(self.teams))
+
+
+def case_parse_html(fixtures):
+    """
+    One week of HTML pages through the grid parser.
+    """
+    pages = fixtures.html_week
+    return lambda: parse(pages)
+
+
+def case_parse_json(fixtures):
+    """
+    One week of extracted JSON pages.
+    """
+    pages = fixtures.json_week
+    return lambda: parse(pages)
+
+
+def case_score(fixtures):
+    """
+    A Scoreboard scoring and ranking every team's season.
+    """
+    teams = fixtures.teams
+    return lambda: scoreboard_for(teams)
+
+
+def case_render(fixtures):
+    """
+    Scoreboard.render of a scored season.
+    """
+    scoreboard = fixtures.scoreboard
+    return lambda: scoreboard.render(fixtures.out_file)
+
+
+def case_season(fixtures):
+    """
+    Parse, score and render twelve weeks of JSON pages, as a full run does.
+    """
+    pages = fixtures.json_season
+
+    def run():
+        scoreboard_for(parse(pages)).render(fixtures.out_file)
+    return run
+
+
+CASES = {
+    "parse_html": case_parse_html,
+    "parse_json": case_parse_json,
+    "score": case_score,
+    "render": case_render,
+    "season": case_season,
+}
+
+
+def time_case(run, repeat):
+    """
+    Fastest of repeat runs, in seconds, after one untimed warm-up run. Like
+    timeit, the garbage collector is off while timing, so a collection
+    triggered by the fixtures held in memory does not land in one case.
+    """
+    run()
+    best = None
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best
+
+
+def read_baselines(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def baselines_note(baselines):
+    """
+    Says which entry counts the baselines cover and which host recorded each,
+    for whoever reads the file.
+    """
+    sizes = sorted((key for key in baselines if key.isdigit()), key=int)
+    hosts = "; ".join(
+        f"{size} entries on {baselines[size]['host']['machine']} with {baselines[size]['host']['cpus']} cpu(s), "
+        f"Python {baselines[size]['host']['python']}"
+        for size in sizes
+    )
+    return (
+        f"Baselines cover only these entry counts: {hosts}. "
+        "Other counts and hosts have nothing to compare against; record them with --save."
+    )
+
+
+def write_baselines(path, baselines):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns (lines, regressions) comparing {case: seconds} with a baseline of
+    the same shape.
+    """
+    lines = [f"{'case':<12} {'seconds':>9} {'baseline':>9} {'change':>8}"]
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            lines.append(f"{name:<12} {seconds:>9.3f} {'-':>9} {'':>8}")
+            continue
+        change = seconds / base - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:<12} {seconds:>9.3f} {base:>9.3f} {change:>+7.0%}{flag}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite against stored baselines.")
+    parser.add_argument("--entries", type=int, default=DEFAULT_ENTRIES, help="Entries in the synthetic group.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the fastest counts.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Slowdown over baseline that counts as a regression, e.g. 0.25 for 25%%.")
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="Run only these cases.")
+    parser.add_argument("--baselines", default=BASELINES_PATH, help="Baselines file.")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baselines for this entry count.")
+    args = parser.parse_args()
+    # Parsing logs per page; keep that out of the timings
+    logging.disable(logging.CRITICAL)
+
+    names = args.only or list(CASES)
+    results = {}
+    with tempfile.TemporaryDirectory() as out_dir:
+        fixtures = Fixtures(args.entries, out_dir)
+        for name in names:
+            run = CASES[name](fixtures)
+            results[name] = time_case(run, args.repeat)
+            print(f"{name}: {results[name]:.3f}s", file=sys.stderr)
+
+    baselines = read_baselines(args.baselines)
+    key = str(args.entries)
+    if args.save:
+        recorded = baselines.get(key, {}).get("cases", {})
+        recorded.update(results)
+        baselines[key] = {"host": host_info(), "cases": recorded}
+        baselines["note"] = baselines_note(baselines)
+        write_baselines(args.baselines, baselines)
+        print(f"Baselines for {args.entries} entries saved to {args.baselines}")
+        return
+
+    baseline = baselines.get(key)
+    if baseline is None:
+        print(f"No baselines for {args.entries} entries in {args.baselines}; run with --save to record them")
+        baseline = {"cases": {}}
+    elif baseline.get("host") != host_info():
+        print(f"Warning: baselines were recorded on {baseline.get('host')}, this is {host_info()}")
+
+    lines, regressions = compare(results, baseline["cases"], args.threshold)
+    print(f"{args.entries} entries, fastest of {args.repeat}:")
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} case(s) over {args.threshold:.0%} slower than baseline: {regressions}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
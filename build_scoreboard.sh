@@ -1,10 +1,18 @@
 #! /bin/bash
 
-cd /home/andrew/code/picks2021/
+# GROUP_IDS lists the ESPN group IDs to build, separated by spaces. With
+# several, each group gets its own scoreboard under /tmp/sb-site/<group_id>
+# and s3://picks.apawl.com/<group_id>.
+: "${GROUP_IDS:?Set GROUP_IDS to the ESPN group IDs to build, separated by spaces}"
+
+cd "${SCOREBOARD_DIR:-/home/andrew/code/picks2021/}" || exit 1
 
 source .venv/bin/activate
 
-python driver.py
-aws s3 mv /tmp/sb-index.html s3://picks.apawl.com/index.html
+# Only pages whose content changed are rewritten and uploaded, with gzip and
+# brotli variants (pip install -r requirements-publish.txt)
+python driver.py --group_id $GROUP_IDS --site_dir /tmp/sb-site --publish_to s3://picks.apawl.com
+status=$?
 
 deactivate
+exit $status
@@ -1,26 +1,305 @@
 import argparse
-from espn.PickEmClient import PickEmClient
-from scoreboard.scoreboard import Scoreboard
+import logging
+import os
+import sys
+from espn.season_data import SeasonData
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+# The scraping stack (selenium, splinter, bs4, requests) and the render stack
+# (numpy, jinja2) are imported inside the functions that need them, so --help
+# and --render_only never pay for the scraping imports.
+
+def make_client(args, session_budget=None):
+    """
+    Builds the scraping client for the chosen backend. session_budget caps
+    the browser sessions of every client sharing it.
+    """
+    if args.backend == "http":
+        from espn.http_client import DEFAULT_BASE_URL, PickEmHttpClient, RequestsTransport
+        espn = PickEmHttpClient(args.group_id, transport=RequestsTransport(args.api_base_url or DEFAULT_BASE_URL))
+    else:
+        from espn.browser_profile import DEFAULT_BLOCKED_URLS, BrowserProfile
+        from espn.snapshots import SnapshotStore
+        from espn.week_state import WeekState
+
+        snapshot_store = SnapshotStore(args.snapshot_dir, args.group_id) if args.snapshot_dir else None
+        week_state = None
+        if args.incremental:
+            week_state = WeekState(os.path.join(args.snapshot_dir, str(args.group_id), "week_state.json"))
+        client_args = dict(
+            snapshot_store=snapshot_store,
+            week_state=week_state,
+            parse_processes=args.parse_processes,
+            extraction=args.extraction,
+            max_sessions=args.max_sessions,
+            max_retries=args.max_retries,
+            checkpoint_ttl=args.checkpoint_ttl * 60,
+            browser_profile=BrowserProfile(
+                blocked_urls=([] if args.no_default_blocklist else DEFAULT_BLOCKED_URLS) + args.block_url,
+                load_images=args.load_images,
+                page_load_strategy=args.page_load_strategy,
+                cache_dir=args.browser_cache_dir,
+                session_budget=session_budget,
+            ),
+        )
+        if args.backend == "cdp":
+            # Imported here so the other backends do not need websockets installed
+            from espn.cdp_engine import CdpPickEmClient
+            espn = CdpPickEmClient(args.group_id, tabs=args.tabs, chrome_binary=args.chrome_binary, **client_args)
+        else:
+            from espn.PickEmClient import PickEmClient
+            espn = PickEmClient(args.group_id, **client_args)
+    return espn
+
+
+def scrape_group(args, session_budget=None):
+    """
+    Scrapes (or re-parses) the group's picks with the chosen backend and
+    returns the client holding its teams, or None if weeks are left
+    incomplete (unless allowed).
+    """
+    espn = make_client(args, session_budget)
+    if args.from_snapshots:
+        espn.run_from_snapshots(week=args.week)
+    else:
+        espn.run(week=args.week)
+    incomplete_weeks = sorted(getattr(espn, "incomplete_weeks", ()))
+    if incomplete_weeks and not args.allow_incomplete:
+        print(f"Group {args.group_id}: weeks {incomplete_weeks} are incomplete; not rendering the "
+              f"scoreboard (rerun to resume them, or pass --allow_incomplete)", file=sys.stderr)
+        return None
+    return espn
+
+
+def render_outputs(args, teams, weeks_to_run):
+    """
+    Renders the scoreboard, builds the site and publishes it, as configured.
+    """
+    from scoreboard.scoreboard import Scoreboard
+    scoreboard = Scoreboard(teams)
+    scoreboard.submit_weeks(weeks_to_run)
+    scoreboard.render(args.output_path)
+    print(f"Scoreboard rendered to {args.output_path}")
+    if args.site_dir:
+        from scoreboard.site import SiteGenerator
+        site = SiteGenerator(args.site_dir)
+        site.build(scoreboard, weeks_to_run)
+        print(f"Site written to {args.site_dir}: {len(site.written)} page(s) changed")
+    if args.publish_to:
+        from scoreboard.publish import Publisher, backend_for
+        publisher = Publisher(backend_for(args.publish_to, args.distribution_id), encodings=publish_encodings(args))
+        publisher.publish_directory(args.site_dir)
+        print(f"Published to {args.publish_to}: {len(publisher.uploaded)} object(s) uploaded")
+
+
+def publish_encodings(args):
+    return ("gzip",) if args.no_brotli else ("gzip", "br")
+
+
+def watch(args, teams, season_file, client=None):
+    """
+    Keeps a warm browser session on the current week until interrupted,
+    re-rendering whenever its picks change. client is the one that scraped
+    teams, if any, so the daemon starts from the pages it captured.
+    """
+    from espn.watch import GameClock, WatchDaemon
+
+    if client is None:
+        client = make_client(args)
+        client.teams = {team.name: team for team in teams}
+
+    def on_change(teams, weeks):
+        if season_file:
+            season_data = SeasonData(season_file)
+            season_data.update_from_teams(teams, weeks)
+            season_data.save()
+        render_outputs(args, teams, range(1, 19))
+
+    clock = GameClock(live_interval=args.live_interval, idle_interval=args.idle_interval * 60)
+    WatchDaemon(client, on_change, clock=clock).run()
+
+
+def group_args(args, group_id, num_groups):
+    """
+    Returns a copy of args for one group. With several groups, output paths
+    holding "{group_id}" are filled in; others get the group ID added: as a
+    file name suffix for --output_path and --season_file, as a subdirectory
+    or key prefix for --site_dir and --publish_to.
+    """
+    group = argparse.Namespace(**vars(args))
+    group.group_id = group_id
+
+    def for_group(path, is_dir):
+        if path is None:
+            return None
+        if "{group_id}" in path:
+            return path.format(group_id=group_id)
+        if num_groups == 1:
+            return path
+        if is_dir:
+            return f"{path.rstrip('/')}/{group_id}"
+        root, ext = os.path.splitext(path)
+        return f"{root}-{group_id}{ext}"
+
+    group.output_path = for_group(args.output_path, is_dir=False)
+    group.season_file = for_group(args.season_file, is_dir=False)
+    group.site_dir = for_group(args.site_dir, is_dir=True)
+    group.publish_to = for_group(args.publish_to, is_dir=True)
+    if not group.season_file and args.snapshot_dir:
+        group.season_file = os.path.join(args.snapshot_dir, str(group_id), "season.json")
+    return group
+
+
+def pool_share(budget_limit, concurrent_groups, max_sessions=None):
+    """
+    Most pooled sessions one group may run under a shared budget: its share
+    of what is left once every group running at once holds the browser that
+    reads its week list. Never more than max_sessions, if given.
+    """
+    share = max(1, (budget_limit - concurrent_groups) // concurrent_groups)
+    return min(share, max_sessions) if max_sessions else share
+
+
+def run_group(args, session_budget=None):
+    """
+    Scrapes (or loads) one group's season and renders its outputs. Returns
+    False if nothing could be rendered.
+    """
+    weeks_to_run = [args.week] if args.week else range(1, 19)
+    client = None
+    if args.render_only:
+        season_data = SeasonData(args.season_file)
+        if not season_data.teams:
+            print(f"Group {args.group_id}: no season data in {args.season_file}", file=sys.stderr)
+            return False
+        teams = season_data.get_teams()
+    else:
+        client = scrape_group(args, session_budget)
+        if client is None:
+            return False
+        teams = client.get_teams()
+        if args.season_file:
+            season_data = SeasonData(args.season_file)
+            season_data.update_from_teams(teams, weeks_to_run)
+            season_data.save()
+
+    render_outputs(args, teams, weeks_to_run)
+
+    if args.watch:
+        watch(args, teams, args.season_file, client)
+    return True
+
 
 def main():
     parser = argparse.ArgumentParser(description="Generate a scoreboard for an ESPN Pigskin Pick'em group.")
-    parser.add_argument("--group_id", required=True, help="The ID of the ESPN Pigskin Pick'em group.")
+    parser.add_argument("--group_id", required=True, nargs="+", help="The ID of the ESPN Pigskin Pick'em group. Several IDs scrape their groups side by side and render one scoreboard each.")
     parser.add_argument("--output_path", default="/tmp/sb-index.html", help="The path to the output HTML file.")
     parser.add_argument("--week", type=int, help="Run for a single week.")
+    parser.add_argument("--snapshot_dir", help="Directory for scraped page snapshots. Final weeks are read from here instead of the browser.")
+    parser.add_argument("--incremental", action="store_true", help="Only scrape weeks that still had undecided picks last run, plus weeks not seen before; the rest are read from snapshots. Requires --snapshot_dir.")
+    parser.add_argument("--backend", choices=["browser", "cdp", "http"], default="browser", help="Scrape the pick grid in Chrome via Selenium, in many tabs of one Chrome over DevTools, or read ESPN's JSON endpoints directly.")
+    parser.add_argument("--max_sessions", type=int, help="Most browser sessions the browser backend may run at once (default: what the host's cores and memory allow). The actual number adapts to page latency and throttling.")
+    parser.add_argument("--max_total_sessions", type=int, help="Most browser sessions across every group of the run (default with several groups: what the host's cores and memory allow).")
+    parser.add_argument("--tabs", type=int, default=8, help="Tabs the cdp backend scrapes with at once.")
+    parser.add_argument("--chrome_binary", help="Chrome executable for the cdp backend (default: $CHROME_BINARY or the first Chrome on PATH).")
+    parser.add_argument("--api_base_url", help="Base URL for the http backend (default: ESPN's API).")
+    parser.add_argument("--from_snapshots", action="store_true", help="Rebuild the scoreboard from stored snapshots without a browser. Requires --snapshot_dir.")
+    parser.add_argument("--season_file", help="JSON file holding every team's picks, written after each run and read by --render_only (default: season.json in the group's --snapshot_dir).")
+    parser.add_argument("--render_only", action="store_true", help="Render the scoreboard from --season_file without scraping or parsing anything.")
+    parser.add_argument("--site_dir", help="Also write the scoreboard as a static site here: standings, one page per week and one per entry. Only pages whose content changed are rewritten.")
+    parser.add_argument("--publish_to", help="After building --site_dir, publish the pages that changed to s3://bucket/prefix or a local directory, with gzip and brotli variants.")
+    parser.add_argument("--no_brotli", action="store_true", help="Publish only .gz variants, without brotli installed.")
+    parser.add_argument("--distribution_id", help="CloudFront distribution in which --publish_to invalidates the changed paths.")
+    parser.add_argument("--watch", action="store_true", help="After the first render, keep a browser on the current week and re-render whenever its picks change. Stop with Ctrl-C or SIGTERM.")
+    parser.add_argument("--live_interval", type=float, default=30, help="Seconds between --watch captures while NFL games are on.")
+    parser.add_argument("--idle_interval", type=float, default=60, help="Most minutes between --watch captures outside game windows.")
+    parser.add_argument("--parse_processes", type=int, help="Processes used to parse pages read from snapshots (default: CPU count).")
+    parser.add_argument("--extraction", choices=["json", "html"], default="json", help="Read the pick grid in the browser and ship it as JSON, or capture its full HTML.")
+    parser.add_argument("--block_url", action="append", default=[], help="Extra URL pattern for Chrome to block, e.g. '*.example.com*'. Repeatable.")
+    parser.add_argument("--no_default_blocklist", action="store_true", help="Do not block the built-in list of font, media, ad and analytics URLs.")
+    parser.add_argument("--load_images", action="store_true", help="Let Chrome download images (team logos are only read for their alt text).")
+    parser.add_argument("--page_load_strategy", choices=["normal", "eager", "none"], default="eager", help="When Chrome treats a navigation as done.")
+    parser.add_argument("--browser_cache_dir", help="Disk cache directory shared by every Chrome session, kept between runs.")
+    parser.add_argument("--max_retries", type=int, default=2, help="Times a week with missing pages is retried, for its missing pages only.")
+    parser.add_argument("--checkpoint_ttl", type=float, default=120, help="Minutes a week's page checkpoint in --snapshot_dir stays usable for resuming.")
+    parser.add_argument("--allow_incomplete", action="store_true", help="Render the scoreboard even if some weeks are missing pages or entries.")
+    parser.add_argument("--metrics_path", help="Write timing spans and counters here: Prometheus text if it ends in .prom, JSON otherwise.")
     args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    tracer.enabled = bool(args.metrics_path)
+    if (args.incremental or args.from_snapshots) and not args.snapshot_dir:
+        parser.error("--incremental and --from_snapshots require --snapshot_dir")
 
-    espn = PickEmClient(args.group_id)
-    espn.run(week=args.week)
-    teams = espn.get_teams()
-    scoreboard = Scoreboard(teams)
+    if args.publish_to and not args.site_dir:
+        parser.error("--publish_to requires --site_dir")
+    if args.publish_to:
+        from scoreboard.publish import check_dependencies
+        try:
+            check_dependencies(args.publish_to, publish_encodings(args))
+        except ImportError as e:
+            parser.error(str(e))
+    if args.backend == "http" and not args.render_only and (args.snapshot_dir or args.incremental or args.from_snapshots):
+        # The http backend reads JSON, not pick-grid pages, so there is nothing to snapshot
+        parser.error("--snapshot_dir, --incremental and --from_snapshots need a browser backend; "
+                     "with --backend http, keep season data with --season_file")
+    if args.watch and args.backend != "browser":
+        parser.error("--watch requires --backend browser")
+    if args.watch and args.week:
+        parser.error("--watch follows the current week and cannot be combined with --week")
+    if args.watch and len(args.group_id) > 1:
+        parser.error("--watch takes a single --group_id")
+    if args.render_only and not (args.season_file or args.snapshot_dir):
+        parser.error("--render_only requires --season_file or --snapshot_dir")
 
-    weeks_to_run = [args.week] if args.week else range(1, 19)
-    for team in teams:
-        for week in weeks_to_run:
-            scoreboard.submit_team_week(team, week)
+    group_ids = args.group_id
+    session_budget = None
+    concurrent_groups = len(group_ids)
+    if args.backend != "http" and not args.render_only and (len(group_ids) > 1 or args.max_total_sessions):
+        from espn.concurrency import ConcurrencyController, SessionBudget
+        session_budget = SessionBudget(args.max_total_sessions or ConcurrencyController.host_limit())
+        if session_budget.limit < 2:
+            parser.error("--max_total_sessions must be at least 2")
+        # A browser-backend group holds one session to read the week list while
+        # its pool scrapes, so fewer groups than sessions run at once to always
+        # leave one free for some pool
+        concurrent_groups = min(len(group_ids), session_budget.limit - 1)
+        args.max_sessions = pool_share(session_budget.limit, concurrent_groups, args.max_sessions)
+
+    if len(group_ids) == 1:
+        ok = run_group(group_args(args, group_ids[0], 1), session_budget)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        logger.info(
+            f"Running {len(group_ids)} groups, {concurrent_groups} at a time"
+            + (f", within {session_budget.limit} browser sessions" if session_budget else "")
+        )
+        with ThreadPoolExecutor(max_workers=concurrent_groups) as executor:
+            results = list(executor.map(
+                lambda group_id: run_group(group_args(args, group_id, len(group_ids)), session_budget),
+                group_ids,
+            ))
+        ok = all(results)
+        failed = [group_id for group_id, result in zip(group_ids, results) if not result]
+        if failed:
+            print(f"No scoreboard rendered for groups {failed}", file=sys.stderr)
+    if session_budget:
+        logger.info(
+            f"Browser sessions: at most {session_budget.peak} of {session_budget.limit} at once, "
+            f"{session_budget.waits} launch(es) waited for one"
+        )
+
+    if args.metrics_path:
+        tracer.write(args.metrics_path)
+        print(f"Metrics written to {args.metrics_path}")
+    if not ok:
+        sys.exit(1)
 
-    scoreboard.render(args.output_path)
-    print(f"Scoreboard rendered to {args.output_path}")
 
 if __name__ == "__main__":
     main()
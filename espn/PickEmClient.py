@@ -6,14 +6,27 @@ from selenium.common.exceptions import (
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from splinter import Browser
 from splinter.exceptions import ElementDoesNotExist
 import logging
 import base64
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import math
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from queue import Queue
+from threading import Lock, Thread
 
-from espn.models import Team, Pick
+from espn.browser_pool import BrowserPool
+from espn.browser_profile import BrowserProfile
+from espn.concurrency import ConcurrencyController
+from espn.grid_parser import GRID_EXTRACT_JS, is_extracted, parse_grid, parse_records
+from espn.models import Outcome, Pick, Team
+from espn.snapshots import page_hash
+from espn.telemetry import tracer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,12 +36,170 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Identifies the page of entries currently shown in the pick grid: the row count
+# plus the first and last entry rows. Any pagination changes it.
+GRID_FINGERPRINT_JS = """
+var grid = document.querySelector("[class*='GroupPickGrid-table']");
+if (!grid) { return null; }
+var rows = grid.querySelectorAll("tr[data-idx]");
+if (!rows.length) { return "0"; }
+return rows.length + "|" + rows[0].getAttribute("data-idx") + "|" + rows[0].textContent
+    + "|" + rows[rows.length - 1].textContent;
+"""
+
+
+# Reads the numbered pagination buttons and, given a target page (arguments[0]),
+# clicks the visible page number closest to it. Returns null when the grid has
+# no numbered pagination, otherwise {current, last, clicked, fingerprint} where
+# last is the highest page number shown, clicked is the page clicked (null if
+# none is closer than the current one) and fingerprint is GRID_FINGERPRINT_JS
+# taken before the click. A long page list may be elided ("1 2 3 ... 20"), so
+# reaching a far page can take a few jumps.
+PAGE_JUMP_JS = """
+var fingerprint = (function () {""" + GRID_FINGERPRINT_JS + """})();
+var target = arguments[0];
+var candidates = document.querySelectorAll(
+    "[class*='Pagination'] li, [class*='Pagination'] a, [class*='Pagination'] button");
+var pages = [], current = null;
+for (var i = 0; i < candidates.length; i++) {
+    var el = candidates[i], text = el.textContent.trim();
+    if (!/^[0-9]+$/.test(text) || el.querySelector("li, a, button")) { continue; }
+    var num = parseInt(text, 10), item = el.closest("li") || el;
+    var active = /active|current|selected/i.test(item.className + " " + el.className)
+        || item.getAttribute("aria-current") || el.getAttribute("aria-current");
+    if (active) { current = num; }
+    pages.push([num, el]);
+}
+if (!pages.length || current === null) { return null; }
+var last = Math.max.apply(null, pages.map(function (p) { return p[0]; }));
+var best = null;
+if (target !== null && target !== current) {
+    for (var j = 0; j < pages.length; j++) {
+        if (Math.abs(pages[j][0] - target) < Math.abs(current - target)
+                && (!best || Math.abs(pages[j][0] - target) < Math.abs(best[0] - target))) {
+            best = pages[j];
+        }
+    }
+}
+if (best) { best[1].click(); }
+return {current: current, last: last, clicked: best ? best[0] : null, fingerprint: fingerprint};
+"""
+
+# Page text that means ESPN is rate limiting or blocking us rather than slow
+THROTTLE_PATTERN = re.compile(r"too many requests|rate limit|access denied|\b429\b", re.IGNORECASE)
+
+PAGE_TEXT_JS = """
+return document.title + " " + (document.body ? document.body.innerText.slice(0, 500) : "");
+"""
+
+# A week is only split across sessions if each gets at least this many pages
+MIN_PAGES_PER_CHUNK = 3
+
+# Upper bound on page-number clicks to reach one page
+MAX_PAGE_JUMPS = 10
+
+# Fewer pages than this are parsed in this process: starting the process pool
+# takes longer than parsing them here. bench.bench_parse_processes measured a
+# 120-270 ms pool startup against 2.2 ms per 50-entry JSON page (51 ms per HTML
+# page, which pays off from about 6 pages); the JSON figure is used
+MIN_PAGES_FOR_PROCESSES = 120
+
+_parse_pool = None  # (processes, ProcessPoolExecutor) shared by every client
+_parse_pool_lock = Lock()
+
+
+def get_parse_pool(processes):
+    """
+    Returns the process pool pages are parsed in, started on first use and
+    reused by every client after that. Workers are spawned rather than forked,
+    so they never inherit a lock held by a parser thread, the browser pool or
+    logging at the time.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None and _parse_pool[0] != processes:
+            _parse_pool[1].shutdown()
+            _parse_pool = None
+        if _parse_pool is None:
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+            _parse_pool = (processes, executor)
+        return _parse_pool[1]
+
+
+def shutdown_parse_pool():
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool[1].shutdown()
+            _parse_pool = None
+
+
+class PaginationTimeout(Exception):
+    """
+    Raised when the pick grid does not change after a pagination click.
+    """
+
 
 class PickEmClient:
-    def __init__(self, group_id):
+    def __init__(
+        self,
+        group_id,
+        snapshot_store=None,
+        week_state=None,
+        max_pages_per_session=60,
+        num_parsers=2,
+        page_queue_size=8,
+        parse_processes=None,
+        extraction="json",
+        browser_profile=None,
+        max_sessions=None,
+        concurrency=None,
+        max_retries=2,
+        retry_backoff=5.0,
+        checkpoint_ttl=2 * 3600,
+    ):
         self.group_id = group_id
         self.teams = {}  # Maps team name to Team object
         self.teams_lock = Lock()  # For thread-safe access to self.teams
+        self.snapshot_store = snapshot_store  # Optional espn.snapshots.SnapshotStore
+        # Optional espn.week_state.WeekState; when set, runs are incremental and only
+        # weeks with undecided picks (or not seen before) are scraped
+        self.week_state = week_state
+        self.max_pages_per_session = max_pages_per_session
+        # Sets how many pooled browser sessions scrape at once, across weeks and
+        # pages of a week. It adapts to latency and host memory, up to max_sessions
+        # (default: what the host's cores and memory allow).
+        self.concurrency = concurrency or ConcurrencyController(max_limit=max_sessions)
+        self.browser_pool = None
+        self.page_transition_times = []  # Seconds each pagination click took to show a new page
+        # Captured pages are parsed by num_parsers threads while scraping continues.
+        # The bounded queue keeps only a few pages of raw HTML alive at once.
+        self.num_parsers = num_parsers
+        self.page_queue = Queue(maxsize=page_queue_size)
+        # Pages read back from snapshots are parsed across this many processes
+        self.parse_processes = parse_processes or os.cpu_count() or 1
+        # "json" reads the grid in the browser and ships only the pick data;
+        # "html" always ships outerHTML. JSON mode falls back to outerHTML for
+        # any page the extraction script cannot read.
+        self.extraction = extraction
+        # Launch settings for every Chrome this client starts; collects their traffic
+        self.browser_profile = browser_profile or BrowserProfile()
+        # Every captured page is recorded, so a week with missing pages is retried
+        # from its first missing page (up to max_retries times, waiting
+        # retry_backoff seconds and doubling). With a snapshot store the pages are
+        # also checkpointed on disk, and a later run within checkpoint_ttl seconds
+        # resumes from them.
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.checkpoint_ttl = checkpoint_ttl
+        self.captured_pages = defaultdict(set)  # Maps week to page numbers captured
+        self.page_hashes = defaultdict(dict)  # Maps week to {page number: sha256 of the captured page}
+        self.last_pages = {}  # Maps week to its final page number, once seen
+        self.retries = Counter()  # Maps week to retries used
+        self.incomplete_weeks = {}  # Maps week to the page ranges it is still missing
+        self.unparsed_pages = defaultdict(set)  # Maps week to captured pages that failed to parse
+        self.completeness = {}  # Per-week completeness report of the last run
+        self.pages_lock = Lock()
         self.browser = None
         self.wait = None
 
@@ -36,22 +207,298 @@ class PickEmClient:
         """
         Main method to orchestrate the scraping and parsing process.
         """
+        parsers = self._start_parsers()
+        try:
+            # A single final week can be served entirely from disk, no browser needed
+            if week is not None and self._load_snapshot_weeks([week]):
+                loaded_weeks, scraped_weeks = [week], []
+            else:
+                loaded_weeks, scraped_weeks = self._scrape_with_browser(week)
+                self._report_traffic()
+        finally:
+            self._stop_parsers(parsers)
+
+        scraped_weeks = self._drop_unparsed_weeks(scraped_weeks)
+        if self.snapshot_store:
+            for week_num in scraped_weeks:
+                self.snapshot_store.finish_week(week_num, final=self._is_week_final(week_num))
+        self._update_week_state(loaded_weeks + scraped_weeks)
+        self._report_completeness(loaded_weeks, scraped_weeks)
+
+    def _drop_unparsed_weeks(self, scraped_weeks):
+        """
+        Moves scraped weeks with pages that failed to parse to incomplete_weeks,
+        so they are neither finished in the snapshot store nor reported
+        complete, and the next run scrapes those pages again. Returns the rest.
+        """
+        complete = []
+        for week_num in scraped_weeks:
+            if self.unparsed_pages.get(week_num):
+                self.incomplete_weeks[week_num] = self._missing_ranges(week_num)
+                if self.snapshot_store:
+                    self.snapshot_store.discard_week(week_num)
+            else:
+                complete.append(week_num)
+        return complete
+
+    def _report_completeness(self, loaded_weeks, scraped_weeks):
+        """
+        Logs which weeks are complete and which are still missing pages, and
+        keeps the same report in self.completeness.
+        """
+        self.completeness = {}
+        for week_num in loaded_weeks:
+            self.completeness[week_num] = {"status": "loaded"}
+        for week_num in scraped_weeks:
+            self.completeness[week_num] = {
+                "status": "complete",
+                "pages": len(self.captured_pages[week_num]),
+                "retries": self.retries[week_num],
+            }
+        for week_num, missing in self.incomplete_weeks.items():
+            self.completeness[week_num] = {
+                "status": "incomplete",
+                "pages": len(self.captured_pages[week_num]),
+                "missing": self._format_ranges(missing),
+                "retries": self.retries[week_num],
+            }
+        for week_num, entry in sorted(self.completeness.items()):
+            details = ", ".join(f"{key}={value}" for key, value in entry.items() if key != "status")
+            log = logger.warning if entry["status"] == "incomplete" else logger.info
+            log(f"Week {week_num}: {entry['status']}" + (f" ({details})" if details else ""))
+        tracer.incr("incomplete_weeks", len(self.incomplete_weeks))
+
+    @staticmethod
+    def _format_ranges(ranges):
+        return ", ".join(
+            str(first) if first == last else f"{first}-{'' if last is None else last}"
+            for first, last in ranges
+        )
+
+    def _scrape_with_browser(self, week=None):
+        """
+        Launches Chrome, opens the group's pick grid and scrapes it.
+        Returns (weeks loaded from snapshots, weeks scraped completely).
+        """
+        self.browser = self.browser_profile.launch()
         try:
-            with Browser("chrome", headless=True) as browser:
-                self.browser = browser
-                self.wait = WebDriverWait(self.browser.driver, 20)
+            self.wait = WebDriverWait(self.browser.driver, 20)
+            with tracer.span("navigate", group_id=self.group_id):
                 self._navigate_to_group_picks()
-                weeks_to_soups = self._scrape_all_weeks(week=week)
-                self._parse_soups(weeks_to_soups)
+            return self._scrape_all_weeks(week=week)
         finally:
+            self.browser_profile.close(self.browser)
             self.browser = None
             self.wait = None
 
+    def _report_traffic(self):
+        traffic = self.browser_profile.traffic.to_dict()
+        logger.info(f"Browser traffic: {self.browser_profile.traffic.summary()}")
+        for counter in ("requests", "bytes_downloaded", "blocked_requests", "cached_responses", "cached_bytes"):
+            tracer.incr(f"browser_{counter}", traffic[counter])
+
+    def _start_parsers(self):
+        parsers = [Thread(target=self._parse_worker, daemon=True) for _ in range(self.num_parsers)]
+        for parser in parsers:
+            parser.start()
+        return parsers
+
+    def _stop_parsers(self, parsers):
+        """
+        Waits for every queued page to be parsed, then stops the parser threads.
+        """
+        for _ in parsers:
+            self.page_queue.put(None)
+        for parser in parsers:
+            parser.join()
+
+    def _parse_worker(self):
+        while True:
+            item = self.page_queue.get()
+            if item is None:
+                return
+            week_num, page_num, pick_grid = item
+            try:
+                parsed = self._parse_page(week_num, pick_grid)
+            except Exception as e:
+                logger.error(f"Failed to parse week {week_num}, page {page_num}: {e}")
+                parsed = False
+            if not parsed:
+                self._unmark_page(week_num, page_num)
+            elif page_num in self.unparsed_pages.get(week_num, ()):
+                # A retry captured it again, and this time it parsed
+                with self.pages_lock:
+                    self.unparsed_pages[week_num].discard(page_num)
+
+    def _unmark_page(self, week_num, page_num):
+        """
+        Forgets a captured page that could not be parsed: it counts as missing
+        again, and is dropped from the week's checkpoint so a resumed run
+        captures it afresh.
+        """
+        with self.pages_lock:
+            self.captured_pages[week_num].discard(page_num)
+            self.page_hashes[week_num].pop(page_num, None)
+            self.unparsed_pages[week_num].add(page_num)
+        if self.snapshot_store:
+            self.snapshot_store.drop_page(week_num, page_num)
+
+    def _submit_page(self, week_num, page_num, pick_grid, save=True):
+        """
+        Hands a freshly captured page to the parsers, saving it to the snapshot
+        store first if one is configured. Blocks while the queue is full. A page
+        already captured this run is ignored, so a retry never parses it twice.
+        """
+        with self.pages_lock:
+            if page_num in self.captured_pages[week_num]:
+                return
+            self.captured_pages[week_num].add(page_num)
+            self.page_hashes[week_num][page_num] = page_hash(pick_grid)
+        tracer.incr("pages")
+        tracer.incr("bytes", len(pick_grid))
+        if self.snapshot_store and save:
+            self.snapshot_store.save_page(week_num, page_num, pick_grid)
+        self.page_queue.put((week_num, page_num, pick_grid))
+
+    def _mark_last_page(self, week_num, page_num):
+        self.last_pages[week_num] = page_num
+        if self.snapshot_store:
+            self.snapshot_store.mark_last_page(week_num, page_num)
+
+    def _missing_ranges(self, week_num):
+        """
+        Returns the (first, last) page ranges of a week not captured yet. If the
+        week's final page has not been seen, the last range is open-ended (None).
+        """
+        with self.pages_lock:
+            captured = set(self.captured_pages.get(week_num, ()))
+        last_page = self.last_pages.get(week_num)
+        end = last_page if last_page is not None else max(captured, default=0)
+        ranges = []
+        start = None
+        for page_num in range(1, end + 1):
+            if page_num not in captured:
+                start = page_num if start is None else start
+            elif start is not None:
+                ranges.append((start, page_num - 1))
+                start = None
+        if start is not None:
+            ranges.append((start, end))
+        if last_page is None:
+            ranges.append((end + 1, None))
+        return ranges
+
+    def _initial_ranges(self, week_num):
+        """
+        Page ranges to start a week with: None for a fresh week (scrape it
+        whole, splitting as usual), or the pages a resumed checkpoint lacks.
+        """
+        if not self.captured_pages.get(week_num):
+            return None
+        return self._missing_ranges(week_num)
+
+    def _plan_retry(self, week_num):
+        """
+        Called once every task of a week has finished. Returns (delay, page
+        ranges) to retry the week's missing pages, or None if the week is
+        complete or out of retries, in which case it is recorded as incomplete.
+        """
+        missing = self._missing_ranges(week_num)
+        if not missing:
+            logger.info(f"Completed scraping week {week_num} with {len(self.captured_pages[week_num])} page(s)")
+            return None
+        attempt = self.retries[week_num]
+        if attempt >= self.max_retries:
+            logger.error(
+                f"Giving up on week {week_num} after {attempt} retries, "
+                f"missing pages {self._format_ranges(missing)}"
+            )
+            self.incomplete_weeks[week_num] = missing
+            self._discard_week(week_num)
+            return None
+        self.retries[week_num] += 1
+        delay = self.retry_backoff * 2 ** attempt
+        logger.warning(
+            f"Week {week_num} is missing pages {self._format_ranges(missing)}, "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.0f}s"
+        )
+        return delay, missing
+
+    def _load_snapshot_weeks(self, week_nums):
+        """
+        Parses every week in week_nums that can be served from the snapshot
+        store and returns the ones that were.
+        """
+        weeks_to_pages = {}
+        for week_num in week_nums:
+            pages = self._load_snapshot(week_num)
+            if pages is not None:
+                weeks_to_pages[week_num] = pages
+        self._parse_in_processes(weeks_to_pages)
+        return list(weeks_to_pages)
+
+    def run_from_snapshots(self, week=None):
+        """
+        Rebuilds the teams from every week in the snapshot store, final or not,
+        without launching a browser.
+        """
+        weeks_to_pages = {}
+        for week_num in [week] if week is not None else range(1, 19):
+            pages = self.snapshot_store.load_week(week_num)
+            if pages:
+                weeks_to_pages[week_num] = pages
+        logger.info(f"Re-parsing {len(weeks_to_pages)} week(s) from snapshots")
+        self._parse_in_processes(weeks_to_pages)
+
+    def _parse_in_processes(self, weeks_to_pages):
+        """
+        Parses raw pick grid HTML across the shared process pool (see
+        get_parse_pool). Workers return compact records rather than soups
+        (which pickle badly), and a single merge step here turns them into
+        picks on the shared Team objects. Fewer than MIN_PAGES_FOR_PROCESSES
+        pages are parsed in this process.
+        """
+        jobs = [(week, pick_grid) for week, pages in sorted(weeks_to_pages.items()) for pick_grid in pages]
+        if self.parse_processes <= 1 or len(jobs) < max(2, MIN_PAGES_FOR_PROCESSES):
+            self._parse_pages(weeks_to_pages)
+            return
+
+        weeks = [week for week, _ in jobs]
+        pick_grids = [pick_grid for _, pick_grid in jobs]
+        chunksize = max(1, len(jobs) // (self.parse_processes * 4))
+        with tracer.span("parse", pages=len(jobs), processes=self.parse_processes):
+            try:
+                executor = get_parse_pool(self.parse_processes)
+                results = list(executor.map(parse_records, weeks, pick_grids, chunksize=chunksize))
+            except BrokenProcessPool as e:
+                logger.error(f"Parse process pool failed ({e}), parsing {len(jobs)} page(s) in this process")
+                shutdown_parse_pool()
+                self._parse_pages(weeks_to_pages)
+                return
+            for (week, pick_grid), result in zip(jobs, results):
+                tracer.incr("bytes_parsed", len(pick_grid))
+                if result is None:
+                    self._parse_page(week, pick_grid)
+                else:
+                    tracer.incr("rows", len(result[1]))
+                    self._merge_records(*result)
+
+    def _merge_records(self, names, records):
+        with self.teams_lock:
+            for name in names:
+                if name not in self.teams:
+                    self.teams[name] = Team(name, "owner")
+            for name, week, game_index, team_picked, outcome in records:
+                self.teams[name].add_weekly_pick(week, Pick(team_picked, Outcome(outcome), game_index))
+
+    def _group_url(self):
+        return f"https://fantasy.espn.com/games/nfl-pigskin-pickem-2025/group?id={self.group_id}"
+
     def _navigate_to_group_picks(self):
         """
         Navigates to the group picks page.
         """
-        url = f"https://fantasy.espn.com/games/nfl-pigskin-pickem-2025/group?id={self.group_id}"
+        url = self._group_url()
         self.browser.visit(url)
         
         # Debug: Print all text on the page to see what's available
@@ -88,14 +535,16 @@ class PickEmClient:
 
     def _scrape_all_weeks(self, week=None):
         """
-        Scrapes the pick data for all available weeks.
-        If a week is provided, only that week will be scraped.
+        Scrapes the pick grid HTML for all available weeks and streams every
+        page to the parsers. If a week is provided, only that week will be scraped.
         Uses parallel processing for better performance.
         Handles both cases: with dropdown (multiple weeks) and without (first week only).
+        Returns (weeks loaded from snapshots, weeks scraped completely).
         """
         # First, check if there's a week dropdown
         week_options = self._get_week_options()
-        weeks_to_soups = {w: [] for w in range(19)}
+        loaded_weeks = []
+        scraped_weeks = []
         
         if not week_options:
             # No dropdown found - this is likely the first week scenario
@@ -111,139 +560,430 @@ class PickEmClient:
                 logger.info("GroupPickGrid table found on current page")
             except TimeoutException:
                 logger.error("No GroupPickGrid table found on current page")
-                return weeks_to_soups
+                return loaded_weeks, scraped_weeks
             
             # If a specific week was requested and it's not week 1, return empty
             if week is not None and week != 1:
                 logger.info(f"Week {week} was requested but only week 1 is available.")
-                return weeks_to_soups
+                return loaded_weeks, scraped_weeks
             
             # Scrape the current page as week 1
+            if self._load_snapshot_weeks([1]):
+                return [1], scraped_weeks
+
             try:
-                pick_grids = self._scrape_pages_for_week(1)
-                soups = []
-                for pick_grid in pick_grids:
-                    soups.append(BeautifulSoup(pick_grid, "html.parser"))
-                weeks_to_soups[1] = soups
-                logger.info(f"Successfully scraped week 1 with {len(soups)} page(s)")
+                num_pages = self._scrape_pages_for_week(1)
+                logger.info(f"Successfully scraped week 1 with {num_pages} page(s)")
             except Exception as e:
                 logger.error(f"Failed to scrape week 1: {e}")
+            missing = self._missing_ranges(1)
+            if missing:
+                self.incomplete_weeks[1] = missing
+                self._discard_week(1)
+            else:
+                scraped_weeks.append(1)
             
-            return weeks_to_soups
+            return loaded_weeks, scraped_weeks
         
         # Dropdown found - process normally
-        available_weeks = []
+        available_weeks = self._available_weeks(
+            [(week_option.text, week_option.value) for week_option in week_options], week
+        )
+        loaded_weeks, weeks_to_scrape = self._plan_weeks(available_weeks)
+        if not weeks_to_scrape:
+            return loaded_weeks, scraped_weeks
+
+        # Use parallel processing to scrape weeks, one warmed pooled browser per worker.
+        # The pool holds as many sessions as the concurrency controller allows; there
+        # is a thread for every session it could grow to. With fewer weeks than that,
+        # each week's pages are split across sessions.
+        max_sessions = self.concurrency.max_limit
+        sessions_per_week = max(1, max_sessions // len(weeks_to_scrape))
+        logger.info(f"Scraping with {self.concurrency.limit} browser session(s), up to {max_sessions}")
         
-        for week_option in week_options:
-            week_num_text = week_option.text
+        with BrowserPool(
+            self.concurrency.limit, self._warm_up_session, self.max_pages_per_session, self.browser_profile
+        ) as self.browser_pool, ThreadPoolExecutor(max_workers=max_sessions) as executor:
+            self.concurrency.on_change = self.browser_pool.resize
+            pending = {}
+            open_tasks = Counter()
+
+            def submit(week_num, week_value, page_range, delay=0):
+                if page_range is None:
+                    task = executor.submit(
+                        self._scrape_single_week_parallel, week_num, week_value, sessions_per_week
+                    )
+                else:
+                    task = executor.submit(
+                        self._scrape_week_range_parallel, week_num, week_value, *page_range, delay
+                    )
+                pending[task] = (week_num, week_value, page_range)
+                open_tasks[week_num] += 1
+
+            # Submit all week scraping tasks. A fresh week task captures the first range
+            # of its pages and hands back the ranges left for other sessions; a week
+            # resumed from a checkpoint only needs its missing pages.
+            for week_num, week_value in weeks_to_scrape:
+                ranges = self._initial_ranges(week_num)
+                if ranges is None:
+                    submit(week_num, week_value, None)
+                elif not ranges:
+                    scraped_weeks.append(week_num)
+                for page_range in ranges or []:
+                    submit(week_num, week_value, page_range)
+            
+            # Collect results as they complete; once a week's tasks are all done,
+            # retry whatever pages it is still missing
+            while pending:
+                done, _ = wait_futures(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    week_num, week_value, page_range = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to scrape week {week_num}: {e}")
+                        result = None
+                    if page_range is None:
+                        for extra_range in result or []:
+                            submit(week_num, week_value, extra_range)
+                    
+                    open_tasks[week_num] -= 1
+                    if open_tasks[week_num]:
+                        continue
+                    retry = self._plan_retry(week_num)
+                    if retry:
+                        delay, ranges = retry
+                        for retry_range in ranges:
+                            submit(week_num, week_value, retry_range, delay)
+                    elif week_num not in self.incomplete_weeks:
+                        scraped_weeks.append(week_num)
+            self.concurrency.on_change = None
+        
+        tracer.incr("concurrency_changes", len(self.concurrency.changes))
+        logger.info(
+            f"Finished at {self.concurrency.limit} browser session(s) after "
+            f"{len(self.concurrency.changes)} concurrency change(s)"
+        )
+        return loaded_weeks, scraped_weeks
+
+    @staticmethod
+    def _available_weeks(week_options, week=None):
+        """
+        Turns (text, value) pairs of the week dropdown into (week number, value)
+        pairs, keeping only the requested week if one is given.
+        """
+        available_weeks = []
+        for week_num_text, week_value in week_options:
             try:
                 week_num = int(week_num_text.lower().split("week ")[-1])
                 if week is None or week_num == week:
-                    available_weeks.append((week_num, week_option.value))
+                    available_weeks.append((week_num, week_value))
             except (ValueError, IndexError):
                 logger.error(f"Could not parse week number from: {week_num_text}")
                 continue
-        
-        logger.info(f"Found {len(available_weeks)} weeks to scrape: {[w[0] for w in available_weeks]}")
-        
-        # Use parallel processing to scrape weeks
-        max_workers = min(4, len(available_weeks))  # Limit concurrent browsers
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all week scraping tasks
-            future_to_week = {
-                executor.submit(self._scrape_single_week_parallel, week_num, week_value): week_num
-                for week_num, week_value in available_weeks
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_week):
-                week_num = future_to_week[future]
-                try:
-                    week_soups = future.result()
-                    weeks_to_soups[week_num] = week_soups
-                    logger.info(f"Completed scraping week {week_num}")
-                except Exception as e:
-                    logger.error(f"Failed to scrape week {week_num}: {e}")
-        
-        return weeks_to_soups
+        return available_weeks
+
+    def _plan_weeks(self, available_weeks):
+        """
+        Serves what it can from the snapshot store. Returns (weeks loaded from
+        snapshots, [(week number, value), ...] still to scrape).
+        """
+        # Final weeks never change, so serve them from the snapshot store
+        loaded_weeks = self._load_snapshot_weeks([week_num for week_num, _ in available_weeks])
+        weeks_to_scrape = [
+            (week_num, week_value)
+            for week_num, week_value in available_weeks
+            if week_num not in loaded_weeks
+        ]
+        logger.info(f"Found {len(weeks_to_scrape)} weeks to scrape: {[w[0] for w in weeks_to_scrape]}")
+        self._resume_checkpoints([week_num for week_num, _ in weeks_to_scrape])
+        return loaded_weeks, weeks_to_scrape
+
+    def _resume_checkpoints(self, week_nums):
+        """
+        Feeds the pages checkpointed by an earlier, unfinished run of each week
+        to the parsers, so only the pages it missed are scraped.
+        """
+        if not self.snapshot_store:
+            return
+        for week_num in week_nums:
+            pages, last_page = self.snapshot_store.load_checkpoint(week_num, self.checkpoint_ttl)
+            if last_page is not None:
+                self.last_pages[week_num] = last_page
+            for page_num, pick_grid in sorted(pages.items()):
+                self._submit_page(week_num, page_num, pick_grid, save=False)
 
-    def _scrape_single_week_parallel(self, week_num, week_value):
+    def _warm_up_session(self, browser):
         """
-        Scrapes a single week using its own browser instance.
-        This method is designed to be run in parallel.
+        Brings a freshly launched pooled browser to the group pick grid.
+        """
+        with tracer.span("navigate", group_id=self.group_id, pooled=True):
+            try:
+                browser.visit(self._group_url())
+                group_picks_button = browser.find_by_text("Group Picks", wait_time=10).first
+                browser.execute_script("arguments[0].click();", group_picks_button._element)
+                WebDriverWait(browser.driver, 20).until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//*[contains(@class, 'GroupPickGrid-table')]")
+                    )
+                )
+            except (TimeoutException, ElementDoesNotExist):
+                if not self._check_throttled(browser):
+                    self.concurrency.record_failure("navigation to the group pick grid timed out")
+                raise
+
+    def _check_throttled(self, browser):
+        """
+        Called when an expected grid is missing: if the page says we are being
+        rate limited, backs off and returns True.
+        """
+        try:
+            text = browser.execute_script(PAGE_TEXT_JS) or ""
+        except Exception:
+            return False
+        match = THROTTLE_PATTERN.search(text)
+        if not match:
+            return False
+        self.concurrency.record_failure(f"site is throttling us ({match.group(0)!r} on the page)")
+        return True
+
+    def _scrape_single_week_parallel(self, week_num, week_value, sessions=1):
+        """
+        Scrapes a single week using a browser session checked out of the pool.
+        This method is designed to be run in parallel. If the grid has numbered
+        pagination and sessions > 1, only the first range of pages is captured
+        here and the other ranges are returned for other sessions to capture.
+
+        Returns the [(first page, last page or None), ...] ranges left to
+        capture. Pages the week is still missing afterwards are retried by
+        _scrape_all_weeks.
         """
         logger.info(f"Starting parallel scrape for week {week_num}")
         
         try:
-            with Browser("chrome", headless=True) as browser:  # Use headless for parallel execution
-                wait = WebDriverWait(browser.driver, 20)
-                
-                # Navigate to the group picks page
-                url = f"https://fantasy.espn.com/games/nfl-pigskin-pickem-2025/group?id={self.group_id}"
-                browser.visit(url)
+            with self.browser_pool.session() as session:
+                browser, wait = session.browser, session.wait
                 
-                # Click Group Picks button
-                try:
-                    group_picks_button = browser.find_by_text("Group Picks", wait_time=10).first
-                    browser.execute_script("arguments[0].click();", group_picks_button._element)
-                except Exception as e:
-                    logger.error(f"Failed to click 'Group Picks' for week {week_num}: {e}")
-                    return []
-                
-                # Wait for dropdown and select the specific week (if dropdown exists)
-                try:
-                    # Use shorter timeout to check for dropdown
-                    short_wait = WebDriverWait(browser.driver, 5)
-                    short_wait.until(
-                        EC.presence_of_all_elements_located(
-                            (By.XPATH, "//*[contains(@class, 'dropdown__select')]")
-                        )
-                    )
-                    weeks_dropdown = browser.find_by_xpath(
-                        "//*[contains(@class, 'dropdown__select')]"
-                    )
-                    weeks_dropdown.select(week_value)
-                    logger.info(f"Selected week {week_num} from dropdown")
-                    
-                    # Wait for table to reload
-                    wait.until(
-                        EC.presence_of_element_located(
-                            (By.XPATH, "//*[contains(@class, 'GroupPickGrid-table')]")
-                        )
-                    )
-                except TimeoutException:
-                    # No dropdown found - this is expected for first week
-                    logger.info(f"No dropdown found for week {week_num} - using current page")
-                    # Just wait for the table to be present
-                    try:
-                        wait.until(
-                            EC.presence_of_element_located(
-                                (By.XPATH, "//*[contains(@class, 'GroupPickGrid-table')]")
-                            )
-                        )
-                    except TimeoutException:
-                        logger.error(f"No GroupPickGrid table found for week {week_num}")
+                with tracer.span("week-select", week=week_num):
+                    if not self._select_week_in_session(browser, wait, week_num, week_value):
                         return []
-                except Exception as e:
-                    logger.error(f"Failed to select week {week_num}: {e}")
-                    return []
-                
-                # Scrape all pages for this week
-                pick_grids = self._scrape_pages_for_week_parallel(week_num, browser, wait)
                 
-                # Convert to BeautifulSoup objects
-                soups = []
-                for pick_grid in pick_grids:
-                    soups.append(BeautifulSoup(pick_grid, "html.parser"))
+                ranges = self._split_pages(browser, sessions)
+                if ranges:
+                    first_page, last_page = ranges[0]
+                    logger.info(f"Splitting week {week_num} across {len(ranges)} sessions: {ranges}")
+                    num_pages = self._scrape_page_range(week_num, browser, wait, first_page, last_page)
+                    ranges = ranges[1:]
+                else:
+                    # Scrape all pages for this week
+                    num_pages = self._scrape_pages_for_week_parallel(week_num, browser, wait)
+                session.pages_served += num_pages
                 
-                logger.info(f"Successfully scraped week {week_num} with {len(soups)} page(s)")
-                return soups
+                logger.info(f"Successfully scraped week {week_num} with {num_pages} page(s)")
+                return ranges or []
                 
         except Exception as e:
             logger.error(f"Error scraping week {week_num}: {e}")
             return []
 
+    def _scrape_week_range_parallel(self, week_num, week_value, first_page, last_page, delay=0):
+        """
+        Captures one range of a week's pages in its own pooled session, jumping
+        straight to first_page, after waiting delay seconds (retries back off).
+        Returns the number of pages captured.
+        """
+        if delay:
+            time.sleep(delay)
+        with self.browser_pool.session() as session:
+            browser, wait = session.browser, session.wait
+            with tracer.span("week-select", week=week_num):
+                if not self._select_week_in_session(browser, wait, week_num, week_value):
+                    return 0
+            num_pages = self._scrape_page_range(week_num, browser, wait, first_page, last_page)
+            session.pages_served += num_pages
+            return num_pages
+
+    def _split_pages(self, browser, sessions):
+        """
+        Splits the current week's pages into contiguous ranges, one per session,
+        from the numbered pagination. The last range is open-ended (None) so any
+        pages past the highest number shown are still captured. Returns None if
+        the week should be scraped by one session.
+        """
+        if sessions <= 1:
+            return None
+        return self._split_page_state(browser.execute_script(PAGE_JUMP_JS, None), sessions)
+
+    @staticmethod
+    def _split_page_state(state, sessions):
+        """
+        Splits pages 1..state["last"] from a PAGE_JUMP_JS result into ranges.
+        """
+        if not state or state["last"] <= 1:
+            return None
+        last = state["last"]
+        chunks = min(sessions, math.ceil(last / MIN_PAGES_PER_CHUNK))
+        if chunks <= 1:
+            return None
+        size = math.ceil(last / chunks)
+        ranges = [(start, min(start + size - 1, last)) for start in range(1, last + 1, size)]
+        ranges[-1] = (ranges[-1][0], None)
+        return ranges
+
+    def _scrape_page_range(self, week_num, browser, wait, first_page, last_page):
+        """
+        Captures pages first_page..last_page of the selected week, or through
+        the final page if last_page is None. Returns the number of pages captured.
+        """
+        if not self._go_to_page(browser, first_page) and not self._step_to_page(browser, first_page):
+            raise RuntimeError(f"Could not reach page {first_page} of week {week_num}")
+        num_pages = 0
+        page_num = first_page
+        while True:
+            with tracer.span("grid-capture", week=week_num, page=page_num):
+                pick_grid_html = self._get_pick_grid_html_parallel(week_num, page_num, browser, wait)
+            if pick_grid_html:
+                num_pages += 1
+                self._submit_page(week_num, page_num, pick_grid_html)
+            else:
+                logger.warning(f"No HTML captured for Week {week_num}, Page {page_num} (parallel)")
+            if last_page is not None and page_num >= last_page:
+                break
+            if not self._go_to_next_page_parallel(browser):
+                self._mark_last_page(week_num, page_num)
+                break
+            page_num += 1
+            if page_num > 50:  # Safety check
+                logger.warning(f"Reached page limit of 50 for Week {week_num}, stopping pagination (parallel)")
+                break
+        logger.info(f"Captured pages {first_page}-{page_num} of week {week_num} (parallel)")
+        return num_pages
+
+    def _go_to_page(self, browser, page_num):
+        """
+        Jumps to a page by clicking numbered pagination buttons. Returns False
+        if the grid has no numbered pagination or the page cannot be reached.
+        """
+        with tracer.span("paginate", direction="jump", page=page_num):
+            for _ in range(MAX_PAGE_JUMPS):
+                state = browser.execute_script(PAGE_JUMP_JS, page_num)
+                if not state:
+                    return False
+                if state["current"] == page_num:
+                    return True
+                if state["clicked"] is None:
+                    logger.warning(f"No page button gets closer to page {page_num} than page {state['current']}")
+                    return False
+                self._wait_for_grid_change(browser, state["fingerprint"], f"page {state['clicked']}")
+            return False
+
+    def _step_to_page(self, browser, page_num):
+        """
+        Reaches a page without numbered pagination: back to the first page with
+        'prev', then 'next' page_num - 1 times, waiting for the grid to change
+        after each click. Returns False if the grid runs out of pages first.
+        """
+        self._go_to_first_page_parallel(browser)
+        for clicks in range(page_num - 1):
+            if not self._go_to_next_page_parallel(browser):
+                logger.warning(f"Ran out of pages at page {clicks + 1} on the way to page {page_num}")
+                return False
+        return True
+
+    def _select_week_in_session(self, browser, wait, week_num, week_value):
+        """
+        Selects a week from the dropdown of a pooled session (if the dropdown
+        exists) and waits for its pick grid. Returns False if there is no grid.
+        """
+        try:
+            # Use shorter timeout to check for dropdown
+            short_wait = WebDriverWait(browser.driver, 5)
+            short_wait.until(
+                EC.presence_of_all_elements_located(
+                    (By.XPATH, "//*[contains(@class, 'dropdown__select')]")
+                )
+            )
+            weeks_dropdown = browser.find_by_xpath(
+                "//*[contains(@class, 'dropdown__select')]"
+            )
+            weeks_dropdown.select(week_value)
+            logger.info(f"Selected week {week_num} from dropdown")
+            
+            # Wait for table to reload
+            wait.until(
+                EC.presence_of_element_located(
+                    (By.XPATH, "//*[contains(@class, 'GroupPickGrid-table')]")
+                )
+            )
+        except TimeoutException:
+            # No dropdown found - this is expected for first week
+            logger.info(f"No dropdown found for week {week_num} - using current page")
+            # Just wait for the table to be present
+            try:
+                wait.until(
+                    EC.presence_of_element_located(
+                        (By.XPATH, "//*[contains(@class, 'GroupPickGrid-table')]")
+                    )
+                )
+            except TimeoutException:
+                logger.error(f"No GroupPickGrid table found for week {week_num}")
+                self._check_throttled(browser)
+                return False
+        except Exception as e:
+            logger.error(f"Failed to select week {week_num}: {e}")
+            return False
+        return True
+
+    def _discard_week(self, week_num):
+        if self.snapshot_store:
+            self.snapshot_store.discard_week(week_num)
+
+    def _load_snapshot(self, week_num):
+        """
+        Returns the pages of a week that can be served from the snapshot store,
+        or None if the week still has to be scraped. Incremental runs reuse every
+        week the week state records as settled, so only weeks with undecided
+        picks and weeks it has never seen are scraped; otherwise only weeks whose
+        snapshot is marked final (see _is_week_final) are reused.
+        """
+        if not self.snapshot_store:
+            return None
+        if self.week_state:
+            reusable = self.week_state.is_settled(week_num)
+        else:
+            reusable = self.snapshot_store.is_final(week_num)
+        if not reusable:
+            return None
+        pick_grids = self.snapshot_store.load_week(week_num)
+        if not pick_grids:
+            return None
+        logger.info(f"Loaded settled week {week_num} from snapshot ({len(pick_grids)} page(s))")
+        return pick_grids
+
+    def _is_week_final(self, week_num):
+        """
+        A week is final once every parsed pick is correct, incorrect, a push or
+        a tie. WeekState.is_settled applies the same rule to its stored counts.
+        """
+        decided = 0
+        for team in self.get_teams():
+            for pick in team.get_weekly_picks(week_num):
+                if not (pick.is_correct() or pick.is_incorrect() or pick.is_push() or pick.is_tie(week_num)):
+                    return False
+                decided += 1
+        return decided > 0
+
+    def _update_week_state(self, weeks):
+        """
+        Records the pick outcomes of every week that was fully parsed this run.
+        """
+        if not self.week_state:
+            return
+        teams = self.get_teams()
+        for week_num in weeks:
+            self.week_state.update_from_teams(teams, week_num)
+        self.week_state.save()
+
     def _get_week_options(self):
         """
         Waits for and returns the week dropdown options.
@@ -294,18 +1034,21 @@ class PickEmClient:
 
     def _scrape_pages_for_week(self, week_num):
         """
-        Scrapes all pages for a given week.
+        Scrapes all pages for a given week, handing each to the parsers as it is
+        captured. Returns the number of pages captured.
         """
-        pick_grids = []
+        num_pages = 0
         logger.info(f"Starting pagination for Week {week_num}")
         self._go_to_first_page()
 
         page_num = 1
         while True:
             logger.info(f"Processing Week {week_num}, Page {page_num}")
-            pick_grid_html = self._get_pick_grid_html(week_num, page_num)
+            with tracer.span("grid-capture", week=week_num, page=page_num):
+                pick_grid_html = self._get_pick_grid_html(week_num, page_num)
             if pick_grid_html:
-                pick_grids.append(pick_grid_html)
+                num_pages += 1
+                self._submit_page(week_num, page_num, pick_grid_html)
                 logger.info(f"Successfully captured HTML for Week {week_num}, Page {page_num}")
             else:
                 logger.warning(f"No HTML captured for Week {week_num}, Page {page_num}")
@@ -314,6 +1057,7 @@ class PickEmClient:
             logger.info(f"Attempting to navigate to next page from page {page_num}")
             if not self._go_to_next_page():
                 logger.info(f"No more pages available for Week {week_num}. Total pages processed: {page_num}")
+                self._mark_last_page(week_num, page_num)
                 break
             page_num += 1
             
@@ -322,24 +1066,26 @@ class PickEmClient:
                 logger.warning(f"Reached page limit of 50 for Week {week_num}, stopping pagination")
                 break
 
-        logger.info(f"Completed pagination for Week {week_num}. Total grids collected: {len(pick_grids)}")
-        return pick_grids
+        logger.info(f"Completed pagination for Week {week_num}. Total grids collected: {num_pages}")
+        return num_pages
 
     def _scrape_pages_for_week_parallel(self, week_num, browser, wait):
         """
         Scrapes all pages for a given week using the provided browser instance.
         This is the parallel version of _scrape_pages_for_week.
         """
-        pick_grids = []
+        num_pages = 0
         logger.info(f"Starting pagination for Week {week_num} (parallel)")
         self._go_to_first_page_parallel(browser)
 
         page_num = 1
         while True:
             logger.info(f"Processing Week {week_num}, Page {page_num} (parallel)")
-            pick_grid_html = self._get_pick_grid_html_parallel(week_num, page_num, browser, wait)
+            with tracer.span("grid-capture", week=week_num, page=page_num):
+                pick_grid_html = self._get_pick_grid_html_parallel(week_num, page_num, browser, wait)
             if pick_grid_html:
-                pick_grids.append(pick_grid_html)
+                num_pages += 1
+                self._submit_page(week_num, page_num, pick_grid_html)
                 logger.info(f"Successfully captured HTML for Week {week_num}, Page {page_num} (parallel)")
             else:
                 logger.warning(f"No HTML captured for Week {week_num}, Page {page_num} (parallel)")
@@ -347,6 +1093,7 @@ class PickEmClient:
             logger.info(f"Attempting to navigate to next page from page {page_num} (parallel)")
             if not self._go_to_next_page_parallel(browser):
                 logger.info(f"No more pages available for Week {week_num}. Total pages processed: {page_num} (parallel)")
+                self._mark_last_page(week_num, page_num)
                 break
             page_num += 1
             
@@ -354,16 +1101,20 @@ class PickEmClient:
                 logger.warning(f"Reached page limit of 50 for Week {week_num}, stopping pagination (parallel)")
                 break
 
-        logger.info(f"Completed pagination for Week {week_num}. Total grids collected: {len(pick_grids)} (parallel)")
-        return pick_grids
+        logger.info(f"Completed pagination for Week {week_num}. Total grids collected: {num_pages} (parallel)")
+        return num_pages
 
     def _get_pick_grid_html(self, week_num, page_num):
         """
-        Waits for the pick grid to be present and returns its HTML.
+        Waits for the pick grid to be present and returns its extracted JSON,
+        or its HTML if extraction is off or fails.
         """
         try:
             pick_grid_xpath = "//*[contains(@class, 'GroupPickGrid-table')]"
             self.wait.until(EC.presence_of_element_located((By.XPATH, pick_grid_xpath)))
+            payload = self._extract_pick_grid(self.browser, week_num, page_num)
+            if payload:
+                return payload
             pick_grid = self.browser.find_by_xpath(pick_grid_xpath).first
             self.browser.execute_script(
                 "arguments[0].scrollIntoView(true);", pick_grid._element
@@ -381,6 +1132,9 @@ class PickEmClient:
         try:
             pick_grid_xpath = "//*[contains(@class, 'GroupPickGrid-table')]"
             wait.until(EC.presence_of_element_located((By.XPATH, pick_grid_xpath)))
+            payload = self._extract_pick_grid(browser, week_num, page_num)
+            if payload:
+                return payload
             pick_grid = browser.find_by_xpath(pick_grid_xpath).first
             browser.execute_script(
                 "arguments[0].scrollIntoView(true);", pick_grid._element
@@ -389,15 +1143,36 @@ class PickEmClient:
             return pick_grid["outerHTML"]
         except (TimeoutException, ElementDoesNotExist):
             logger.error(f"No pick grid found for Week {week_num}, Page {page_num} (parallel)")
+            self._check_throttled(browser)
             return None
 
+    def _extract_pick_grid(self, browser, week_num, page_num):
+        """
+        Reads the pick grid in the browser with one script call. Returns the
+        JSON payload, or None to fall back to capturing outerHTML.
+        """
+        if self.extraction != "json":
+            return None
+        try:
+            payload = browser.execute_script(GRID_EXTRACT_JS)
+        except Exception as e:
+            logger.warning(f"Grid extraction failed for Week {week_num}, Page {page_num}: {e}")
+            return None
+        if not payload:
+            logger.warning(f"Grid extraction found no entries for Week {week_num}, Page {page_num}, capturing HTML instead")
+            return None
+        return payload
+
     def _go_to_first_page(self):
         """
-        Navigates to the first page of picks for a week.
+        Navigates to the first page of picks for a week: one jump if the grid
+        has numbered pagination, otherwise 'prev' clicks.
         """
         logger.info("Navigating to first page...")
+        if self._go_to_page(self.browser, 1):
+            return
         prev_clicks = 0
-        while self._click_pagination_button("prev"):
+        while self._paginate("prev", self._click_pagination_button):
             prev_clicks += 1
             logger.info(f"Clicked 'prev' button {prev_clicks} times")
             # Safety check to prevent infinite loops
@@ -411,8 +1186,10 @@ class PickEmClient:
         Parallel version of _go_to_first_page.
         """
         logger.info("Navigating to first page (parallel)...")
+        if self._go_to_page(browser, 1):
+            return
         prev_clicks = 0
-        while self._click_pagination_button_parallel("prev", browser):
+        while self._paginate("prev", self._click_pagination_button_parallel, browser):
             prev_clicks += 1
             logger.info(f"Clicked 'prev' button {prev_clicks} times (parallel)")
             if prev_clicks > 20:
@@ -424,13 +1201,19 @@ class PickEmClient:
         """
         Navigates to the next page of picks, if available. Returns False if no next page.
         """
-        return self._click_pagination_button("next")
+        return self._paginate("next", self._click_pagination_button)
 
     def _go_to_next_page_parallel(self, browser):
         """
         Parallel version of _go_to_next_page.
         """
-        return self._click_pagination_button_parallel("next", browser)
+        return self._paginate("next", self._click_pagination_button_parallel, browser)
+
+    def _paginate(self, direction, click, *args):
+        with tracer.span("paginate", direction=direction) as span:
+            moved = click(direction, *args)
+            span.incr("moved" if moved else "no_button")
+            return moved
 
     def _click_pagination_button(self, direction):
         """
@@ -448,28 +1231,30 @@ class PickEmClient:
             f"//button[contains(@aria-label, '{direction}') and not(@disabled)]"
         ]
         
-        logger.info(f"Looking for {direction} pagination button...")
+        logger.debug(f"Looking for {direction} pagination button...")
         
-        # DEBUG: Check what pagination buttons exist
-        all_buttons = self.browser.find_by_xpath("//button")
-        pagination_candidates = []
-        for btn in all_buttons:
-            try:
-                # Look for buttons that might be pagination
-                btn_html = btn['outerHTML'] if 'outerHTML' in btn else str(btn._element)
-                if any(keyword in btn_html.lower() for keyword in ['pagination', 'next', 'prev', 'page']):
-                    pagination_candidates.append(btn_html[:200])  # First 200 chars
-            except:
-                pass
-        
-        logger.info(f"Found {len(pagination_candidates)} potential pagination buttons")
-        for i, candidate in enumerate(pagination_candidates[:3]):  # Show first 3
-            logger.info(f"  Candidate {i+1}: {candidate}")
+        # DEBUG: Check what pagination buttons exist. This is one WebDriver round
+        # trip per button, so only do it when debug logging is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            all_buttons = self.browser.find_by_xpath("//button")
+            pagination_candidates = []
+            for btn in all_buttons:
+                try:
+                    # Look for buttons that might be pagination
+                    btn_html = btn['outerHTML'] if 'outerHTML' in btn else str(btn._element)
+                    if any(keyword in btn_html.lower() for keyword in ['pagination', 'next', 'prev', 'page']):
+                        pagination_candidates.append(btn_html[:200])  # First 200 chars
+                except:
+                    pass
+            
+            logger.debug(f"Found {len(pagination_candidates)} potential pagination buttons")
+            for i, candidate in enumerate(pagination_candidates[:3]):  # Show first 3
+                logger.debug(f"  Candidate {i+1}: {candidate}")
         
         # Try each XPath pattern
         for i, xpath in enumerate(xpaths_to_try):
             try:
-                logger.info(f"Trying XPath pattern {i+1}: {xpath}")
+                logger.debug(f"Trying XPath pattern {i+1}: {xpath}")
                 buttons = self.browser.find_by_xpath(xpath)
                 
                 if buttons:
@@ -480,48 +1265,18 @@ class PickEmClient:
                     self.browser.execute_script(
                         "arguments[0].scrollIntoView(true);", old_button_element
                     )
+                    before = self.browser.execute_script(GRID_FINGERPRINT_JS)
                     
                     # Use JavaScript to click the button
                     self.browser.execute_script("arguments[0].click();", old_button_element)
-                    logger.info(f"Clicked {direction} button, waiting for page refresh...")
-                    
-                    # Wait for the old button element to become stale, or for content to change
-                    try:
-                        # First, wait a moment for the click to register
-                        import time
-                        time.sleep(1)
-                        
-                        # Try waiting for staleness, but with a shorter timeout
-                        try:
-                            WebDriverWait(self.browser.driver, 5).until(EC.staleness_of(old_button_element))
-                            logger.info(f"Page refreshed after clicking {direction} button (staleness detected)")
-                            return True
-                        except TimeoutException:
-                            # If staleness doesn't work, check if the button state changed
-                            try:
-                                current_buttons = self.browser.find_by_xpath(xpath)
-                                if not current_buttons:
-                                    logger.info(f"Page refreshed after clicking {direction} button (button disappeared)")
-                                    return True
-                                
-                                # Check if button became disabled
-                                new_button = current_buttons.first
-                                if 'disabled' in new_button['class'] or new_button.get('disabled'):
-                                    logger.info(f"Page refreshed after clicking {direction} button (button became disabled)")
-                                    return True
-                                    
-                            except:
-                                pass
-                            
-                            logger.warning(f"Page might not have refreshed after clicking {direction} button, but continuing...")
-                            return True  # Continue anyway since we clicked the button
-                            
-                    except Exception as e:
-                        logger.warning(f"Error checking page refresh after clicking {direction} button: {e}")
-                        return True  # Continue anyway since we clicked the button
+                    logger.info(f"Clicked {direction} button, waiting for the grid to change...")
+                    self._wait_for_grid_change(self.browser, before, direction)
+                    return True
                         
+            except PaginationTimeout:
+                raise
             except (ElementDoesNotExist, TimeoutException):
-                logger.info(f"Pattern {i+1} didn't find any {direction} buttons")
+                logger.debug(f"Pattern {i+1} didn't find any {direction} buttons")
                 continue
             except Exception as e:
                 logger.warning(f"Error with pattern {i+1}: {e}")
@@ -561,7 +1316,7 @@ class PickEmClient:
         
         for i, xpath in enumerate(xpaths_to_try):
             try:
-                logger.info(f"Trying XPath pattern {i+1} (parallel): {xpath}")
+                logger.debug(f"Trying XPath pattern {i+1} (parallel): {xpath}")
                 buttons = browser.find_by_xpath(xpath)
                 
                 if buttons:
@@ -572,42 +1327,17 @@ class PickEmClient:
                     browser.execute_script(
                         "arguments[0].scrollIntoView(true);", old_button_element
                     )
+                    before = browser.execute_script(GRID_FINGERPRINT_JS)
                     
                     browser.execute_script("arguments[0].click();", old_button_element)
-                    logger.info(f"Clicked {direction} button, waiting for page refresh (parallel)...")
-                    
-                    try:
-                        import time
-                        time.sleep(1)
-                        
-                        try:
-                            WebDriverWait(browser.driver, 5).until(EC.staleness_of(old_button_element))
-                            logger.info(f"Page refreshed after clicking {direction} button (parallel)")
-                            return True
-                        except TimeoutException:
-                            try:
-                                current_buttons = browser.find_by_xpath(xpath)
-                                if not current_buttons:
-                                    logger.info(f"Page refreshed after clicking {direction} button - button disappeared (parallel)")
-                                    return True
-                                
-                                new_button = current_buttons.first
-                                if 'disabled' in new_button['class'] or new_button.get('disabled'):
-                                    logger.info(f"Page refreshed after clicking {direction} button - button disabled (parallel)")
-                                    return True
-                                    
-                            except:
-                                pass
-                            
-                            logger.warning(f"Page might not have refreshed after clicking {direction} button, continuing (parallel)...")
-                            return True
-                            
-                    except Exception as e:
-                        logger.warning(f"Error checking page refresh after clicking {direction} button (parallel): {e}")
-                        return True
+                    logger.info(f"Clicked {direction} button, waiting for the grid to change (parallel)...")
+                    self._wait_for_grid_change(browser, before, direction)
+                    return True
                         
+            except PaginationTimeout:
+                raise
             except (ElementDoesNotExist, TimeoutException):
-                logger.info(f"Pattern {i+1} didn't find any {direction} buttons (parallel)")
+                logger.debug(f"Pattern {i+1} didn't find any {direction} buttons (parallel)")
                 continue
             except Exception as e:
                 logger.warning(f"Error with pattern {i+1} (parallel): {e}")
@@ -616,17 +1346,80 @@ class PickEmClient:
         logger.info(f"No {direction} button found with any pattern - likely at first/last page (parallel)")
         return False
 
-    def _parse_soups(self, weeks_to_soups):
+    def _wait_for_grid_change(self, browser, before, direction, timeout=10):
         """
-        Parses the collected BeautifulSoup objects to populate team picks.
+        Waits until the pick grid's fingerprint differs from the one taken before
+        a pagination click, and returns how long the transition took. Raises
+        PaginationTimeout instead of assuming the page changed, so a stale page
+        is never captured twice.
         """
-        for week, soups in weeks_to_soups.items():
-            if not soups:
-                continue
-            for soup in soups:
-                tables = soup.find_all("table")
+        def grid_changed(driver):
+            return driver.execute_script(GRID_FINGERPRINT_JS) not in (None, before)
+
+        start = time.monotonic()
+        try:
+            WebDriverWait(browser.driver, timeout, poll_frequency=0.05).until(grid_changed)
+        except TimeoutException:
+            self.concurrency.record_failure(f"pick grid did not change within {timeout}s after clicking {direction}")
+            raise PaginationTimeout(
+                f"Pick grid did not change within {timeout}s after clicking {direction}"
+            )
+        elapsed = time.monotonic() - start
+        self.page_transition_times.append(elapsed)
+        self.concurrency.record_latency(elapsed)
+        logger.info(f"Pick grid changed {elapsed:.3f}s after clicking {direction}")
+        return elapsed
+
+    def _parse_pages(self, weeks_to_pages):
+        """
+        Parses already collected pick grid HTML to populate team picks.
+        """
+        for week, pages in weeks_to_pages.items():
+            for pick_grid in pages:
+                self._parse_page(week, pick_grid)
+
+    def _parse_page(self, week, pick_grid):
+        """
+        Parses one page of pick grid HTML into team picks. Pages go through the
+        single-pass grid parser; a page it cannot make sense of falls back to
+        the BeautifulSoup path. Returns False if the page held no readable
+        entries.
+        """
+        with tracer.span("parse", week=week, bytes=len(pick_grid)):
+            page = parse_grid(pick_grid)
+            if page is None:
+                if is_extracted(pick_grid):
+                    logger.error(f"Unreadable extracted page for week {week}, skipping it")
+                    return False
+                logger.warning(f"Grid parser found no entries for week {week}, falling back to BeautifulSoup")
+                tables = BeautifulSoup(pick_grid, "html.parser").find_all("table")
                 idx_to_name = self._parse_team_names(tables)
                 self._parse_picks(tables, idx_to_name, week)
+                return bool(idx_to_name)
+        tracer.incr("rows", len(page.rows))
+        with self.teams_lock:
+            for name in page.entries.values():
+                if name not in self.teams:
+                    self.teams[name] = Team(name, "owner")
+            for idx, picks in self._page_picks(page):
+                team_name = page.entries.get(idx)
+                if team_name:
+                    for pick in picks:
+                        self.teams[team_name].add_weekly_pick(week, pick)
+        return True
+
+    @staticmethod
+    def _page_picks(page):
+        """
+        Yields (data-idx, picks) for each row of a parsed grid page, skipping
+        cells with no pick, like _parse_picks does.
+        """
+        for idx, cells in page.rows:
+            yield idx, [
+                Pick(cell.team, Outcome.from_flags(cell.correct, cell.incorrect), game_index)
+                for game_index, cell in enumerate(cells)
+                if not cell.no_pick and cell.team is not None
+            ]
 
     def _parse_team_names(self, tables):
         """
@@ -656,14 +1449,14 @@ class PickEmClient:
         """
         Parses the picks for each team.
         """
-        logger.info(f"Parsing picks for week {week}")
-        logger.info(f"Have {len(idx_to_name)} teams in idx_to_name mapping")
+        logger.debug(f"Parsing picks for week {week}")
+        logger.debug(f"Have {len(idx_to_name)} teams in idx_to_name mapping")
         
         for table_idx, table in enumerate(tables):
             if "PICKS" in table.text.upper():
-                logger.info(f"Found picks table {table_idx}")
+                logger.debug(f"Found picks table {table_idx}")
                 rows = table.find_all("tr")
-                logger.info(f"Table has {len(rows)} rows")
+                logger.debug(f"Table has {len(rows)} rows")
                 
                 for row_idx, row in enumerate(rows):
                     if "data-idx" not in row.attrs:
@@ -671,14 +1464,14 @@ class PickEmClient:
                         
                     team_idx = int(row["data-idx"])
                     team_name = idx_to_name.get(team_idx)
-                    logger.info(f"Row {row_idx}: team_idx={team_idx}, team_name={team_name}")
+                    logger.debug(f"Row {row_idx}: team_idx={team_idx}, team_name={team_name}")
                     
                     # Thread-safe access to self.teams
                     with self.teams_lock:
                         if team_name and team_name in self.teams:
                             team = self.teams[team_name]
                             picks = row.find_all("td", {"class": lambda x: x and "GroupPickGrid-column--pick" in x})
-                            logger.info(f"  Found {len(picks)} pick cells for {team_name}")
+                            logger.debug(f"  Found {len(picks)} pick cells for {team_name}")
                             
                             picks_added = 0
                             for pick_idx, pick_cell in enumerate(picks):
@@ -686,14 +1479,14 @@ class PickEmClient:
                                 has_no_pick = "noPick" in pick_classes
                                 has_link = pick_cell.find("a") is not None
                                 has_image = pick_cell.find("img") is not None
-                                logger.info(f"    Pick {pick_idx}: classes={pick_classes}, has_no_pick={has_no_pick}, has_link={has_link}, has_image={has_image}")
+                                logger.debug(f"    Pick {pick_idx}: classes={pick_classes}, has_no_pick={has_no_pick}, has_link={has_link}, has_image={has_image}")
                                 
                                 # Add pick if it's not a "noPick" and has either a link or an image (team logo)
                                 if not has_no_pick and (has_link or has_image):
-                                    team.add_weekly_pick(week, Pick(pick_cell))
+                                    team.add_weekly_pick(week, Pick.from_cell(pick_cell, pick_idx))
                                     picks_added += 1
                                     
-                            logger.info(f"  Added {picks_added} picks for {team_name}")
+                            logger.debug(f"  Added {picks_added} picks for {team_name}")
                         else:
                             if team_name:
                                 logger.warning(f"Team {team_name} not found in self.teams")
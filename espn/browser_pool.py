@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+from threading import Condition
+import logging
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from espn.browser_profile import BrowserProfile
+
+logger = logging.getLogger(__name__)
+
+# How often a checkout waiting on a shared session budget checks it again. The
+# pool's own check-ins wake it at once; other clients' releases are only seen
+# on the next check.
+BUDGET_POLL_INTERVAL = 0.2
+
+
+class BrowserSession:
+    """
+    A pooled browser plus the bookkeeping the pool needs to recycle it.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.wait = WebDriverWait(browser.driver, 20)
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """
+    A fixed number of headless Chrome sessions that have already been warmed up
+    (navigated to the group pick grid). Workers check a session out, use it and
+    hand it back instead of paying for a browser launch and navigation per week.
+
+    Sessions are health-checked on checkout and recycled after serving
+    max_pages_per_session pages to keep browser memory bounded. resize()
+    changes the number of sessions while the pool is in use.
+    """
+
+    def __init__(self, size, warm_up, max_pages_per_session=60, profile=None):
+        self.size = size
+        self.warm_up = warm_up  # Callable taking a fresh splinter Browser
+        self.max_pages_per_session = max_pages_per_session
+        self.profile = profile or BrowserProfile()
+        self._idle = []
+        self._created = 0
+        self._closed = False
+        self._cond = Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def session(self):
+        """
+        Checks out a warmed session for the duration of the with block. A
+        session that raised is discarded rather than returned to the pool.
+        """
+        session = self._checkout()
+        try:
+            yield session
+        except Exception:
+            self._discard(session)
+            raise
+        self._checkin(session)
+
+    def _launch(self):
+        # The caller has already taken this browser's session from the budget
+        browser = self.profile.launch(session_acquired=True)
+        try:
+            self.warm_up(browser)
+        except Exception:
+            self.profile.close(browser)
+            raise
+        logger.info("Launched and warmed up a pooled browser session")
+        return BrowserSession(browser)
+
+    def _checkout(self):
+        """
+        Returns an idle session, or launches one if the pool has room and the
+        session budget a free session. The budget is taken before a launch is
+        reserved, and the wait for it also watches for idle sessions, so a
+        checkout never blocks on the budget while this pool's idle sessions
+        hold it.
+        """
+        while True:
+            session = None
+            first_try = True
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    if self._idle:
+                        session = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        if self.profile.try_acquire_session(first_try):
+                            self._created += 1
+                            break
+                        first_try = False
+                        self._cond.wait(BUDGET_POLL_INTERVAL)
+                    else:
+                        self._cond.wait()
+
+            if session is None:
+                try:
+                    return self._launch()
+                except Exception:
+                    with self._cond:
+                        self._created -= 1
+                        self._cond.notify()
+                    raise
+
+            if self._is_healthy(session):
+                return session
+            logger.warning("Pooled browser session failed its health check, replacing it")
+            self._discard(session)
+
+    def _checkin(self, session):
+        if session.pages_served >= self.max_pages_per_session:
+            logger.info(f"Recycling browser session after {session.pages_served} pages")
+            self._discard(session)
+            return
+        with self._cond:
+            if not self._closed and self._created <= self.size:
+                self._idle.append(session)
+                self._cond.notify()
+                return
+        self._discard(session)
+
+    def _discard(self, session):
+        try:
+            self.profile.close(session.browser)
+        except Exception as e:
+            logger.warning(f"Error closing browser session: {e}")
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    def resize(self, size):
+        """
+        Sets how many sessions may exist at once. Idle sessions over the new
+        size are closed now; busy ones are closed when they are handed back.
+        """
+        with self._cond:
+            self.size = size
+            excess = max(0, self._created - size)
+            surplus, self._idle = self._idle[:excess], self._idle[excess:]
+            self._cond.notify_all()
+        for session in surplus:
+            self._discard(session)
+
+    @staticmethod
+    def _is_healthy(session):
+        try:
+            return session.browser.driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for session in idle:
+            self._discard(session)
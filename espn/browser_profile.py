@@ -0,0 +1,240 @@
+from threading import Lock
+import json
+import logging
+
+from selenium.webdriver.chrome.options import Options
+from splinter import Browser
+
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+# Requests the pick grid never needs: fonts, media, ads and analytics.
+# Patterns use the DevTools Network.setBlockedURLs wildcard syntax.
+DEFAULT_BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.m3u8", "*.webm",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*",
+    "*google-analytics.com*", "*googletagservices.com*", "*amazon-adsystem.com*",
+    "*adnxs.com*", "*omtrdc.net*", "*demdex.net*", "*adobedtm.com*",
+    "*chartbeat.com*", "*chartbeat.net*", "*scorecardresearch.com*", "*facebook.net*",
+    "*nr-data.net*", "*newrelic.com*", "*optimizely.com*", "*branch.io*",
+    "*cdn.cookielaw.org*", "*onetrust.com*",
+]
+
+
+def count_webdriver_calls(driver):
+    """
+    Counts every WebDriver command a driver sends in the tracer's
+    webdriver_calls counter. Every command (scripts, finds, clicks, waits'
+    polls) goes through driver.execute, so it is wrapped once per session.
+    """
+    execute = driver.execute
+
+    def counted_execute(driver_command, params=None):
+        tracer.incr("webdriver_calls")
+        return execute(driver_command, params)
+
+    driver.execute = counted_execute
+    return driver
+
+
+class TrafficReport:
+    """
+    Network totals across every browser session of a run, read from Chrome's
+    performance log when each session closes.
+
+    Blocked requests never start, so their size is unknown; they are counted
+    by number. Cache hits are counted with the bytes they would have cost.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.blocked_requests = 0
+        self.cached_responses = 0
+        self.cached_bytes = 0
+        self.sessions = 0
+        self._lock = Lock()
+
+    def add_log(self, entries):
+        requests = downloaded = blocked = 0
+        cached_ids = set()
+        cached_sizes = {}
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                requests += 1
+            elif method == "Network.loadingFinished":
+                downloaded += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed":
+                if params.get("blockedReason") or "BLOCKED_BY_CLIENT" in params.get("errorText", ""):
+                    blocked += 1
+            elif method == "Network.requestServedFromCache":
+                cached_ids.add(params.get("requestId"))
+            elif method == "Network.responseReceived":
+                response = params.get("response", {})
+                if response.get("fromDiskCache"):
+                    cached_ids.add(params.get("requestId"))
+                headers = {k.lower(): v for k, v in response.get("headers", {}).items()}
+                length = headers.get("content-length", "")
+                if length.isdigit():
+                    cached_sizes[params.get("requestId")] = int(length)
+        cached = len(cached_ids)
+        cached_bytes = sum(cached_sizes.get(request_id, 0) for request_id in cached_ids)
+
+        with self._lock:
+            self.sessions += 1
+            self.requests += requests
+            self.bytes_downloaded += downloaded
+            self.blocked_requests += blocked
+            self.cached_responses += cached
+            self.cached_bytes += cached_bytes
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "sessions": self.sessions,
+                "requests": self.requests,
+                "bytes_downloaded": self.bytes_downloaded,
+                "blocked_requests": self.blocked_requests,
+                "cached_responses": self.cached_responses,
+                "cached_bytes": self.cached_bytes,
+            }
+
+    def summary(self):
+        totals = self.to_dict()
+        return (
+            f"{totals['sessions']} browser session(s): {totals['requests']} requests, "
+            f"{totals['bytes_downloaded'] / 1e6:.2f} MB downloaded; saved "
+            f"{totals['blocked_requests']} blocked requests and {totals['cached_responses']} "
+            f"cache hits ({totals['cached_bytes'] / 1e6:.2f} MB)"
+        )
+
+
+class BrowserProfile:
+    """
+    How headless Chrome is launched for scraping. Every browser the client
+    starts, pooled or not, goes through launch() and close() so the same
+    settings apply everywhere and its traffic ends up in one report.
+
+    blocked_urls: DevTools URL patterns to block (see DEFAULT_BLOCKED_URLS)
+    load_images: team logos are only read for their alt text, so off by default
+    page_load_strategy: "eager" returns once the DOM is ready, before subresources
+    cache_dir: disk cache directory shared by all sessions, or None for Chrome's own
+    session_budget: optional espn.concurrency.SessionBudget shared with other
+        clients; every launch takes one session from it until close()
+    """
+
+    def __init__(
+        self,
+        blocked_urls=DEFAULT_BLOCKED_URLS,
+        load_images=False,
+        page_load_strategy="eager",
+        cache_dir=None,
+        cache_size=200 * 1024 * 1024,
+        headless=True,
+        session_budget=None,
+    ):
+        self.blocked_urls = list(blocked_urls)
+        self.load_images = load_images
+        self.page_load_strategy = page_load_strategy
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        self.headless = headless
+        self.session_budget = session_budget
+        self.traffic = TrafficReport()
+
+    def chrome_arguments(self):
+        """
+        Command-line switches for Chrome, also used when it is launched directly.
+        """
+        arguments = []
+        if not self.load_images:
+            arguments.append("--blink-settings=imagesEnabled=false")
+        if self.cache_dir:
+            arguments.append(f"--disk-cache-dir={self.cache_dir}")
+            arguments.append(f"--disk-cache-size={self.cache_size}")
+        return arguments
+
+    def chrome_options(self):
+        options = Options()
+        options.set_capability("pageLoadStrategy", self.page_load_strategy)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        for argument in self.chrome_arguments():
+            options.add_argument(argument)
+        if not self.load_images:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        return options
+
+    def launch(self, session_acquired=False):
+        """
+        Starts a splinter Browser with this profile applied. session_acquired
+        is True when the caller already took the browser's session from the
+        budget (see try_acquire_session).
+        """
+        if not session_acquired:
+            self.acquire_session()
+        try:
+            browser = Browser("chrome", headless=self.headless, options=self.chrome_options())
+        except Exception:
+            self.release_session()
+            raise
+        count_webdriver_calls(browser.driver)
+        try:
+            self._apply_blocklist(browser)
+        except Exception:
+            self.close(browser)
+            raise
+        return browser
+
+    def acquire_session(self):
+        """
+        Blocks until the session budget, if any, allows one more browser.
+        """
+        if self.session_budget:
+            self.session_budget.acquire()
+
+    def try_acquire_session(self, first_try=True):
+        """
+        Takes a session from the budget, if any, without blocking. Returns
+        whether a browser may be started.
+        """
+        if not self.session_budget:
+            return True
+        return self.session_budget.try_acquire(first_try)
+
+    def release_session(self):
+        if self.session_budget:
+            self.session_budget.release()
+
+    def _apply_blocklist(self, browser):
+        if not self.blocked_urls:
+            return
+        try:
+            browser.driver.execute_cdp_cmd("Network.enable", {})
+            browser.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        except Exception as e:
+            # Older chromedrivers lack the CDP endpoint; scraping still works unblocked
+            logger.warning(f"Could not apply URL blocklist: {e}")
+
+    def close(self, browser):
+        """
+        Records a browser's traffic in the report, then quits it.
+        """
+        try:
+            self.traffic.add_log(browser.driver.get_log("performance"))
+        except Exception as e:
+            logger.warning(f"Could not read browser performance log: {e}")
+        try:
+            browser.quit()
+        finally:
+            self.release_session()
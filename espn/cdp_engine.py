@@ -0,0 +1,610 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+
+import websockets
+
+from espn.concurrency import ConcurrencyController
+from espn.grid_parser import GRID_EXTRACT_JS
+from espn.PickEmClient import (
+    GRID_FINGERPRINT_JS,
+    MAX_PAGE_JUMPS,
+    PAGE_JUMP_JS,
+    PAGE_TEXT_JS,
+    THROTTLE_PATTERN,
+    PaginationTimeout,
+    PickEmClient,
+)
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+# Tried in order when no binary is given and CHROME_BINARY is not set
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+# Rough memory one more tab of the shared Chrome takes, for the concurrency controller
+TAB_MEMORY_MB = 100
+
+# The scripts below are Selenium-style bodies (they `return` and read
+# `arguments`) so they run the same way through CdpTab.run_script.
+
+GRID_PRESENT_JS = """
+return !!document.querySelector("[class*='GroupPickGrid-table']");
+"""
+
+GRID_HTML_JS = """
+var grid = document.querySelector("[class*='GroupPickGrid-table']");
+return grid ? grid.outerHTML : null;
+"""
+
+# Same element splinter's find_by_text("Group Picks") finds
+CLICK_GROUP_PICKS_JS = """
+var button = document.evaluate('//*[text()="Group Picks"]', document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!button) { return false; }
+button.click();
+return true;
+"""
+
+WEEK_OPTIONS_JS = """
+var select = document.querySelector("[class*='dropdown__select']");
+if (!select || !select.options) { return []; }
+return Array.prototype.map.call(select.options, function (o) { return [o.text, o.value]; });
+"""
+
+# Selects a week through the native value setter so React sees the change.
+# Returns null without a dropdown, "same" if the week is already shown.
+SELECT_WEEK_JS = """
+var select = document.querySelector("[class*='dropdown__select']");
+if (!select) { return null; }
+if (select.value === arguments[0]) { return "same"; }
+var setter = Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, "value").set;
+setter.call(select, arguments[0]);
+select.dispatchEvent(new Event("change", {bubbles: true}));
+return "changed";
+"""
+
+# Clicks the enabled 'next' or 'prev' pagination button (arguments[0]). Returns
+# the grid fingerprint taken before the click, or null if there is no button.
+CLICK_PAGINATION_JS = """
+var fingerprint = (function () {""" + GRID_FINGERPRINT_JS + """})();
+var direction = arguments[0];
+var selectors = ["button[class*='Pagination__Button--" + direction + "']",
+                 "button[class*='" + direction + "']",
+                 "button[aria-label*='" + direction + "' i]"];
+for (var i = 0; i < selectors.length; i++) {
+    var buttons = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < buttons.length; j++) {
+        if (!buttons[j].disabled) {
+            buttons[j].click();
+            return fingerprint;
+        }
+    }
+}
+return null;
+"""
+
+GRID_CHANGED_JS = """
+var now = (function () {""" + GRID_FINGERPRINT_JS + """})();
+return now !== null && now !== arguments[0];
+"""
+
+
+class CdpError(Exception):
+    """
+    Raised when a DevTools command fails or a page script throws.
+    """
+
+
+class CdpBrowser:
+    """
+    One headless Chrome process driven over its DevTools websocket. Tabs are
+    attached as flattened sessions, so every tab shares the one connection
+    and the one event loop.
+    """
+
+    def __init__(self, profile, binary=None, command_timeout=30):
+        self.profile = profile  # espn.browser_profile.BrowserProfile
+        self.binary = binary
+        self.command_timeout = command_timeout
+        self._ids = itertools.count(1)
+        self._pending = {}  # Maps command id to the future awaiting its result
+        self._network_events = []  # Fed to the profile's TrafficReport on close
+        self._process = None
+        self._ws = None
+        self._tasks = []
+        self._user_data_dir = None
+        self._holds_session = False
+
+    def _find_binary(self):
+        binary = self.binary or os.environ.get("CHROME_BINARY")
+        if binary:
+            return binary
+        for name in CHROME_BINARIES:
+            path = shutil.which(name)
+            if path:
+                return path
+        raise CdpError("No Chrome binary found; pass one or set CHROME_BINARY")
+
+    async def start(self):
+        # Chrome counts against the profile's session budget until close()
+        await asyncio.get_running_loop().run_in_executor(None, self.profile.acquire_session)
+        self._holds_session = True
+        try:
+            await self._start()
+        except Exception:
+            await self.close()
+            raise
+
+    async def _start(self):
+        self._user_data_dir = tempfile.mkdtemp(prefix="picks-cdp-")
+        args = [
+            self._find_binary(),
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-gpu",
+            *self.profile.chrome_arguments(),
+        ]
+        if self.profile.headless:
+            args.append("--headless=new")
+        self._process = await asyncio.create_subprocess_exec(
+            *args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        ws_url = await asyncio.wait_for(self._read_ws_url(), self.command_timeout)
+        self._ws = await websockets.connect(ws_url, max_size=None)
+        self._tasks = [
+            asyncio.create_task(self._read_loop()),
+            asyncio.create_task(self._drain_stderr()),
+        ]
+        logger.info(f"Started Chrome with DevTools at {ws_url}")
+
+    async def _read_ws_url(self):
+        marker = "DevTools listening on "
+        while True:
+            line = await self._process.stderr.readline()
+            if not line:
+                raise CdpError("Chrome exited before opening DevTools")
+            line = line.decode(errors="replace").strip()
+            if marker in line:
+                return line.split(marker, 1)[1]
+
+    async def _drain_stderr(self):
+        # Keep Chrome from blocking on a full stderr pipe
+        while await self._process.stderr.readline():
+            pass
+
+    async def _read_loop(self):
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                if "id" not in message:
+                    if message.get("method", "").startswith("Network."):
+                        self._network_events.append(message)
+                    continue
+                future = self._pending.pop(message["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in message:
+                    future.set_exception(CdpError(message["error"].get("message", str(message["error"]))))
+                else:
+                    future.set_result(message.get("result", {}))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("DevTools connection closed"))
+            self._pending.clear()
+
+    async def send(self, method, params=None, session_id=None):
+        """
+        Sends one DevTools command and returns its result.
+        """
+        command_id = next(self._ids)
+        message = {"id": command_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[command_id] = future
+        tracer.incr("cdp_calls")
+        await self._ws.send(json.dumps(message))
+        try:
+            return await asyncio.wait_for(future, self.command_timeout)
+        finally:
+            self._pending.pop(command_id, None)
+
+    async def new_tab(self):
+        target = await self.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        tab = CdpTab(self, target["targetId"], attached["sessionId"])
+        await tab.send("Network.enable")
+        if self.profile.blocked_urls:
+            await tab.send("Network.setBlockedURLs", {"urls": self.profile.blocked_urls})
+        return tab
+
+    async def close(self):
+        try:
+            await self.send("Browser.close")
+        except Exception:
+            pass
+        if self._ws is not None:
+            await self._ws.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._process is not None and self._process.returncode is None:
+            try:
+                await asyncio.wait_for(self._process.wait(), 10)
+            except asyncio.TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+        self.profile.traffic.add_log(
+            {"message": json.dumps({"message": event})} for event in self._network_events
+        )
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+        if self._holds_session:
+            self._holds_session = False
+            self.profile.release_session()
+
+
+class CdpTab:
+    """
+    One tab of a CdpBrowser. Scripts run in the page, and waits are polled
+    with asyncio.sleep so other tabs keep working meanwhile.
+    """
+
+    def __init__(self, browser, target_id, session_id):
+        self.browser = browser
+        self.target_id = target_id
+        self.session_id = session_id
+        self.week = None  # Week currently shown, once selected in this tab
+
+    async def send(self, method, params=None):
+        return await self.browser.send(method, params, session_id=self.session_id)
+
+    async def run_script(self, script, *args):
+        """
+        Runs a Selenium-style script body in the page and returns its value.
+        """
+        expression = f"(function () {{{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send(
+            "Runtime.evaluate", {"expression": expression, "returnByValue": True, "awaitPromise": True}
+        )
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise CdpError(details.get("exception", {}).get("description") or details.get("text"))
+        return result["result"].get("value")
+
+    async def wait_for(self, script, *args, timeout=20, poll=0.05):
+        """
+        Polls a script until it returns something truthy, and returns that.
+        Raises asyncio.TimeoutError after timeout seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            value = await self.run_script(script, *args)
+            if value:
+                return value
+            if loop.time() >= deadline:
+                raise asyncio.TimeoutError(f"Timed out after {timeout}s waiting in tab {self.target_id}")
+            await asyncio.sleep(poll)
+
+    async def close(self):
+        await self.browser.send("Target.closeTarget", {"targetId": self.target_id})
+
+    async def navigate(self, url, timeout=30):
+        await self.send("Page.navigate", {"url": url})
+        await self.wait_for(
+            "return location.href !== 'about:blank' && document.readyState !== 'loading';",
+            timeout=timeout,
+        )
+
+
+class CdpPickEmClient(PickEmClient):
+    """
+    Scrapes the pick grid from many tabs of one headless Chrome, driven over
+    the DevTools protocol from a single asyncio event loop instead of one
+    blocking Selenium browser per thread.
+
+    Same run(week) contract as PickEmClient: pages go through the same
+    snapshot store, parser threads and week state, and the page scripts
+    (fingerprint, page jumps, JSON extraction) are shared with it.
+    """
+
+    def __init__(self, group_id, tabs=8, chrome_binary=None, concurrency=None, **kwargs):
+        # Tabs share one Chrome, so max_sessions (a cap on Chromes) does not bound
+        # them: the controller opens up to tabs tabs, as latency, throttling and
+        # host memory allow
+        kwargs.pop("max_sessions", None)
+        concurrency = concurrency or ConcurrencyController(max_limit=tabs, session_memory_mb=TAB_MEMORY_MB)
+        super().__init__(group_id, concurrency=concurrency, **kwargs)
+        self.tabs = tabs
+        self.chrome_binary = chrome_binary
+
+    def _scrape_with_browser(self, week=None):
+        return asyncio.run(self._scrape_async(week))
+
+    async def _scrape_async(self, week=None):
+        browser = CdpBrowser(self.browser_profile, self.chrome_binary)
+        await browser.start()
+        try:
+            first_tab = await browser.new_tab()
+            await self._open_group_picks(first_tab)
+
+            week_options = await first_tab.run_script(WEEK_OPTIONS_JS)
+            if week_options:
+                available_weeks = self._available_weeks(week_options, week)
+            elif week is None or week == 1:
+                logger.info("No week dropdown found. Scraping current page as week 1.")
+                available_weeks = [(1, None)]
+            else:
+                logger.info(f"Week {week} was requested but only week 1 is available.")
+                return [], []
+
+            loaded_weeks, weeks_to_scrape = self._plan_weeks(available_weeks)
+            if not weeks_to_scrape:
+                return loaded_weeks, []
+            scraped_weeks = await self._scrape_weeks_in_tabs(browser, first_tab, weeks_to_scrape)
+            return loaded_weeks, scraped_weeks
+        finally:
+            await browser.close()
+
+    async def _open_group_picks(self, tab):
+        with tracer.span("navigate", group_id=self.group_id, tab=tab.target_id):
+            try:
+                await tab.navigate(self._group_url())
+                await tab.wait_for(CLICK_GROUP_PICKS_JS, timeout=10)
+                await tab.wait_for(GRID_PRESENT_JS)
+            except asyncio.TimeoutError:
+                if not await self._check_throttled_in_tab(tab):
+                    self.concurrency.record_failure("navigation to the group pick grid timed out (tab)")
+                raise
+
+    async def _check_throttled_in_tab(self, tab):
+        """
+        Tab version of PickEmClient._check_throttled.
+        """
+        try:
+            text = await tab.run_script(PAGE_TEXT_JS) or ""
+        except Exception:
+            return False
+        match = THROTTLE_PATTERN.search(text)
+        if not match:
+            return False
+        self.concurrency.record_failure(f"site is throttling us ({match.group(0)!r} on the page)")
+        return True
+
+    async def _scrape_weeks_in_tabs(self, browser, first_tab, weeks_to_scrape):
+        """
+        Runs week and page-range jobs across up to self.tabs tabs. A week job
+        captures the first range of the week's pages and queues the rest, and a
+        week left with gaps is retried for its missing pages only, as in
+        PickEmClient._scrape_all_weeks. Returns the weeks scraped completely.
+
+        There is a worker for every tab the concurrency controller could grow
+        to, but only the first controller.limit of them take jobs; the others
+        close their tab and wait for the limit to rise.
+        """
+        max_tabs = self.concurrency.max_limit
+        sessions_per_week = max(1, max_tabs // len(weeks_to_scrape))
+        num_tabs = min(max_tabs, len(weeks_to_scrape) * sessions_per_week)
+        logger.info(f"Scraping with {self.concurrency.limit} tab(s), up to {num_tabs}")
+        limit_changed = asyncio.Event()
+        self.concurrency.on_change = lambda limit: limit_changed.set()
+
+        # Jobs are (week, dropdown value, page range or None for the whole week, delay)
+        jobs = asyncio.Queue()
+        open_tasks = Counter()
+        scraped_weeks = []
+
+        def submit(week_num, week_value, page_range, delay=0):
+            jobs.put_nowait((week_num, week_value, page_range, delay))
+            open_tasks[week_num] += 1
+
+        for week_num, week_value in weeks_to_scrape:
+            ranges = self._initial_ranges(week_num)
+            if ranges is None:
+                submit(week_num, week_value, None)
+            elif not ranges:
+                scraped_weeks.append(week_num)
+            for page_range in ranges or []:
+                submit(week_num, week_value, page_range)
+
+        async def work(index, tab):
+            while True:
+                if index >= self.concurrency.limit:
+                    if tab is not None:
+                        await tab.close()
+                        tab = None
+                    while index >= self.concurrency.limit:
+                        await limit_changed.wait()
+                        limit_changed.clear()
+                if tab is None:
+                    try:
+                        tab = await browser.new_tab()
+                        await self._open_group_picks(tab)
+                    except Exception as e:
+                        logger.error(f"Could not open an extra tab: {e}")
+                        return
+                week_num, week_value, page_range, delay = await jobs.get()
+                ranges = []
+                try:
+                    if delay:
+                        await asyncio.sleep(delay)
+                    ranges = await self._run_tab_job(tab, week_num, week_value, page_range, sessions_per_week)
+                except Exception as e:
+                    logger.error(f"Error scraping week {week_num} in a tab: {e}")
+                    tab.week = None
+
+                for extra_range in ranges:
+                    submit(week_num, week_value, extra_range)
+                open_tasks[week_num] -= 1
+                if not open_tasks[week_num]:
+                    retry = self._plan_retry(week_num)
+                    if retry:
+                        delay, ranges = retry
+                        for retry_range in ranges:
+                            submit(week_num, week_value, retry_range, delay)
+                    elif week_num not in self.incomplete_weeks:
+                        scraped_weeks.append(week_num)
+                jobs.task_done()
+
+        workers = [asyncio.create_task(work(0, first_tab))]
+        workers += [asyncio.create_task(work(index, None)) for index in range(1, num_tabs)]
+        try:
+            await jobs.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.concurrency.on_change = None
+
+        tracer.incr("concurrency_changes", len(self.concurrency.changes))
+        logger.info(
+            f"Finished at {self.concurrency.limit} tab(s) after "
+            f"{len(self.concurrency.changes)} concurrency change(s)"
+        )
+        return scraped_weeks
+
+    async def _run_tab_job(self, tab, week_num, week_value, page_range, sessions):
+        """
+        Captures one job's pages in a tab. A whole-week job (page_range None)
+        splits the week first. Returns the page ranges left for other tabs.
+        """
+        if tab.week != week_num:
+            with tracer.span("week-select", week=week_num):
+                await self._select_week_in_tab(tab, week_num, week_value)
+
+        ranges = []
+        if page_range is None:
+            ranges = await self._split_pages_in_tab(tab, sessions) or [(1, None)]
+            if len(ranges) > 1:
+                logger.info(f"Splitting week {week_num} across {len(ranges)} tabs: {ranges}")
+            page_range, ranges = ranges[0], ranges[1:]
+        await self._scrape_range_in_tab(tab, week_num, *page_range)
+        return ranges
+
+    async def _select_week_in_tab(self, tab, week_num, week_value):
+        if week_value is not None:
+            before = await tab.run_script(GRID_FINGERPRINT_JS)
+            selected = await tab.run_script(SELECT_WEEK_JS, week_value)
+            if selected is None:
+                raise CdpError(f"No week dropdown to select week {week_num}")
+            if selected == "changed":
+                await tab.wait_for(GRID_CHANGED_JS, before)
+                logger.info(f"Selected week {week_num} from dropdown")
+        await tab.wait_for(GRID_PRESENT_JS)
+        tab.week = week_num
+
+    async def _split_pages_in_tab(self, tab, sessions):
+        if sessions <= 1:
+            return None
+        state = await tab.run_script(PAGE_JUMP_JS, None)
+        return self._split_page_state(state, sessions)
+
+    async def _scrape_range_in_tab(self, tab, week_num, first_page, last_page):
+        """
+        Captures pages first_page..last_page (or through the final page if
+        last_page is None) of the week shown in a tab.
+        """
+        if not await self._go_to_page_in_tab(tab, first_page) and not await self._step_to_page_in_tab(tab, first_page):
+            raise CdpError(f"Could not reach page {first_page} of week {week_num}")
+        loop = asyncio.get_running_loop()
+        num_pages = 0
+        page_num = first_page
+        while True:
+            with tracer.span("grid-capture", week=week_num, page=page_num):
+                pick_grid = await self._capture_in_tab(tab, week_num, page_num)
+            if pick_grid:
+                num_pages += 1
+                # Blocks while the parser queue is full, so keep it off the event loop
+                await loop.run_in_executor(None, self._submit_page, week_num, page_num, pick_grid)
+            else:
+                logger.warning(f"No pick grid captured for Week {week_num}, Page {page_num} (tab)")
+            if last_page is not None and page_num >= last_page:
+                break
+            if not await self._click_pagination_in_tab(tab, "next"):
+                self._mark_last_page(week_num, page_num)
+                break
+            page_num += 1
+            if page_num > 50:  # Safety check
+                logger.warning(f"Reached page limit of 50 for Week {week_num}, stopping pagination (tab)")
+                break
+        logger.info(f"Captured pages {first_page}-{page_num} of week {week_num} (tab)")
+        return num_pages
+
+    async def _capture_in_tab(self, tab, week_num, page_num):
+        await tab.wait_for(GRID_PRESENT_JS)
+        if self.extraction == "json":
+            payload = await tab.run_script(GRID_EXTRACT_JS)
+            if payload:
+                return payload
+            logger.warning(f"Grid extraction found no entries for Week {week_num}, Page {page_num}, capturing HTML instead")
+        return await tab.run_script(GRID_HTML_JS)
+
+    async def _go_to_page_in_tab(self, tab, page_num):
+        with tracer.span("paginate", direction="jump", page=page_num):
+            for _ in range(MAX_PAGE_JUMPS):
+                state = await tab.run_script(PAGE_JUMP_JS, page_num)
+                if not state:
+                    return False
+                if state["current"] == page_num:
+                    return True
+                if state["clicked"] is None:
+                    return False
+                await self._wait_for_grid_change_in_tab(tab, state["fingerprint"], f"page {state['clicked']}")
+            return False
+
+    async def _step_to_page_in_tab(self, tab, page_num):
+        """
+        Reaches a page without numbered pagination: back to the first page with
+        'prev', then 'next' page_num - 1 times.
+        """
+        await self._rewind_in_tab(tab)
+        for clicks in range(page_num - 1):
+            if not await self._click_pagination_in_tab(tab, "next"):
+                logger.warning(f"Ran out of pages at page {clicks + 1} on the way to page {page_num} (tab)")
+                return False
+        return True
+
+    async def _rewind_in_tab(self, tab):
+        for _ in range(20):
+            if not await self._click_pagination_in_tab(tab, "prev"):
+                return True
+        logger.warning("Clicked 'prev' button too many times, stopping (tab)")
+        return True
+
+    async def _click_pagination_in_tab(self, tab, direction):
+        with tracer.span("paginate", direction=direction) as span:
+            before = await tab.run_script(CLICK_PAGINATION_JS, direction)
+            if before is None:
+                span.incr("no_button")
+                return False
+            await self._wait_for_grid_change_in_tab(tab, before, direction)
+            span.incr("moved")
+            return True
+
+    async def _wait_for_grid_change_in_tab(self, tab, before, direction, timeout=10):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await tab.wait_for(GRID_CHANGED_JS, before, timeout=timeout)
+        except asyncio.TimeoutError:
+            self.concurrency.record_failure(f"pick grid did not change within {timeout}s after clicking {direction} (tab)")
+            raise PaginationTimeout(
+                f"Pick grid did not change within {timeout}s after clicking {direction}"
+            )
+        elapsed = loop.time() - start
+        self.page_transition_times.append(elapsed)
+        self.concurrency.record_latency(elapsed)
+        logger.debug(f"Pick grid changed {elapsed:.3f}s after clicking {direction} (tab)")
@@ -0,0 +1,189 @@
+from collections import deque
+from threading import Condition, Lock
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def available_memory_mb(meminfo_path="/proc/meminfo"):
+    """
+    Returns MemAvailable from /proc/meminfo in MB, or None where it cannot be read.
+    """
+    try:
+        with open(meminfo_path) as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class ConcurrencyController:
+    """
+    Decides how many browser sessions scrape at once, AIMD style: the limit
+    grows by one while page latency and host memory stay healthy, and is
+    halved when latency climbs, navigation times out or the site throttles us.
+    Every change is logged with its reason and kept in `changes`.
+
+    Latency is compared with the best smoothed latency of the recent window,
+    so a site that is simply slower today does not pin the limit at minimum.
+    on_change(limit) is called after each change (the browser pool resizes).
+    """
+
+    def __init__(
+        self,
+        initial=2,
+        min_limit=1,
+        max_limit=None,
+        session_memory_mb=400,
+        memory_reserve_mb=512,
+        increase_every=5,
+        healthy_latency_ratio=1.5,
+        backoff_latency_ratio=3.0,
+        cooldown=5.0,
+        on_change=None,
+    ):
+        self.session_memory_mb = session_memory_mb  # Rough resident size of one headless Chrome
+        self.memory_reserve_mb = memory_reserve_mb  # Kept free for the parsers and the OS
+        self.min_limit = min_limit
+        self.max_limit = max_limit or self.host_limit(session_memory_mb, memory_reserve_mb)
+        self.limit = max(min_limit, min(initial, self.max_limit))
+        self.increase_every = increase_every  # Healthy samples needed before each increase
+        self.healthy_latency_ratio = healthy_latency_ratio
+        self.backoff_latency_ratio = backoff_latency_ratio
+        self.cooldown = cooldown  # Seconds between decreases, so one incident halves once
+        self.on_change = on_change
+        self.latency = None  # Smoothed page transition latency in seconds
+        self.changes = []  # (monotonic time, old limit, new limit, reason)
+        self._recent = deque(maxlen=50)
+        self._healthy = 0
+        self._last_decrease = float("-inf")
+        self._lock = Lock()
+
+    @staticmethod
+    def host_limit(session_memory_mb=400, memory_reserve_mb=512):
+        """
+        Upper bound for this host: two sessions per core (they mostly wait on
+        the network), and only as many as fit in available memory.
+        """
+        limit = 2 * (os.cpu_count() or 1)
+        memory = available_memory_mb()
+        if memory is not None:
+            limit = min(limit, (memory - memory_reserve_mb) // session_memory_mb)
+        return max(1, limit)
+
+    def record_latency(self, seconds):
+        """
+        Feeds one page transition time and adjusts the limit if warranted.
+        """
+        with self._lock:
+            self.latency = seconds if self.latency is None else 0.3 * seconds + 0.7 * self.latency
+            self._recent.append(self.latency)
+            baseline = min(self._recent)
+
+            if self.latency > baseline * self.backoff_latency_ratio:
+                change = self._decrease(
+                    f"page latency {self.latency:.2f}s is over {self.backoff_latency_ratio}x "
+                    f"the recent best {baseline:.2f}s"
+                )
+            elif self.latency <= baseline * self.healthy_latency_ratio:
+                self._healthy += 1
+                change = self._maybe_increase(baseline) if self._healthy >= self.increase_every else None
+            else:
+                self._healthy = 0
+                change = None
+        self._notify(change)
+
+    def record_failure(self, reason):
+        """
+        Backs off after a navigation timeout, throttling or a similar failure.
+        """
+        with self._lock:
+            change = self._decrease(reason)
+        self._notify(change)
+
+    def _maybe_increase(self, baseline):
+        self._healthy = 0
+        if self.limit >= self.max_limit:
+            return None
+        memory = available_memory_mb()
+        if memory is not None and memory < self.memory_reserve_mb + self.session_memory_mb:
+            logger.info(f"Holding concurrency at {self.limit}: only {memory} MB of memory available")
+            return None
+        return self._set(
+            self.limit + 1,
+            f"page latency {self.latency:.2f}s is within {self.healthy_latency_ratio}x the recent best "
+            f"{baseline:.2f}s" + (f" and {memory} MB of memory is available" if memory is not None else ""),
+        )
+
+    def _decrease(self, reason):
+        self._healthy = 0
+        now = time.monotonic()
+        if self.limit <= self.min_limit or now - self._last_decrease < self.cooldown:
+            logger.info(f"Not lowering concurrency below {self.limit}: {reason}")
+            return None
+        self._last_decrease = now
+        return self._set(max(self.min_limit, self.limit // 2), reason)
+
+    def _set(self, limit, reason):
+        old, self.limit = self.limit, limit
+        self.changes.append((time.monotonic(), old, limit, reason))
+        logger.info(f"Concurrency {old} -> {limit}: {reason}")
+        return limit
+
+    def _notify(self, limit):
+        if limit is not None and self.on_change:
+            self.on_change(limit)
+
+
+class SessionBudget:
+    """
+    A cap on browser sessions shared by every client of a run, so several
+    groups scraped at once never start more Chromes than the host can hold.
+    acquire() blocks until a session may start; release() frees it again.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_use = 0
+        self.peak = 0  # Most sessions that were running at once
+        self.waits = 0  # Times a launch had to wait for a free session
+        self._cond = Condition()
+
+    def acquire(self):
+        with self._cond:
+            if self.in_use >= self.limit:
+                self._note_wait()
+            while self.in_use >= self.limit:
+                self._cond.wait()
+            self._take()
+
+    def try_acquire(self, first_try=True):
+        """
+        Takes a session if one is free, without blocking. Returns whether it
+        did. first_try=False for repeated attempts of one caller, so a single
+        wait is counted once.
+        """
+        with self._cond:
+            if self.in_use >= self.limit:
+                if first_try:
+                    self._note_wait()
+                return False
+            self._take()
+            return True
+
+    def _note_wait(self):
+        self.waits += 1
+        logger.info(f"Waiting for one of {self.limit} browser sessions to free up")
+
+    def _take(self):
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+
+    def release(self):
+        with self._cond:
+            self.in_use -= 1
+            self._cond.notify()
@@ -0,0 +1,230 @@
+from collections import namedtuple
+from html.parser import HTMLParser
+import json
+
+from espn.models import Outcome
+
+# One entry's pick for one game, as read from a GroupPickGrid-column--pick cell
+PickCell = namedtuple("PickCell", ["team", "correct", "incorrect", "no_pick", "has_link"])
+
+# One captured pick-grid page: entry names by data-idx, and each row's pick cells
+GridPage = namedtuple("GridPage", ["entries", "rows"])
+
+CORRECT_CLASSES = {"PickCorrect-checkMark", "css-1skkwww"}
+INCORRECT_CLASSES = {"PickIncorrect-crossMark", "css-8wf538"}
+
+# Bit flags of one pick cell in an extracted JSON page
+CORRECT_FLAG = 1
+INCORRECT_FLAG = 2
+NO_PICK_FLAG = 4
+LINK_FLAG = 8
+
+# Reads the pick grid in the browser and returns it as compact JSON, so only
+# names, data-idx, picked teams and result flags cross the WebDriver wire:
+#   {"v": 1, "entries": [[idx, name], ...], "rows": [[idx, [[team, flags], ...]], ...]}
+# Tables are told apart by their text like the HTML parsers do. Returns null
+# when no entries are found, so the caller can fall back to outerHTML.
+GRID_EXTRACT_JS = """
+var grid = document.querySelector("[class*='GroupPickGrid-table']");
+if (!grid) { return null; }
+var correctSel = ".PickCorrect-checkMark, .css-1skkwww";
+var incorrectSel = ".PickIncorrect-crossMark, .css-8wf538";
+var kinds = new Map();
+function kind(table) {
+    if (!kinds.has(table)) {
+        var text = table ? table.textContent.toUpperCase() : "";
+        kinds.set(table, {entries: text.indexOf("GROUP ENTRIES") >= 0, picks: text.indexOf("PICKS") >= 0});
+    }
+    return kinds.get(table);
+}
+var entries = [], rows = [];
+var trs = grid.querySelectorAll("tr[data-idx]");
+for (var i = 0; i < trs.length; i++) {
+    var tr = trs[i], idx = parseInt(tr.getAttribute("data-idx"), 10), k = kind(tr.closest("table"));
+    if (k.entries) {
+        var link = tr.querySelector("td[class*='GroupPickGrid-column--entryName'] a.GroupPickGrid-entryLink");
+        var name = link ? link.textContent.trim() : "";
+        if (name) { entries.push([idx, name]); }
+    }
+    if (k.picks) {
+        var cells = tr.querySelectorAll("td[class*='GroupPickGrid-column--pick']"), picks = [];
+        for (var j = 0; j < cells.length; j++) {
+            var td = cells[j], img = td.querySelector("img"), flags = 0;
+            if (td.querySelector(correctSel)) { flags |= 1; }
+            if (td.querySelector(incorrectSel)) { flags |= 2; }
+            if (td.classList.contains("noPick")) { flags |= 4; }
+            if (td.querySelector("a")) { flags |= 8; }
+            picks.push([img ? img.getAttribute("alt") : null, flags]);
+        }
+        if (picks.length) { rows.push([idx, picks]); }
+    }
+}
+if (!entries.length) { return null; }
+return JSON.stringify({v: 1, entries: entries, rows: rows});
+"""
+
+
+class _GridTokenizer(HTMLParser):
+    """
+    Single-pass tokenizer over pick-grid HTML. Collects entry names and pick
+    cells row by row without building a tree, and classifies each table as
+    the entries table or the picks table by its text, like the soup path.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.entries = {}
+        self.rows = []
+        self._tables = []  # Stack of per-table state for nested tables
+        self._row = None
+        self._in_name_cell = False
+        self._name_chunks = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self._tables.append({"tail": "", "entries": False, "picks": False, "rows": []})
+            return
+        if not self._tables:
+            return
+        attrs = dict(attrs)
+        classes = attrs.get("class") or ""
+
+        if tag == "tr":
+            idx = attrs.get("data-idx")
+            self._row = None if idx is None else [int(idx), None, []]
+        elif self._row is None:
+            return
+        elif tag == "td":
+            if "GroupPickGrid-column--entryName" in classes:
+                self._in_name_cell = True
+            elif "GroupPickGrid-column--pick" in classes:
+                self._cell = {"team": None, "correct": False, "incorrect": False,
+                              "no_pick": "noPick" in classes.split(), "has_link": False}
+        elif tag == "a" and self._cell is None:
+            if self._in_name_cell and self._name_chunks is None \
+                    and "GroupPickGrid-entryLink" in classes.split():
+                self._name_chunks = []
+        elif self._cell is not None:
+            if tag == "a":
+                self._cell["has_link"] = True
+            elif tag == "img" and self._cell["team"] is None:
+                self._cell["team"] = attrs.get("alt")
+            class_set = set(classes.split())
+            if class_set & CORRECT_CLASSES:
+                self._cell["correct"] = True
+            if class_set & INCORRECT_CLASSES:
+                self._cell["incorrect"] = True
+
+    def handle_endtag(self, tag):
+        if not self._tables:
+            return
+        if tag == "a" and self._name_chunks is not None:
+            self._row[1] = "".join(self._name_chunks).strip()
+            self._name_chunks = None
+        elif tag == "td":
+            if self._cell is not None:
+                self._row[2].append(PickCell(**self._cell))
+                self._cell = None
+            self._in_name_cell = False
+        elif tag == "tr":
+            if self._row is not None:
+                self._tables[-1]["rows"].append(self._row)
+            self._row = None
+        elif tag == "table":
+            self._close_table(self._tables.pop())
+
+    def handle_data(self, data):
+        if not self._tables:
+            return
+        if self._name_chunks is not None:
+            self._name_chunks.append(data)
+        # Only keep enough trailing text to spot a marker split across nodes
+        table = self._tables[-1]
+        window = table["tail"] + data.upper()
+        if "GROUP ENTRIES" in window:
+            table["entries"] = True
+        if "PICKS" in window:
+            table["picks"] = True
+        table["tail"] = window[-12:]
+
+    def _close_table(self, table):
+        if self._tables:
+            # Text of a nested table also counts towards its parent
+            parent = self._tables[-1]
+            parent["entries"] |= table["entries"]
+            parent["picks"] |= table["picks"]
+        for idx, name, cells in table["rows"]:
+            if table["entries"] and name:
+                self.entries[idx] = name
+            if table["picks"] and cells:
+                self.rows.append((idx, cells))
+
+
+def is_extracted(page):
+    """
+    True if a captured page is a GRID_EXTRACT_JS payload rather than HTML.
+    """
+    return page.startswith("{")
+
+
+def parse_extracted(payload):
+    """
+    Turns a GRID_EXTRACT_JS payload into a GridPage. Returns None if the
+    payload is unreadable or lists no entries.
+    """
+    try:
+        data = json.loads(payload)
+        entries = {int(idx): name for idx, name in data["entries"]}
+        rows = [
+            (int(idx), [
+                PickCell(team, bool(flags & CORRECT_FLAG), bool(flags & INCORRECT_FLAG),
+                         bool(flags & NO_PICK_FLAG), bool(flags & LINK_FLAG))
+                for team, flags in cells
+            ])
+            for idx, cells in data["rows"]
+        ]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if not entries:
+        return None
+    return GridPage(entries, rows)
+
+
+def parse_grid(html):
+    """
+    Parses one captured pick-grid page into a GridPage. Returns None when no
+    entries table is found, so callers can fall back to the BeautifulSoup path.
+    Pages captured as GRID_EXTRACT_JS payloads are decoded instead of parsed.
+    """
+    if is_extracted(html):
+        return parse_extracted(html)
+    tokenizer = _GridTokenizer()
+    tokenizer.feed(html)
+    tokenizer.close()
+    if not tokenizer.entries:
+        return None
+    return GridPage(tokenizer.entries, tokenizer.rows)
+
+
+def parse_records(week, html):
+    """
+    Parses one page into compact, picklable records for process-pool workers.
+
+    Returns (entry names in page order, [(entry name, week, game index, team,
+    outcome value), ...]), or None when the page needs the BeautifulSoup path.
+    """
+    page = parse_grid(html)
+    if page is None:
+        return None
+    records = []
+    for idx, cells in page.rows:
+        name = page.entries.get(idx)
+        if not name:
+            continue
+        for game_index, cell in enumerate(cells):
+            if cell.no_pick or cell.team is None:
+                continue
+            outcome = Outcome.from_flags(cell.correct, cell.incorrect)
+            records.append((name, week, game_index, cell.team, outcome.value))
+    return list(page.entries.values()), records
@@ -1,62 +1,65 @@
 class Helpers:
+    # Weeks to the teams (abbreviations) whose game ended in a tie
+    WEEK_TIE_MAP = {
+        1: [],  # e.g. ["PHI", "ATL"]
+        2: [],
+        3: [],
+        4: [],
+        5: [],
+        6: [],
+        7: [],
+        8: [],
+        9: [],
+        10: [],
+        11: [],
+        12: [],
+        13: [],
+        14: [],
+        15: [],
+        16: [],
+        17: [],
+        18: [],
+    }
+
+    ABBR_MAP = {
+        "Arizona Cardinals": "ARI",
+        "Atlanta Falcons": "ATL",
+        "Baltimore Ravens": "BAL",
+        "Buffalo Bills": "BUF",
+        "Carolina Panthers": "CAR",
+        "Chicago Bears": "CHI",
+        "Cincinnati Bengals": "CIN",
+        "Cleveland Browns": "CLE",
+        "Dallas Cowboys": "DAL",
+        "Denver Broncos": "DEN",
+        "Detroit Lions": "DET",
+        "Green Bay Packers": "GB",
+        "Houston Texans": "HOU",
+        "Indianapolis Colts": "IND",
+        "Jacksonville Jaguars": "JAC",
+        "Kansas City Chiefs": "KC",
+        "Las Vegas Raiders": "LV",
+        "Los Angeles Chargers": "LAC",
+        "Los Angeles Rams": "LAR",
+        "Miami Dolphins": "MIA",
+        "Minnesota Vikings": "MIN",
+        "New England Patriots": "NE",
+        "New Orleans Saints": "NO",
+        "New York Giants": "NYG",
+        "New York Jets": "NYJ",
+        "Philadelphia Eagles": "PHI",
+        "Pittsburgh Steelers": "PIT",
+        "San Francisco 49ers": "SF",
+        "Seattle Seahawks": "SEA",
+        "Tampa Bay Buccaneers": "TB",
+        "Tennessee Titans": "TEN",
+        "Washington Commanders": "WAS",
+    }
+
     @staticmethod
     def weeks_to_ties(week):
-        week_tie_map = {
-            1: [],  # e.g. ["PHI", "ATL"]
-            2: [],
-            3: [],
-            4: [],
-            5: [],
-            6: [],
-            7: [],
-            8: [],
-            9: [],
-            10: [],
-            11: [],
-            12: [],
-            13: [],
-            14: [],
-            15: [],
-            16: [],
-            17: [],
-            18: [],
-        }
-        return week_tie_map[week]
+        return Helpers.WEEK_TIE_MAP[week]
 
     @staticmethod
     def team_name_to_abbr(team_name):
-        abbr_map = {
-            "Arizona Cardinals": "ARI",
-            "Atlanta Falcons": "ATL",
-            "Baltimore Ravens": "BAL",
-            "Buffalo Bills": "BUF",
-            "Carolina Panthers": "CAR",
-            "Chicago Bears": "CHI",
-            "Cincinnati Bengals": "CIN",
-            "Cleveland Browns": "CLE",
-            "Dallas Cowboys": "DAL",
-            "Denver Broncos": "DEN",
-            "Detroit Lions": "DET",
-            "Green Bay Packers": "GB",
-            "Houston Texans": "HOU",
-            "Indianapolis Colts": "IND",
-            "Jacksonville Jaguars": "JAC",
-            "Kansas City Chiefs": "KC",
-            "Las Vegas Raiders": "LV",
-            "Los Angeles Chargers": "LAC",
-            "Los Angeles Rams": "LAR",
-            "Miami Dolphins": "MIA",
-            "Minnesota Vikings": "MIN",
-            "New England Patriots": "NE",
-            "New Orleans Saints": "NO",
-            "New York Giants": "NYG",
-            "New York Jets": "NYJ",
-            "Philadelphia Eagles": "PHI",
-            "Pittsburgh Steelers": "PIT",
-            "San Francisco 49ers": "SF",
-            "Seattle Seahawks": "SEA",
-            "Tampa Bay Buccaneers": "TB",
-            "Tennessee Titans": "TEN",
-            "Washington Commanders": "WAS",
-        }
-        return abbr_map[team_name]
+        return Helpers.ABBR_MAP[team_name]
@@ -0,0 +1,189 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from espn.models import Outcome, Pick, Team
+
+logger = logging.getLogger(__name__)
+
+CHALLENGE = "nfl-pigskin-pickem-2025"
+DEFAULT_BASE_URL = "https://gambit-api.fantasy.espn.com/apis/v1"
+
+
+class RequestsTransport:
+    """
+    Fetches JSON from the ESPN Pick'em API over a pooled requests.Session.
+
+    Point base_url at a local server serving recorded responses to run the
+    HTTP backend without touching ESPN.
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, pool_size=16, timeout=20, retries=3):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_json(self, path, params=None):
+        response = self.session.get(
+            f"{self.base_url}/{path.lstrip('/')}", params=params, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        self.session.close()
+
+
+class PickEmHttpClient:
+    """
+    Browser-free backend that reads a group's entries and picks from the JSON
+    endpoints the ESPN group page itself calls. Produces the same Team objects
+    as PickEmClient.
+
+    Endpoints used, relative to the transport's base URL:
+      challenges/<challenge>
+          {"propositions": [{"id", "scoringPeriodId",
+                             "possibleOutcomes": [{"id", "name"}]}]}
+      challenges/<challenge>/groups/<group_id>/entries?scoringPeriodId=&offset=&limit=
+          {"total": N, "entries": [{"id", "name",
+              "picks": [{"propositionId",
+                         "outcomesPicked": [{"outcomeId", "result"}]}]}]}
+    where result is CORRECT, INCORRECT, PUSH or UNDECIDED.
+
+    A week that cannot be fetched, or has entries that cannot be read, is
+    recorded in incomplete_weeks like PickEmClient does, instead of being
+    left to score zero. Unreadable entries are skipped one by one.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, group_id, transport=None, max_workers=8):
+        self.group_id = group_id
+        self.transport = transport or RequestsTransport(pool_size=max_workers)
+        self.max_workers = max_workers
+        self.teams = {}  # Maps team name to Team object
+        self.teams_lock = Lock()
+        self.outcome_names = {}  # Maps outcome id to the picked team's name
+        self.game_indexes = {}  # Maps proposition id to its game's index in its week
+        self.incomplete_weeks = {}  # Maps week to why it is incomplete
+
+    def run(self, week=None):
+        """
+        Fetches every requested week concurrently and builds the teams.
+        """
+        challenge = self.transport.get_json(f"challenges/{CHALLENGE}")
+        games_per_week = Counter()
+        for proposition in challenge.get("propositions", []):
+            # Games are numbered in the order the challenge lists each week's propositions
+            week_num = proposition["scoringPeriodId"]
+            self.game_indexes[proposition["id"]] = games_per_week[week_num]
+            games_per_week[week_num] += 1
+            for outcome in proposition.get("possibleOutcomes", []):
+                self.outcome_names[outcome["id"]] = outcome["name"]
+        available_weeks = set(games_per_week)
+
+        weeks = sorted(w for w in available_weeks if week is None or w == week)
+        logger.info(f"Fetching {len(weeks)} week(s) over HTTP: {weeks}")
+        if not weeks:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(weeks))) as executor:
+            future_to_week = {
+                executor.submit(self._fetch_week_entries, week_num): week_num
+                for week_num in weeks
+            }
+            for future in as_completed(future_to_week):
+                week_num = future_to_week[future]
+                try:
+                    entries = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch week {week_num}: {e}")
+                    self.incomplete_weeks[week_num] = f"fetch failed: {e}"
+                    continue
+                skipped = self._add_entries(week_num, entries)
+                if skipped:
+                    self.incomplete_weeks[week_num] = f"{skipped} of {len(entries)} entries unreadable"
+                logger.info(f"Fetched week {week_num} with {len(entries) - skipped} entries")
+
+        for week_num, reason in sorted(self.incomplete_weeks.items()):
+            logger.warning(f"Week {week_num}: incomplete ({reason})")
+
+    def _fetch_week_entries(self, week_num):
+        """
+        Pages through a week's entries. Returns the raw entry dicts.
+        """
+        entries = []
+        offset = 0
+        while True:
+            page = self.transport.get_json(
+                f"challenges/{CHALLENGE}/groups/{self.group_id}/entries",
+                params={"scoringPeriodId": week_num, "offset": offset, "limit": self.PAGE_SIZE},
+            )
+            batch = page.get("entries", [])
+            entries.extend(batch)
+            offset += len(batch)
+            if not batch or offset >= page.get("total", 0):
+                return entries
+
+    def _add_entries(self, week_num, entries):
+        """
+        Adds a week's entries to the teams. An entry that cannot be read is
+        skipped whole and logged. Returns how many were skipped.
+        """
+        skipped = 0
+        for entry in entries:
+            try:
+                name, picks = self._read_entry(entry)
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                logger.error(f"Skipping an unreadable entry in week {week_num}: {e!r} in {str(entry)[:200]}")
+                skipped += 1
+                continue
+            with self.teams_lock:
+                team = self.teams.get(name)
+                if team is None:
+                    team = self.teams[name] = Team(name, "owner")
+                for pick in picks:
+                    team.add_weekly_pick(week_num, pick)
+        return skipped
+
+    def _read_entry(self, entry):
+        """
+        Returns (name, [Pick]) for one raw entry dict, in game order. Each pick
+        keeps the index of its proposition's game, wherever it appears in the
+        entry's own list.
+        """
+        name = entry["name"].strip()
+        picks = []
+        for pick in entry.get("picks", []):
+            game_index = self.game_indexes.get(pick["propositionId"])
+            if game_index is None:
+                logger.warning(f"Unknown proposition {pick['propositionId']} for {name}")
+                continue
+            for outcome in pick.get("outcomesPicked", []):
+                team_picked = self.outcome_names.get(outcome["outcomeId"])
+                if team_picked is None:
+                    logger.warning(f"Unknown outcome {outcome['outcomeId']} for {name}")
+                    continue
+                result = outcome.get("result", "UNDECIDED")
+                picks.append(Pick(team_picked, Outcome.__members__.get(result, Outcome.UNDECIDED), game_index))
+        picks.sort(key=lambda pick: pick.game_index)
+        return name, picks
+
+    def get_teams(self):
+        return list(self.teams.values())
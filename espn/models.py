@@ -1,28 +1,90 @@
+import logging
+from enum import Enum
+
 from espn.helpers import Helpers
 
+logger = logging.getLogger(__name__)
+
+_unknown_team_names = set()  # Team names already warned about, so each is logged once
+
+class Outcome(Enum):
+    UNDECIDED = 0
+    CORRECT = 1
+    INCORRECT = 2
+    PUSH = 3
+
+    @staticmethod
+    def from_flags(correct=False, incorrect=False, push=False):
+        if push:
+            return Outcome.PUSH
+        if correct:
+            return Outcome.CORRECT
+        if incorrect:
+            return Outcome.INCORRECT
+        return Outcome.UNDECIDED
+
+
 class Pick:
-    def __init__(self, pick_td):
-        self.pick = pick_td
-        team_icon = self.pick.find("img")
-        self.team_picked = team_icon["alt"]
+    """
+    One entry's pick for one game. The outcome is resolved once when the pick
+    is created, so no reference to the page it came from is kept. The team's
+    abbreviation is only looked up when a tie check needs it.
+    """
+
+    __slots__ = ("team_picked", "_team_abbr", "game_index", "outcome")
+
+    def __init__(self, team_picked, outcome=Outcome.UNDECIDED, game_index=None):
+        self.team_picked = team_picked
+        self._team_abbr = None
+        self.game_index = game_index
+        self.outcome = outcome
+
+    @property
+    def team_abbr(self):
+        """
+        The picked team's abbreviation. A name missing from Helpers.ABBR_MAP
+        (a renamed or relocated team) falls back to the name itself, which
+        never matches a tie, and is logged once.
+        """
+        if self._team_abbr is None:
+            try:
+                self._team_abbr = Helpers.team_name_to_abbr(self.team_picked)
+            except KeyError:
+                if self.team_picked not in _unknown_team_names:
+                    _unknown_team_names.add(self.team_picked)
+                    logger.warning(f"No abbreviation for team {self.team_picked!r}; using the name as is")
+                self._team_abbr = self.team_picked
+        return self._team_abbr
+
+    @classmethod
+    def from_cell(cls, pick_td, game_index=None):
+        """
+        Builds a Pick from a GroupPickGrid-column--pick cell.
+        """
+        team_icon = pick_td.find("img")
+        # It looks like ESPN will use either of these..
+        correct = (
+            pick_td.find(class_="css-1skkwww") is not None
+            or pick_td.find(class_="PickCorrect-checkMark") is not None
+        )
+        incorrect = (
+            pick_td.find(class_="css-8wf538") is not None
+            or pick_td.find(class_="PickIncorrect-crossMark") is not None
+        )
+        push = "noPick" in pick_td.get("class", [])
+        return cls(team_icon["alt"], Outcome.from_flags(correct, incorrect, push), game_index)
 
     def is_incorrect(self):
-        legacy_crossmark = self.pick.find(class_="css-8wf538") is not None
-        return legacy_crossmark or self.pick.find(class_="PickIncorrect-crossMark") is not None
+        return self.outcome is Outcome.INCORRECT
 
     def is_tie(self, week):
-        tie_list = Helpers.weeks_to_ties(week)
-        if Helpers.team_name_to_abbr(self.team_picked) in tie_list:
-            return True
-        return False
+        return self.team_abbr in Helpers.weeks_to_ties(week)
 
     def is_push(self):
-        return any("noPick" in x for x in self.pick["class"])
-    
+        return self.outcome is Outcome.PUSH
+
     def is_correct(self):
-        # It looks like ESPN will use either of these..
-        correct_check_mark = self.pick.find(class_="css-1skkwww") is not None
-        return correct_check_mark or self.pick.find(class_="PickCorrect-checkMark") is not None
+        return self.outcome is Outcome.CORRECT
 
 class Team:
     def __init__(self, name, owner):
@@ -48,8 +110,7 @@ class Team:
                 pick
                 for pick in self.get_weekly_picks(week)
                 if pick.is_incorrect()
-                and Helpers.team_name_to_abbr(pick.team_picked)
-                not in Helpers.weeks_to_ties(week)
+                and pick.team_abbr not in Helpers.weeks_to_ties(week)
             ]
         )
 
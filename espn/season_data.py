@@ -0,0 +1,80 @@
+import datetime
+import json
+import logging
+import os
+
+from espn.models import Outcome, Pick, Team
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonData:
+    """
+    Every team's picks for the season, persisted as JSON between runs so the
+    scoreboard can be rendered again without scraping or parsing anything.
+
+    Layout: {"saved_at": ..., "teams": {name: {"owner": ..., "weeks":
+    {week: [[team picked, outcome, game index], ...]}}}}. Only this module
+    and espn.models are imported, so reading it back stays cheap.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.teams = {}  # Maps team name to {"owner", "weeks": {week: [pick, ...]}}
+        self.saved_at = None
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.saved_at = data.get("saved_at")
+            for name, team in data["teams"].items():
+                self.teams[name] = {
+                    "owner": team["owner"],
+                    "weeks": {int(week): picks for week, picks in team["weeks"].items()},
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable season data {self.path}: {e}")
+
+    def update_from_teams(self, teams, weeks):
+        """
+        Replaces the stored picks of the given weeks with the teams' picks,
+        keeping any other weeks from earlier runs.
+        """
+        for team in teams:
+            stored = self.teams.setdefault(team.name, {"owner": team.owner, "weeks": {}})
+            for week in weeks:
+                stored["weeks"][week] = [
+                    [pick.team_picked, pick.outcome.value, pick.game_index]
+                    for pick in team.get_weekly_picks(week)
+                ]
+
+    def get_teams(self):
+        """
+        Returns the stored season as Team objects, in the order they were saved.
+        """
+        teams = []
+        for name, stored in self.teams.items():
+            team = Team(name, stored["owner"])
+            for week, picks in stored["weeks"].items():
+                for team_picked, outcome, game_index in picks:
+                    team.add_weekly_pick(week, Pick(team_picked, Outcome(outcome), game_index))
+            teams.append(team)
+        return teams
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.saved_at = datetime.datetime.now().isoformat(timespec="seconds")
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "saved_at": self.saved_at,
+                "teams": {
+                    name: {
+                        "owner": stored["owner"],
+                        "weeks": {str(week): picks for week, picks in sorted(stored["weeks"].items())},
+                    }
+                    for name, stored in self.teams.items()
+                },
+            }, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,245 @@
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+def page_hash(page):
+    """
+    The sha256 a captured page is recorded under, in manifests and checkpoints.
+    """
+    return hashlib.sha256(page.encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """
+    Persists scraped pick-grid pages on disk so finished weeks never need
+    to be scraped again.
+
+    Layout: <root>/<group_id>/week-XX/page-YY.html.gz plus a manifest.json
+    per week recording each page's sha256 and whether the week is final.
+    A page is stored as captured: grid HTML, or the browser-extracted JSON.
+
+    Until a week's manifest is written, a checkpoint.json next to its pages
+    lists the pages saved so far, so an interrupted or failed week can resume
+    from its first missing page instead of page 1.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    CHECKPOINT_FILE = "checkpoint.json"
+
+    def __init__(self, root, group_id):
+        self.root = root
+        self.group_id = str(group_id)
+        self._pending = {}  # Maps week to the manifest entries of pages saved so far
+        self._checkpoints = {}  # Maps week to {"started_at", "last_page"} of its checkpoint
+        self._pending_lock = Lock()
+
+    def _week_dir(self, week):
+        return os.path.join(self.root, self.group_id, f"week-{week:02d}")
+
+    def _manifest_path(self, week):
+        return os.path.join(self._week_dir(week), self.MANIFEST_FILE)
+
+    def _checkpoint_path(self, week):
+        return os.path.join(self._week_dir(week), self.CHECKPOINT_FILE)
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _page_file(page_num):
+        return f"page-{page_num:02d}.html.gz"
+
+    @staticmethod
+    def _hash(html):
+        return page_hash(html)
+
+    def read_manifest(self, week):
+        """
+        Returns the manifest dict for a week, or None if nothing is stored.
+        """
+        try:
+            with open(self._manifest_path(week)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable snapshot manifest for week {week}: {e}")
+            return None
+
+    def is_final(self, week):
+        manifest = self.read_manifest(week)
+        return bool(manifest and manifest.get("final"))
+
+    def save_page(self, week, page_num, html):
+        """
+        Writes one page of a week as soon as it is captured and checkpoints it.
+        The week only becomes readable once finish_week writes its manifest.
+        """
+        week_dir = self._week_dir(week)
+        os.makedirs(week_dir, exist_ok=True)
+        file_name = self._page_file(page_num)
+        with gzip.open(os.path.join(week_dir, file_name), "wt", encoding="utf-8") as f:
+            f.write(html)
+        with self._pending_lock:
+            self._pending.setdefault(week, {})[page_num] = {
+                "page": page_num, "file": file_name, "sha256": self._hash(html)
+            }
+            self._write_checkpoint(week)
+
+    def mark_last_page(self, week, page_num):
+        """
+        Records in the checkpoint that page_num is the week's final page.
+        """
+        with self._pending_lock:
+            self._checkpoint_meta(week)["last_page"] = page_num
+            self._write_checkpoint(week)
+
+    def drop_page(self, week, page_num):
+        """
+        Takes a saved page back out of the week's checkpoint and manifest, e.g.
+        because it could not be parsed.
+        """
+        with self._pending_lock:
+            if self._pending.get(week, {}).pop(page_num, None) is not None:
+                self._write_checkpoint(week)
+
+    def _checkpoint_meta(self, week):
+        return self._checkpoints.setdefault(
+            week, {"started_at": time.time(), "last_page": None}
+        )
+
+    def _write_checkpoint(self, week):
+        # Called with _pending_lock held
+        pending = self._pending.get(week, {})
+        os.makedirs(self._week_dir(week), exist_ok=True)
+        self._write_json(self._checkpoint_path(week), {
+            **self._checkpoint_meta(week),
+            "pages": [pending[page_num] for page_num in sorted(pending)],
+        })
+
+    def load_checkpoint(self, week, max_age):
+        """
+        Reads back the pages checkpointed for an unfinished week, if the
+        checkpoint was started less than max_age seconds ago, and carries them
+        into this run's pending pages. Returns ({page number: page}, last page
+        or None); pages failing their hash check are left out.
+        """
+        try:
+            with open(self._checkpoint_path(week)) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return {}, None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable checkpoint for week {week}: {e}")
+            return {}, None
+        age = time.time() - checkpoint.get("started_at", 0)
+        if age > max_age:
+            logger.info(f"Ignoring week {week} checkpoint from {age / 60:.0f} minutes ago")
+            return {}, None
+
+        pages = {}
+        for entry in checkpoint["pages"]:
+            path = os.path.join(self._week_dir(week), entry["file"])
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    html = f.read()
+            except (OSError, EOFError):
+                continue
+            if self._hash(html) == entry["sha256"]:
+                pages[entry["page"]] = html
+        last_page = checkpoint.get("last_page")
+        with self._pending_lock:
+            pending = self._pending.setdefault(week, {})
+            for entry in checkpoint["pages"]:
+                if entry["page"] in pages:
+                    pending[entry["page"]] = entry
+            self._checkpoints[week] = {"started_at": checkpoint["started_at"], "last_page": last_page}
+        logger.info(f"Resuming week {week} from a checkpoint of {len(pages)} page(s)")
+        return pages, last_page
+
+    def finish_week(self, week, final=False):
+        """
+        Writes the manifest for the pages saved for a week. The manifest is
+        written last (and atomically) so a half-written week is never read back.
+        """
+        with self._pending_lock:
+            pending = self._pending.pop(week, {})
+            self._checkpoints.pop(week, None)
+        entries = [pending[page_num] for page_num in sorted(pending)]
+        if not entries:
+            return
+        week_dir = self._week_dir(week)
+
+        manifest = {
+            "group_id": self.group_id,
+            "week": week,
+            "final": final,
+            "saved_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "pages": entries,
+        }
+        self._write_json(self._manifest_path(week), manifest)
+        try:
+            os.remove(self._checkpoint_path(week))
+        except FileNotFoundError:
+            pass
+
+        # Drop pages left over from an earlier, longer capture of this week
+        keep = {entry["file"] for entry in entries}
+        for name in os.listdir(week_dir):
+            if name.startswith("page-") and name not in keep:
+                os.remove(os.path.join(week_dir, name))
+
+        logger.info(f"Saved snapshot for week {week}: {len(entries)} page(s), final={final}")
+
+    def discard_week(self, week):
+        """
+        Forgets pages saved for a week whose capture did not complete. Its
+        checkpoint stays on disk so a later run can resume it.
+        """
+        with self._pending_lock:
+            self._pending.pop(week, None)
+            self._checkpoints.pop(week, None)
+
+    def save_week(self, week, pages, final=False):
+        """
+        Writes every page of a week, then its manifest.
+        """
+        for page_num, html in enumerate(pages, start=1):
+            self.save_page(week, page_num, html)
+        self.finish_week(week, final=final)
+
+    def load_week(self, week):
+        """
+        Returns the stored pages of a week as HTML strings, or None if the week
+        is missing or any page fails its content hash check.
+        """
+        manifest = self.read_manifest(week)
+        if manifest is None:
+            return None
+
+        pages = []
+        for entry in manifest["pages"]:
+            path = os.path.join(self._week_dir(week), entry["file"])
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    html = f.read()
+            except (OSError, EOFError) as e:
+                logger.warning(f"Could not read snapshot {path}: {e}")
+                return None
+            if self._hash(html) != entry["sha256"]:
+                logger.warning(f"Snapshot {path} failed its hash check")
+                return None
+            pages.append(html)
+        return pages
@@ -0,0 +1,165 @@
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from threading import Lock
+import json
+import time
+
+# Spans open in the current thread or asyncio task, innermost last. A tuple is
+# replaced rather than mutated, so concurrent tasks never see each other's spans.
+_open_spans = ContextVar("open_spans", default=())
+
+
+class _NullSpan:
+    """
+    Returned by a disabled tracer so instrumented code pays for one call only.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def incr(self, counter, amount=1):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    One timed step of the pipeline, with its own counters.
+    """
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.counters = defaultdict(int)
+        self.parent = None
+        self.start = None
+        self.duration = None
+        self._token = None
+
+    def __enter__(self):
+        stack = _open_spans.get()
+        self.parent = stack[-1].name if stack else None
+        self._token = _open_spans.set(stack + (self,))
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        _open_spans.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._finish(self)
+        return False
+
+    def incr(self, counter, amount=1):
+        self.counters[counter] += amount
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "duration_s": round(self.duration, 6),
+            "attrs": self.attrs,
+            "counters": dict(self.counters),
+        }
+
+
+class Tracer:
+    """
+    Collects spans around the scrape/parse/render steps plus global counters
+    (WebDriver calls, pages, rows, bytes). Disabled by default, in which case
+    span() hands back a shared no-op span and incr() returns immediately.
+
+    Per-name totals cover every span, but only the last max_spans finished
+    spans are kept for the JSON export, so a long-running process (the watch
+    daemon) does not grow without bound.
+    """
+
+    def __init__(self, enabled=False, max_spans=10000):
+        self.enabled = enabled
+        self.spans = deque(maxlen=max_spans)
+        self.counters = defaultdict(int)
+        self._summary = {}  # Maps span name to its run count, total and max seconds
+        self._lock = Lock()
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def incr(self, counter, amount=1):
+        """
+        Bumps a global counter and the innermost open span on this thread or task.
+        """
+        if not self.enabled:
+            return
+        stack = _open_spans.get()
+        if stack:
+            stack[-1].incr(counter, amount)
+        with self._lock:
+            self.counters[counter] += amount
+
+    def _finish(self, span):
+        with self._lock:
+            self.spans.append(span)
+            entry = self._summary.setdefault(span.name, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+            entry["count"] += 1
+            entry["total_s"] += span.duration
+            entry["max_s"] = max(entry["max_s"], span.duration)
+
+    def summary(self):
+        """
+        Per span name: how many times it ran and its total and max seconds.
+        """
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._summary.items()}
+
+    def reset(self):
+        """
+        Drops every span, total and counter collected so far.
+        """
+        with self._lock:
+            self.spans.clear()
+            self._summary.clear()
+            self.counters.clear()
+
+    def to_json(self):
+        with self._lock:
+            spans = [span.to_dict() for span in self.spans]
+            counters = dict(self.counters)
+        return json.dumps(
+            {"summary": self.summary(), "counters": counters, "spans": spans}, indent=2
+        )
+
+    def to_prometheus(self):
+        lines = [
+            "# TYPE picks_span_seconds_total counter",
+            "# TYPE picks_span_runs_total counter",
+        ]
+        for name, entry in sorted(self.summary().items()):
+            lines.append(f'picks_span_seconds_total{{span="{name}"}} {entry["total_s"]:.6f}')
+            lines.append(f'picks_span_runs_total{{span="{name}"}} {entry["count"]}')
+        with self._lock:
+            counters = sorted(self.counters.items())
+        for counter, value in counters:
+            lines.append(f"# TYPE picks_{counter}_total counter")
+            lines.append(f"picks_{counter}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Writes Prometheus text if path ends in .prom, JSON otherwise.
+        """
+        output = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        with open(path, "w") as f:
+            f.write(output)
+
+
+# Shared tracer for the whole pipeline; driver.py enables it when asked for metrics
+tracer = Tracer()
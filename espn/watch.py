@@ -0,0 +1,255 @@
+from collections import namedtuple
+from threading import Event
+from zoneinfo import ZoneInfo
+import datetime
+import hashlib
+import logging
+import signal
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from espn.snapshots import page_hash
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+NFL_TIMEZONE = ZoneInfo("America/New_York")
+
+# When NFL games are usually being played: weekday (Monday is 0), kickoff
+# of the first game and hours until the last one is over, in Eastern time
+GameWindow = namedtuple("GameWindow", ["weekday", "start", "hours"])
+
+DEFAULT_GAME_WINDOWS = [
+    GameWindow(3, datetime.time(20, 0), 4),  # Thursday night
+    GameWindow(6, datetime.time(9, 30), 15),  # Sunday, London games through Sunday night
+    GameWindow(0, datetime.time(19, 0), 5.5),  # Monday night
+]
+
+
+def pages_fingerprint(page_hashes):
+    """
+    Fingerprint of a week's captured pages, from their sha256s in page order.
+    """
+    return hashlib.sha256("\0".join(page_hashes).encode("utf-8")).hexdigest()
+
+
+class GameClock:
+    """
+    How long to wait between captures: live_interval while a game window is
+    open, otherwise idle_interval, but never past the start of the next window.
+    """
+
+    def __init__(self, windows=DEFAULT_GAME_WINDOWS, live_interval=30, idle_interval=3600, tz=NFL_TIMEZONE):
+        self.windows = windows
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.tz = tz
+
+    def _window_spans(self, now):
+        # Each window's occurrences around now: last week's, this week's and next week's
+        week_start = (now - datetime.timedelta(days=now.weekday())).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        for weeks_ahead in (-1, 0, 1):
+            for window in self.windows:
+                start = week_start + datetime.timedelta(days=window.weekday + 7 * weeks_ahead)
+                start = start.replace(hour=window.start.hour, minute=window.start.minute)
+                yield start, start + datetime.timedelta(hours=window.hours)
+
+    def in_game_window(self, now=None):
+        now = now or datetime.datetime.now(self.tz)
+        return any(start <= now < end for start, end in self._window_spans(now))
+
+    def next_interval(self, now=None):
+        """
+        Seconds to wait before the next capture.
+        """
+        now = now or datetime.datetime.now(self.tz)
+        if self.in_game_window(now):
+            return self.live_interval
+        until_next = min(
+            ((start - now).total_seconds() for start, _ in self._window_spans(now) if start > now),
+            default=self.idle_interval,
+        )
+        return max(self.live_interval, min(self.idle_interval, until_next))
+
+
+class WatchDaemon:
+    """
+    Keeps one browser session on the group's pick grid and re-captures the
+    current week on the GameClock's schedule. Captured pages are fingerprinted,
+    and the week is only re-parsed and on_change(teams) only called (to
+    re-score and re-render) when the fingerprint changes.
+
+    client is a PickEmClient whose teams already hold the rest of the season;
+    its snapshot store and week state, if any, are kept up to date. Weeks the
+    client captured in full (or has a snapshot of) start with that capture's
+    fingerprint, so the first cycle only reports real changes. The session
+    is relaunched after session_max_age seconds or max_failures failed cycles
+    in a row.
+    """
+
+    def __init__(self, client, on_change, clock=None, session_max_age=6 * 3600, max_failures=3):
+        self.client = client
+        self.on_change = on_change
+        self.clock = clock or GameClock()
+        self.session_max_age = session_max_age
+        self.max_failures = max_failures
+        self.fingerprints = self._seed_fingerprints()  # Maps week to the fingerprint of its last captured pages
+        self.current_week = None
+        self.cycles = 0
+        self.changes = 0
+        self._session_started = None
+        self._failures = 0
+        self._final_weeks = set()  # Weeks to capture once more after the current week moves on
+        self._stop = Event()
+
+    def _seed_fingerprints(self):
+        """
+        Fingerprints of the weeks the client already holds: from the pages it
+        captured this run if it has every one of them, otherwise from the
+        week's snapshot manifest.
+        """
+        client = self.client
+        fingerprints = {}
+        for week_num in range(1, 19):
+            hashes = client.page_hashes.get(week_num, {})
+            last_page = client.last_pages.get(week_num)
+            if hashes and last_page is not None and set(hashes) == set(range(1, last_page + 1)):
+                fingerprints[week_num] = pages_fingerprint([hashes[page_num] for page_num in sorted(hashes)])
+                continue
+            manifest = client.snapshot_store.read_manifest(week_num) if client.snapshot_store else None
+            if manifest and manifest.get("pages"):
+                fingerprints[week_num] = pages_fingerprint([entry["sha256"] for entry in manifest["pages"]])
+        return fingerprints
+
+    def stop(self, *args):
+        self._stop.set()
+
+    def run(self, max_cycles=None):
+        """
+        Runs cycles until stopped (SIGINT or SIGTERM) or max_cycles have run.
+        """
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        try:
+            while not self._stop.is_set() and (max_cycles is None or self.cycles < max_cycles):
+                self.cycle()
+                if max_cycles is not None and self.cycles >= max_cycles:
+                    break
+                interval = self.clock.next_interval()
+                logger.info(f"Next capture in {interval:.0f}s")
+                self._stop.wait(interval)
+        finally:
+            self._close_session()
+
+    def cycle(self):
+        """
+        Captures the current week (and a week that just ended, once more).
+        Returns True if anything changed.
+        """
+        self.cycles += 1
+        with tracer.span("watch-cycle", cycle=self.cycles):
+            try:
+                self._ensure_session()
+                weeks = self._weeks_to_capture()
+                changed = [week_num for week_num, week_value in weeks if self._capture(week_num, week_value)]
+                self._failures = 0
+            except Exception as e:
+                self._failures += 1
+                logger.error(f"Watch cycle failed ({self._failures} in a row): {e}")
+                if self._failures >= self.max_failures:
+                    self._close_session()
+                return False
+
+        if not changed:
+            logger.info(f"No changes in week(s) {[week_num for week_num, _ in weeks]}")
+            return False
+        self.changes += 1
+        self.client._update_week_state(changed)
+        self.on_change(self.client.get_teams(), changed)
+        return True
+
+    def _ensure_session(self):
+        client = self.client
+        if client.browser is not None and time.monotonic() - self._session_started > self.session_max_age:
+            logger.info("Recycling the watch browser session")
+            self._close_session()
+        if client.browser is None:
+            client.browser = client.browser_profile.launch()
+            self._session_started = time.monotonic()
+            try:
+                client.wait = WebDriverWait(client.browser.driver, 20)
+                with tracer.span("navigate", group_id=client.group_id):
+                    client._navigate_to_group_picks()
+            except Exception:
+                self._close_session()
+                raise
+
+    def _close_session(self):
+        client = self.client
+        if client.browser is not None:
+            try:
+                client.browser_profile.close(client.browser)
+            except Exception as e:
+                logger.warning(f"Could not close the watch browser session: {e}")
+        client.browser = None
+        client.wait = None
+        self._failures = 0
+
+    def _weeks_to_capture(self):
+        """
+        Returns [(week number, dropdown value)]: the latest week in the dropdown,
+        plus the previous current week once after the dropdown moves on.
+        """
+        client = self.client
+        options = client._get_week_options()
+        available = client._available_weeks([(option.text, option.value) for option in options])
+        if not available:
+            # Before the dropdown appears the grid shows week 1
+            available = [(1, None)]
+        week_num, week_value = max(available)
+        if self.current_week is not None and week_num != self.current_week:
+            logger.info(f"Current week moved from {self.current_week} to {week_num}")
+            self._final_weeks.add(self.current_week)
+        self.current_week = week_num
+
+        weeks = [(w, v) for w, v in available if w in self._final_weeks]
+        self._final_weeks.clear()
+        return weeks + [(week_num, week_value)]
+
+    def _capture(self, week_num, week_value):
+        """
+        Captures every page of a week; if they differ from the last capture,
+        replaces the week's picks with them. Returns True if the week changed.
+        """
+        client = self.client
+        browser, wait = client.browser, client.wait
+        if week_value is not None and not client._select_week_in_session(browser, wait, week_num, week_value):
+            raise RuntimeError(f"Could not select week {week_num}")
+
+        pages = []
+        client._go_to_first_page_parallel(browser)
+        while True:
+            with tracer.span("grid-capture", week=week_num, page=len(pages) + 1):
+                pick_grid = client._get_pick_grid_html_parallel(week_num, len(pages) + 1, browser, wait)
+            if not pick_grid:
+                raise RuntimeError(f"No pick grid captured for week {week_num}, page {len(pages) + 1}")
+            pages.append(pick_grid)
+            if len(pages) >= 50 or not client._go_to_next_page_parallel(browser):
+                break
+
+        fingerprint = pages_fingerprint([page_hash(page) for page in pages])
+        if self.fingerprints.get(week_num) == fingerprint:
+            return False
+        self.fingerprints[week_num] = fingerprint
+        logger.info(f"Week {week_num} changed: re-parsing {len(pages)} page(s)")
+
+        with client.teams_lock:
+            for team in client.teams.values():
+                team.weeks_to_picks[week_num] = []
+        client._parse_pages({week_num: pages})
+        if client.snapshot_store:
+            client.snapshot_store.save_week(week_num, pages, final=client._is_week_final(week_num))
+        return True
@@ -0,0 +1,59 @@
+import datetime
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class WeekState:
+    """
+    Per-week pick outcome counts, persisted as JSON between runs.
+
+    A week is settled once it has picks and none of them are still undecided
+    (pushes and ties count as decided, as in PickEmClient._is_week_final).
+    Incremental runs use this to schedule only the weeks that can still change.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.weeks = {}  # Maps week number to its outcome counts
+        try:
+            with open(self.path) as f:
+                self.weeks = {int(week): counts for week, counts in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable week state {self.path}: {e}")
+
+    def update_from_teams(self, teams, week):
+        """
+        Recounts the outcomes of every team's picks for a week.
+        """
+        counts = {"picks": 0, "correct": 0, "incorrect": 0, "ties": 0, "push": 0, "undecided": 0}
+        for team in teams:
+            for pick in team.get_weekly_picks(week):
+                counts["picks"] += 1
+                if pick.is_push():
+                    counts["push"] += 1
+                elif pick.is_tie(week):
+                    counts["ties"] += 1
+                elif pick.is_correct():
+                    counts["correct"] += 1
+                elif pick.is_incorrect():
+                    counts["incorrect"] += 1
+                else:
+                    counts["undecided"] += 1
+        counts["updated_at"] = datetime.datetime.now().isoformat(timespec="seconds")
+        self.weeks[week] = counts
+
+    def is_settled(self, week):
+        counts = self.weeks.get(week)
+        return bool(counts and counts["picks"] > 0 and counts["undecided"] == 0)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({str(week): counts for week, counts in sorted(self.weeks.items())}, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,316 @@
+"""
+Publishes a built scoreboard site, uploading only what changed.
+
+    python -m scoreboard.publish <site dir> s3://bucket/prefix [--distribution_id ID]
+    python -m scoreboard.publish <site dir> /some/local/dir
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import time
+
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_KEY = ".publish-manifest.json"
+DEFAULT_CACHE_CONTROL = "max-age=60"  # The pages refresh themselves every minute
+
+# Suffix of each precompressed variant, by Content-Encoding
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def _compress(data, encoding):
+    if encoding == "gzip":
+        # mtime=0 so the same page always compresses to the same bytes
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    import brotli
+    return brotli.compress(data, quality=11)
+
+
+def available_encodings(encodings=("gzip", "br")):
+    """
+    Checks that this host can produce every requested encoding and returns
+    them. brotli is optional, so asking for "br" without it raises rather
+    than quietly publishing without .br variants.
+    """
+    for encoding in encodings:
+        if encoding not in ENCODING_SUFFIXES:
+            raise ValueError(f"Unknown encoding {encoding!r}")
+        if encoding == "br":
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "brotli is not installed, so .br variants cannot be published: "
+                    "pip install -r requirements-publish.txt, or publish with --no_brotli"
+                ) from None
+    return list(encodings)
+
+
+def check_dependencies(destination, encodings=("gzip", "br")):
+    """
+    Raises ImportError if publishing to destination with encodings needs a
+    package that is not installed, so a run can fail before it scrapes.
+    """
+    available_encodings(encodings)
+    if destination.startswith("s3://"):
+        try:
+            import boto3  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "boto3 is not installed, so nothing can be published to S3: "
+                "pip install -r requirements-publish.txt"
+            ) from None
+
+
+class LocalBackend:
+    """
+    Publishes into a local directory, for testing and for serving from disk.
+    Object metadata is kept in <root>/.publish-metadata.json.
+    """
+
+    METADATA_FILE = ".publish-metadata.json"
+
+    def __init__(self, root):
+        self.root = root
+        self.metadata = {}
+        try:
+            with open(os.path.join(root, self.METADATA_FILE)) as f:
+                self.metadata = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def read(self, key):
+        try:
+            with open(os.path.join(self.root, key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, body, content_type, content_encoding=None, cache_control=None):
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        self.metadata[key] = {
+            "content_type": content_type,
+            "content_encoding": content_encoding,
+            "cache_control": cache_control,
+        }
+
+    def delete(self, key):
+        try:
+            os.remove(os.path.join(self.root, key))
+        except FileNotFoundError:
+            pass
+        self.metadata.pop(key, None)
+
+    def invalidate(self, keys):
+        pass
+
+    def flush(self):
+        """
+        Saves the metadata of every object put or deleted so far.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, self.METADATA_FILE), "w") as f:
+            json.dump(self.metadata, f, indent=2, sort_keys=True)
+
+
+class S3Backend:
+    """
+    Publishes to an S3 bucket under a key prefix, and optionally invalidates
+    the changed paths in a CloudFront distribution. boto3 is only imported
+    when this backend is used.
+    """
+
+    def __init__(self, bucket, prefix="", distribution_id=None):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.distribution_id = distribution_id
+        self.s3 = boto3.client("s3")
+        self.cloudfront = boto3.client("cloudfront") if distribution_id else None
+
+    def read(self, key):
+        try:
+            return self.s3.get_object(Bucket=self.bucket, Key=self.prefix + key)["Body"].read()
+        except self.s3.exceptions.NoSuchKey:
+            return None
+
+    def put(self, key, body, content_type, content_encoding=None, cache_control=None):
+        extra = {}
+        if content_encoding:
+            extra["ContentEncoding"] = content_encoding
+        if cache_control:
+            extra["CacheControl"] = cache_control
+        self.s3.put_object(
+            Bucket=self.bucket, Key=self.prefix + key, Body=body, ContentType=content_type, **extra
+        )
+
+    def delete(self, key):
+        self.s3.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+    def flush(self):
+        pass
+
+    def invalidate(self, keys):
+        if not self.cloudfront or not keys:
+            return
+        paths = ["/" + self.prefix + key for key in keys]
+        self.cloudfront.create_invalidation(
+            DistributionId=self.distribution_id,
+            InvalidationBatch={
+                "Paths": {"Quantity": len(paths), "Items": paths},
+                "CallerReference": f"scoreboard-{time.time():.6f}",
+            },
+        )
+
+
+def backend_for(destination, distribution_id=None):
+    """
+    S3Backend for an s3://bucket/prefix destination, LocalBackend otherwise.
+    """
+    if destination.startswith("s3://"):
+        bucket, _, prefix = destination[len("s3://"):].partition("/")
+        return S3Backend(bucket, prefix, distribution_id=distribution_id)
+    return LocalBackend(destination)
+
+
+class Publisher:
+    """
+    Uploads a directory of built pages through a storage backend.
+
+    Every file is published as is and, for each encoding, as a precompressed
+    <key>.gz / <key>.br variant carrying its Content-Encoding, for a CDN or
+    server that picks the variant by Accept-Encoding. The sha256 of each
+    published file is kept in a manifest object next to the pages; files
+    whose hash matches it are not uploaded again, and only the keys that
+    were uploaded or deleted are invalidated.
+    """
+
+    def __init__(self, backend, encodings=("gzip", "br"), cache_control=DEFAULT_CACHE_CONTROL):
+        self.backend = backend
+        self.encodings = available_encodings(encodings)
+        self.cache_control = cache_control
+        self.uploaded = []  # Keys uploaded by the last publish, variants included
+        self.deleted = []  # Keys deleted by the last publish
+
+    def read_manifest(self):
+        body = self.backend.read(MANIFEST_KEY)
+        if body is None:
+            return {}
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable publish manifest: {e}")
+            return {}
+
+    @staticmethod
+    def collect(directory):
+        """
+        Maps key to file path for every file under directory, skipping dot files
+        (the site and publish manifests) and temporary files.
+        """
+        files = {}
+        for dir_path, dir_names, file_names in os.walk(directory):
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+            for name in file_names:
+                if name.startswith(".") or name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dir_path, name)
+                files[os.path.relpath(path, directory).replace(os.sep, "/")] = path
+        return files
+
+    def publish_directory(self, directory, delete_removed=True):
+        return self.publish(self.collect(directory), delete_removed=delete_removed)
+
+    def publish(self, files, delete_removed=True):
+        """
+        Publishes {key: file path}. Returns the keys uploaded, variants included.
+        """
+        with tracer.span("publish", files=len(files)):
+            return self._publish(files, delete_removed)
+
+    def _publish(self, files, delete_removed):
+        published = self.read_manifest()
+        manifest = {}
+        self.uploaded = []
+        self.deleted = []
+        changed = []
+
+        for key, path in sorted(files.items()):
+            with open(path, "rb") as f:
+                data = f.read()
+            sha256 = hashlib.sha256(data).hexdigest()
+            entry = {"sha256": sha256, "encodings": self.encodings}
+            manifest[key] = entry
+            if published.get(key) == entry:
+                continue
+
+            content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+            self.backend.put(key, data, content_type, cache_control=self.cache_control)
+            self.uploaded.append(key)
+            for encoding in self.encodings:
+                variant = key + ENCODING_SUFFIXES[encoding]
+                self.backend.put(
+                    variant, _compress(data, encoding), content_type,
+                    content_encoding=encoding, cache_control=self.cache_control,
+                )
+                self.uploaded.append(variant)
+            tracer.incr("bytes_published", len(data))
+            changed.append(key)
+
+        if delete_removed:
+            for key in sorted(set(published) - set(files)):
+                for variant in [key] + [key + ENCODING_SUFFIXES[e] for e in published[key].get("encodings", [])]:
+                    self.backend.delete(variant)
+                    self.deleted.append(variant)
+                changed.append(key)
+        else:
+            for key in set(published) - set(files):
+                manifest[key] = published[key]
+
+        if changed:
+            # The manifest goes last, so an interrupted publish is retried next time
+            self.backend.put(
+                MANIFEST_KEY, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+                "application/json", cache_control="no-cache",
+            )
+            self.backend.flush()
+            self.backend.invalidate(self.uploaded + self.deleted)
+        logger.info(
+            f"Published {len(changed)} changed file(s) of {len(files)}: "
+            f"{len(self.uploaded)} object(s) uploaded, {len(self.deleted)} deleted"
+        )
+        return self.uploaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish a built scoreboard site, uploading only changed files.")
+    parser.add_argument("site_dir", help="Directory written by driver.py --site_dir.")
+    parser.add_argument("destination", help="s3://bucket/prefix, or a local directory.")
+    parser.add_argument("--distribution_id", help="CloudFront distribution to invalidate changed paths in.")
+    parser.add_argument("--no_brotli", action="store_true", help="Only precompress with gzip.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    encodings = ("gzip",) if args.no_brotli else ("gzip", "br")
+    try:
+        check_dependencies(args.destination, encodings)
+    except ImportError as e:
+        parser.error(str(e))
+    publisher = Publisher(backend_for(args.destination, args.distribution_id), encodings=encodings)
+    publisher.publish_directory(args.site_dir)
+
+
+if __name__ == "__main__":
+    main()
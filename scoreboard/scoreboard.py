@@ -1,5 +1,9 @@
 import datetime
-import jinja2
+
+from espn.telemetry import tracer
+from scoreboard.season_matrix import SeasonMatrix
+from scoreboard.site import INDEX_TEMPLATE, get_environment
+from scoreboard.standings import Standings
 
 
 class Scoreboard:
@@ -8,6 +12,13 @@ class Scoreboard:
         self.teams_to_weekly_scores = {}
         self.teams_to_weekly_records = {}
 
+        # Every team's scores and records for the season, computed up front
+        with tracer.span("score", teams=len(teams)):
+            self.season = SeasonMatrix(teams)
+
+        # Season totals and ranks, updated as weeks are submitted
+        self.standings = Standings()
+
         for team in teams:
             # This is a map of team_name -> array of week scores for that team
             # Each element in a team's array is that team's total score for that week
@@ -16,35 +27,18 @@ class Scoreboard:
             # This is a map of team_name -> array of week records for that team
             # Each element in a team's array is that teams record (W-L-T) for that week
             self.teams_to_weekly_records[team.name] = [0] * 18
+            if team.name not in self.standings:
+                self.standings.add(team.name)
 
     def render(self, out_file):
-        unranked_team_totals = {}
-        for team in self.teams_to_weekly_scores:
-            unranked_team_totals[team] = sum(self.teams_to_weekly_scores[team])
-
-        # Sort the teams -- highest season-score first
-        sorted_team_totals = {
-            k: v
-            for k, v in sorted(
-                unranked_team_totals.items(), key=lambda item: item[1], reverse=True
-            )
-        }
-
-        # Generates list of tuples (Rank, Team, Score)
-        ranked_team_totals = []
-        rank = 1
-        last_score = None
-        for i, team in enumerate(sorted_team_totals):
-            score = sorted_team_totals[team]
-            if score != last_score:
-                rank = i + 1
-            ranked_team_totals.append((rank, team, score))
-            last_score = score
-
-        templateLoader = jinja2.FileSystemLoader(searchpath="./scoreboard/")
-        templateEnv = jinja2.Environment(loader=templateLoader)
-        TEMPLATE_FILE = "scoreboard_template.html.jinja2"
-        template = templateEnv.get_template(TEMPLATE_FILE)
+        with tracer.span("render", teams=len(self.teams_to_weekly_scores)):
+            self._render(out_file)
+
+    def _render(self, out_file):
+        # Generates list of tuples (Rank, Team, Score), highest season-score first
+        ranked_team_totals = self.standings.rows()
+
+        template = get_environment().get_template(INDEX_TEMPLATE)
         output = template.render(
             ranked_team_totals=ranked_team_totals,
             teams_to_weekly_scores=self.teams_to_weekly_scores,
@@ -56,7 +50,21 @@ class Scoreboard:
             f.write(output)
 
     def submit_team_week(self, team, week):
-        self.teams_to_weekly_scores[team.name][week - 1] = team.get_weekly_score(week)
+        row = self.season.index[team.name]
+        self.teams_to_weekly_scores[team.name][week - 1] = int(self.season.scores[row, week - 1])
+        self.standings.set_score(team.name, week, self.teams_to_weekly_scores[team.name][week - 1])
 
-        self.teams_to_weekly_records[team.name][week - 1] = team.get_weekly_record(week)
+        self.teams_to_weekly_records[team.name][week - 1] = self.season.weekly_records(team.name)[week - 1]
         return
+
+    def submit_weeks(self, weeks):
+        """
+        Submits the given weeks for every team at once.
+        """
+        for name in self.season.names:
+            scores = self.season.weekly_scores(name)
+            records = self.season.weekly_records(name)
+            for week in weeks:
+                self.teams_to_weekly_scores[name][week - 1] = scores[week - 1]
+                self.standings.set_score(name, week, scores[week - 1])
+                self.teams_to_weekly_records[name][week - 1] = records[week - 1]
@@ -0,0 +1,68 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Points for each correct, incorrect and tied pick
+ScoringRule = namedtuple("ScoringRule", ["name", "correct", "incorrect", "tie"])
+
+DEFAULT_RULE = ScoringRule("+1/-2", 1, -2, 0)
+
+
+class RuleStandings:
+    """
+    One rule's standings, kept as arrays until rows are asked for.
+    """
+
+    def __init__(self, rule, names, ranks, order, scores):
+        self.rule = rule
+        self._names = names
+        self.ranks = ranks  # Rank of the i-th placed team
+        self.order = order  # Row in the SeasonMatrix of the i-th placed team
+        self.scores = scores  # Season total of the i-th placed team
+
+    def __len__(self):
+        return len(self.order)
+
+    def rows(self, limit=None):
+        """
+        Returns (rank, team, score) tuples, highest score first.
+        """
+        end = len(self) if limit is None else limit
+        return [
+            (rank, self._names[row], score)
+            for rank, row, score in zip(
+                self.ranks[:end].tolist(), self.order[:end].tolist(), self.scores[:end].tolist()
+            )
+        ]
+
+
+def evaluate_rules(season, rules):
+    """
+    Scores a SeasonMatrix under many scoring rules in one batched pass.
+
+    Returns a dict of rule name -> RuleStandings, ranked the same way as
+    Scoreboard.render (tied teams share a rank and the next rank skips).
+    """
+    weights = np.array([[rule.correct, rule.incorrect, rule.tie] for rule in rules]).T  # 3 x R
+    if not np.issubdtype(weights.dtype, np.integer):
+        weights = weights.astype(float)
+
+    # Season-long counts per team: E x 3, then E x R totals in one matrix product
+    counts = np.stack(
+        [season.num_correct.sum(axis=1), season.num_incorrect.sum(axis=1), season.num_ties.sum(axis=1)],
+        axis=1,
+    )
+    totals = counts @ weights
+
+    # Stable descending sort keeps tied teams in their original order
+    order = np.argsort(-totals, axis=0, kind="stable")
+    sorted_totals = np.take_along_axis(totals, order, axis=0)
+    positions = np.arange(1, len(season.names) + 1)[:, None]
+    starts_new_rank = np.ones(sorted_totals.shape, dtype=bool)
+    starts_new_rank[1:] = sorted_totals[1:] != sorted_totals[:-1]
+    ranks = np.maximum.accumulate(np.where(starts_new_rank, positions, 0), axis=0)
+
+    return {
+        rule.name: RuleStandings(rule, season.names, ranks[:, col], order[:, col], sorted_totals[:, col])
+        for col, rule in enumerate(rules)
+    }
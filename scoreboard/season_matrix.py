@@ -0,0 +1,63 @@
+import numpy as np
+
+from espn.helpers import Helpers
+from espn.models import Outcome
+
+NUM_WEEKS = 18
+
+
+class SeasonMatrix:
+    """
+    A whole season of picks as entries x weeks x games NumPy arrays, so scores,
+    records and totals for every team come out of a few vectorized passes
+    instead of per-pick method calls.
+
+    Week w lives at index w - 1. Slots past a team-week's last pick are
+    padding: UNDECIDED and never a tie, so they count towards nothing.
+    """
+
+    def __init__(self, teams, num_weeks=NUM_WEEKS):
+        self.names = [team.name for team in teams]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.num_weeks = num_weeks
+
+        num_games = max(
+            [len(team.get_weekly_picks(week)) for team in teams for week in range(1, num_weeks + 1)],
+            default=0,
+        )
+        shape = (len(self.names), num_weeks, max(num_games, 1))
+        self.outcomes = np.full(shape, Outcome.UNDECIDED.value, dtype=np.int8)
+        self.ties = np.zeros(shape, dtype=bool)
+
+        tie_sets = {week: set(Helpers.weeks_to_ties(week)) for week in range(1, num_weeks + 1)}
+        for row, team in enumerate(teams):
+            for week in range(1, num_weeks + 1):
+                ties = tie_sets[week]
+                for game, pick in enumerate(team.get_weekly_picks(week)):
+                    self.outcomes[row, week - 1, game] = pick.outcome.value
+                    if pick.team_abbr in ties:
+                        self.ties[row, week - 1, game] = True
+
+        self._score()
+
+    def _score(self):
+        # Tied games are never counted as incorrect, but a correct mark still counts
+        self.num_correct = (self.outcomes == Outcome.CORRECT.value).sum(axis=2)
+        self.num_incorrect = ((self.outcomes == Outcome.INCORRECT.value) & ~self.ties).sum(axis=2)
+        self.num_ties = self.ties.sum(axis=2)
+        self.scores = self.num_correct - 2 * self.num_incorrect
+        self.totals = self.scores.sum(axis=1)
+
+    def weekly_scores(self, name):
+        return self.scores[self.index[name]].tolist()
+
+    def weekly_records(self, name):
+        row = self.index[name]
+        return [
+            f"({c}-{i}-{t})"
+            for c, i, t in zip(
+                self.num_correct[row].tolist(),
+                self.num_incorrect[row].tolist(),
+                self.num_ties[row].tolist(),
+            )
+        ]
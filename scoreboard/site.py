@@ -0,0 +1,201 @@
+from functools import lru_cache
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+
+import jinja2
+
+from espn.telemetry import tracer
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_TEMPLATE = "scoreboard_template.html.jinja2"
+WEEK_TEMPLATE = "week.html.jinja2"
+ENTRY_TEMPLATE = "entry.html.jinja2"
+
+_environment = None
+
+
+def get_environment():
+    """
+    Returns the process-wide template environment. Templates are loaded from
+    this package's directory, whatever the working directory, and each is
+    compiled once on first use; auto_reload is off so later renders never
+    re-read or re-stat the files.
+    """
+    global _environment
+    if _environment is None:
+        _environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(TEMPLATE_DIR), auto_reload=False
+        )
+    return _environment
+
+
+@lru_cache(maxsize=None)
+def _templates_digest():
+    # Every page is re-rendered when any template changes. Read once, like the
+    # compiled templates themselves
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(TEMPLATE_DIR)):
+        if name.endswith(".jinja2"):
+            with open(os.path.join(TEMPLATE_DIR, name), "rb") as f:
+                digest.update(name.encode("utf-8") + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def entry_slug(name):
+    """
+    File-name-safe, stable slug for an entry. A short hash of the full name
+    keeps entries whose names only differ in punctuation or case apart.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:40] or "entry"
+    return f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+
+
+def competition_ranks(rows, key):
+    """
+    Ranks rows sorted best-first: tied rows share a rank and the next rank skips.
+    """
+    ranks = []
+    last = None
+    for i, row in enumerate(rows):
+        if i == 0 or key(row) != last:
+            rank = i + 1
+        ranks.append(rank)
+        last = key(row)
+    return ranks
+
+
+class SiteGenerator:
+    """
+    Writes the scoreboard as a small static site in one pass: the overall
+    standings at index.html, one page per week under weeks/ and one page per
+    entry under entries/.
+
+    Each page's hash covers the data it shows and the templates, but not
+    the `now` timestamp. A .site-manifest.json in the output directory keeps
+    the hash of every page written, so a page whose hash has not changed is
+    neither rendered nor rewritten, and its timestamp is when it last changed.
+    """
+
+    MANIFEST_FILE = ".site-manifest.json"
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.environment = get_environment()
+        self.manifest = self._read_manifest()
+        self.written = []  # Pages rewritten by the last build
+        self.skipped = []  # Pages left untouched by the last build
+
+    def _manifest_path(self):
+        return os.path.join(self.output_dir, self.MANIFEST_FILE)
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_path()) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable site manifest: {e}")
+            return {}
+
+    @staticmethod
+    def week_path(week):
+        return f"weeks/week-{week:02d}.html"
+
+    @staticmethod
+    def entry_path(name):
+        return f"entries/{entry_slug(name)}.html"
+
+    def build(self, scoreboard, weeks):
+        """
+        Renders every page for a submitted Scoreboard and writes the ones that
+        changed. weeks are the weeks to give pages to; weeks nobody has a
+        score or record in yet are left out. Returns the paths written.
+        """
+        with tracer.span("site", teams=len(scoreboard.teams_to_weekly_scores)):
+            return self._build(scoreboard, weeks)
+
+    def _build(self, scoreboard, weeks):
+        scores = scoreboard.teams_to_weekly_scores
+        records = scoreboard.teams_to_weekly_records
+        weeks = [
+            week for week in weeks
+            if any(scores[name][week - 1] or records[name][week - 1] not in (0, "(0-0-0)") for name in scores)
+        ]
+        week_paths = {week: self.week_path(week) for week in weeks}
+        entry_paths = {name: self.entry_path(name) for name in scores}
+        standings = scoreboard.standings.rows()
+        self.written = []
+        self.skipped = []
+        templates = _templates_digest()
+
+        pages = [(
+            "index.html", INDEX_TEMPLATE, {
+                "ranked_team_totals": standings,
+                "teams_to_weekly_scores": scores,
+                "teams_to_weekly_records": records,
+                "entry_paths": entry_paths,
+                "week_paths": week_paths,
+            },
+        )]
+        for week in weeks:
+            week_rows = sorted(
+                ((name, scores[name][week - 1], records[name][week - 1]) for name in scores),
+                key=lambda row: row[1], reverse=True,
+            )
+            ranks = competition_ranks(week_rows, key=lambda row: row[1])
+            pages.append((self.week_path(week), WEEK_TEMPLATE, {
+                "week": week,
+                "rows": [(rank, *row) for rank, row in zip(ranks, week_rows)],
+                "root": "../", "weeks": weeks, "week_paths": week_paths, "entry_paths": entry_paths,
+            }))
+        for rank, name, total in standings:
+            pages.append((self.entry_path(name), ENTRY_TEMPLATE, {
+                "team": name, "rank": rank, "total": total,
+                "rows": [
+                    (week, scores[name][week - 1], records[name][week - 1])
+                    for week in range(1, len(scores[name]) + 1)
+                ],
+                "root": "../", "weeks": weeks, "week_paths": week_paths,
+            }))
+
+        now = datetime.datetime.now().strftime("%Y-%m-%d %I:%M:%S %p")
+        manifest = {}
+        for path, template_name, context in pages:
+            content_hash = hashlib.sha256(
+                (templates + template_name + json.dumps(context, sort_keys=True, default=str)).encode("utf-8")
+            ).hexdigest()
+            manifest[path] = content_hash
+            out_file = os.path.join(self.output_dir, path)
+            if self.manifest.get(path) == content_hash and os.path.exists(out_file):
+                self.skipped.append(path)
+                continue
+            output = self.environment.get_template(template_name).render(now=now, **context)
+            self._write(out_file, output)
+            self.written.append(path)
+
+        # Pages of entries or weeks that are gone
+        for path in set(self.manifest) - set(manifest):
+            try:
+                os.remove(os.path.join(self.output_dir, path))
+            except FileNotFoundError:
+                pass
+
+        self.manifest = manifest
+        self._write(self._manifest_path(), json.dumps(manifest, indent=2, sort_keys=True))
+        logger.info(f"Site in {self.output_dir}: {len(self.written)} page(s) written, {len(self.skipped)} unchanged")
+        return self.written
+
+    @staticmethod
+    def _write(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
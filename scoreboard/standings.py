@@ -0,0 +1,163 @@
+NUM_WEEKS = 18
+
+
+class _Fenwick:
+    """
+    Binary indexed tree of counts over a contiguous range of integer keys,
+    starting at `low`.
+    """
+
+    def __init__(self, low, size):
+        self.low = low
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, key, amount):
+        i = key - self.low + 1
+        while i <= self.size:
+            self.tree[i] += amount
+            i += i & -i
+
+    def count_upto(self, key):
+        """
+        Number of items with a key <= key.
+        """
+        i = min(key - self.low + 1, self.size)
+        total = 0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def kth_key(self, k):
+        """
+        Smallest key with at least k items at or below it (k counts from 1).
+        """
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return self.low + pos
+
+
+class Standings:
+    """
+    Season totals and ranks for every entry, kept up to date one score change
+    at a time instead of being re-sorted on every render.
+
+    Entries are bucketed by integer season total, and a Fenwick tree counts
+    entries per total, so apply_delta, rank and finding the next score down
+    are all O(log R) in the spread R of totals. Ranks follow Scoreboard:
+    tied entries share a rank and the next rank skips. Tied entries are
+    listed in the order they were added.
+    """
+
+    def __init__(self, num_weeks=NUM_WEEKS):
+        self.num_weeks = num_weeks
+        self._weekly = {}  # Maps name to its weekly scores, week w at index w - 1
+        self._totals = {}  # Maps name to its season total
+        self._seq = {}  # Maps name to the order it was added in, for ties
+        self._buckets = {}  # Maps a season total to the names on it
+        self._counts = _Fenwick(-64, 128)
+
+    @classmethod
+    def from_season(cls, season):
+        """
+        Builds standings from a SeasonMatrix's weekly scores.
+        """
+        standings = cls(season.num_weeks)
+        for name, weekly in zip(season.names, season.scores.tolist()):
+            standings.add(name, weekly)
+        return standings
+
+    def __len__(self):
+        return len(self._totals)
+
+    def __contains__(self, name):
+        return name in self._totals
+
+    def add(self, name, weekly_scores=None):
+        """
+        Adds an entry, with all-zero weekly scores unless given.
+        """
+        if name in self._totals:
+            raise ValueError(f"{name} is already in the standings")
+        weekly = list(weekly_scores) if weekly_scores is not None else [0] * self.num_weeks
+        self._weekly[name] = weekly
+        self._seq[name] = len(self._seq)
+        self._totals[name] = sum(weekly)
+        self._insert(name, self._totals[name])
+
+    def apply_delta(self, name, week, delta):
+        """
+        Adds delta (an int) to an entry's score for a week.
+        """
+        if not delta:
+            return
+        self._weekly[name][week - 1] += delta
+        total = self._totals[name]
+        self._remove(name, total)
+        self._totals[name] = total + delta
+        self._insert(name, total + delta)
+
+    def set_score(self, name, week, score):
+        """
+        Sets an entry's score for a week, applying the difference.
+        """
+        self.apply_delta(name, week, score - self._weekly[name][week - 1])
+
+    def weekly_scores(self, name):
+        return list(self._weekly[name])
+
+    def total(self, name):
+        return self._totals[name]
+
+    def rank(self, name):
+        """
+        1 plus the number of entries with a strictly higher total.
+        """
+        return 1 + len(self) - self._counts.count_upto(self._totals[name])
+
+    def top(self, n=None):
+        """
+        Returns (rank, name, total) for the best n entries (all by default),
+        highest total first.
+        """
+        n = len(self) if n is None else min(n, len(self))
+        rows = []
+        while len(rows) < n:
+            # The next total down holds the (len(rows) + 1)-th best entry
+            total = self._counts.kth_key(len(self) - len(rows))
+            rank = len(rows) + 1
+            bucket = sorted(self._buckets[total], key=self._seq.__getitem__)
+            rows.extend((rank, name, total) for name in bucket[: n - len(rows)])
+        return rows
+
+    def rows(self):
+        return self.top()
+
+    def _insert(self, name, total):
+        if not self._counts.low <= total < self._counts.low + self._counts.size:
+            self._grow(total)
+        self._buckets.setdefault(total, set()).add(name)
+        self._counts.add(total, 1)
+
+    def _remove(self, name, total):
+        bucket = self._buckets[total]
+        bucket.discard(name)
+        if not bucket:
+            del self._buckets[total]
+        self._counts.add(total, -1)
+
+    def _grow(self, total):
+        # Rebuild over a range twice as wide as needed; totals drift slowly, so this is rare
+        low = min([total, self._counts.low] + list(self._buckets))
+        high = max([total, self._counts.low + self._counts.size - 1] + list(self._buckets))
+        span = high - low + 1
+        self._counts = _Fenwick(low - span // 2, 2 * span)
+        for bucket_total, names in self._buckets.items():
+            self._counts.add(bucket_total, len(names))
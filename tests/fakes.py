@@ -0,0 +1,147 @@
+"""
+Fake browsers over a synthetic pick grid, for driving the scraping code
+without Chrome.
+"""
+from contextlib import contextmanager
+
+from bench.fixtures import pick_grid_payload
+from espn.cdp_engine import CLICK_PAGINATION_JS, GRID_CHANGED_JS
+from espn.grid_parser import GRID_EXTRACT_JS
+from espn.PickEmClient import GRID_FINGERPRINT_JS, PAGE_JUMP_JS
+
+ENTRIES_PER_PAGE = 5
+
+
+class PrevNextGrid:
+    """
+    A week of pick-grid pages behind prev/next buttons only. Starts on
+    start_page, as a session left mid-week would.
+    """
+
+    def __init__(self, num_pages, start_page=1):
+        self.num_pages = num_pages
+        self.page = start_page
+        self.clicks = []
+        self.version = 0  # Bump to change every page's picks
+
+    def fingerprint(self):
+        return f"page {self.page}"
+
+    def payload(self):
+        return pick_grid_payload(
+            ENTRIES_PER_PAGE, games=4, seed=self.version * 1000 + self.page,
+            first_entry=(self.page - 1) * ENTRIES_PER_PAGE,
+        )
+
+    def can_move(self, direction):
+        return self.page > 1 if direction == "prev" else self.page < self.num_pages
+
+    def move(self, direction):
+        self.clicks.append(direction)
+        self.page += -1 if direction == "prev" else 1
+
+
+class _Button:
+    def __init__(self, direction):
+        self.direction = direction
+
+
+class _Elements(list):
+    @property
+    def first(self):
+        return self[0]
+
+
+class _Element:
+    def __init__(self, element):
+        self._element = element
+
+
+class FakeBrowser:
+    """
+    Just enough of a splinter browser for PickEmClient's pagination and
+    capture helpers. It is its own WebDriver, for WebDriverWait.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.driver = self
+
+    def execute_script(self, script, *args):
+        if script == PAGE_JUMP_JS:
+            return None
+        if script == GRID_FINGERPRINT_JS:
+            return self.grid.fingerprint()
+        if script == GRID_EXTRACT_JS:
+            return self.grid.payload()
+        if script == "arguments[0].click();":
+            self.grid.move(args[0].direction)
+        return None
+
+    def find_by_xpath(self, xpath):
+        if "GroupPickGrid-table" in xpath:
+            return _Elements([_Element(None)])
+        direction = "prev" if "prev" in xpath else "next"
+        if not self.grid.can_move(direction):
+            return _Elements()
+        return _Elements([_Element(_Button(direction))])
+
+
+class _Wait:
+    def until(self, condition):
+        return True
+
+
+class _Session:
+    def __init__(self, browser):
+        self.browser = browser
+        self.wait = _Wait()
+        self.pages_served = 0
+
+
+class FakePool:
+    def __init__(self, browser):
+        self.browser = browser
+
+    @contextmanager
+    def session(self):
+        yield _Session(self.browser)
+
+
+class FakeTab:
+    def __init__(self, grid):
+        self.grid = grid
+        self.week = None
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def run_script(self, script, *args):
+        if script == PAGE_JUMP_JS:
+            return None
+        if script == CLICK_PAGINATION_JS:
+            direction = args[0]
+            if not self.grid.can_move(direction):
+                return None
+            before = self.grid.fingerprint()
+            self.grid.move(direction)
+            return before
+        if script == GRID_EXTRACT_JS:
+            return self.grid.payload()
+        return None
+
+    async def wait_for(self, script, *args, timeout=20, poll=0.05):
+        if script == GRID_CHANGED_JS:
+            assert self.grid.fingerprint() != args[0]
+        return True
+
+
+class FakeCdpBrowser:
+    def __init__(self, grid=None):
+        self.grid = grid
+        self.tabs = []
+
+    async def new_tab(self):
+        self.tabs.append(FakeTab(self.grid))
+        return self.tabs[-1]
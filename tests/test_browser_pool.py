@@ -0,0 +1,166 @@
+import time
+from queue import Queue
+from threading import Thread
+
+import pytest
+
+import espn.browser_profile
+from driver import pool_share
+from espn.browser_pool import BrowserPool, BrowserSession
+from espn.browser_profile import BrowserProfile
+from espn.concurrency import SessionBudget
+
+
+class FakeChrome:
+    """
+    Stands in for a splinter Browser; it is its own WebDriver.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.driver = self
+        self.healthy = True
+        self.quit_called = False
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("chrome not reachable")
+        return "complete"
+
+    def get_log(self, kind):
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def fake_pool(size, **kwargs):
+    """
+    A pool whose launches start a FakeChrome, warm it up and record it.
+    """
+    pool = BrowserPool(size, lambda browser: warmed.append(browser), **kwargs)
+    pool.launched = []
+    warmed = []
+
+    def launch():
+        browser = FakeChrome()
+        pool.warm_up(browser)
+        pool.launched.append(browser)
+        return BrowserSession(browser)
+
+    pool._launch = launch
+    pool.warmed = warmed
+    return pool
+
+
+def test_sessions_are_warmed_once_and_reused():
+    with fake_pool(2) as pool:
+        for _ in range(5):
+            with pool.session() as session:
+                session.pages_served += 1
+
+    assert len(pool.launched) == 1
+    assert pool.warmed == pool.launched
+    assert pool.launched[0].quit_called
+
+
+def test_checkouts_wait_for_a_session_once_the_pool_is_full():
+    with fake_pool(2) as pool:
+        checked_out = []
+        with pool.session(), pool.session():
+            waiter = Thread(target=lambda: checked_out.append(pool._checkout()))
+            waiter.start()
+            time.sleep(0.1)
+            assert checked_out == []
+        waiter.join(5)
+
+        assert len(checked_out) == 1
+        assert len(pool.launched) == 2
+        pool._checkin(checked_out[0])
+
+
+def test_unhealthy_and_failed_sessions_are_replaced():
+    with fake_pool(1) as pool:
+        with pool.session():
+            pass
+        pool.launched[0].healthy = False
+        with pool.session():
+            pass
+        assert pool.launched[0].quit_called
+
+        with pytest.raises(ValueError):
+            with pool.session():
+                raise ValueError("page crashed")
+        assert pool.launched[1].quit_called
+        with pool.session():
+            pass
+    assert len(pool.launched) == 3
+
+
+def test_sessions_are_recycled_after_serving_their_pages():
+    with fake_pool(1, max_pages_per_session=3) as pool:
+        with pool.session() as session:
+            session.pages_served = 3
+        assert pool.launched[0].quit_called
+        with pool.session() as session:
+            session.pages_served = 2
+        with pool.session():
+            pass
+    assert len(pool.launched) == 2
+
+
+def test_a_closed_pool_quits_its_sessions_and_refuses_checkouts():
+    pool = fake_pool(2)
+    with pool.session():
+        pass
+    pool.close()
+
+    assert pool.launched[0].quit_called
+    with pytest.raises(RuntimeError):
+        with pool.session():
+            pass
+
+
+def test_budget_smaller_than_the_pool_never_hangs(monkeypatch):
+    monkeypatch.setattr(espn.browser_profile, "Browser", FakeChrome)
+    budget = SessionBudget(2)
+    profile = BrowserProfile(session_budget=budget)
+    # The group's own browser, reading the week list, holds one session throughout
+    main_browser = profile.launch()
+
+    done = Queue()
+
+    def scrape_week(weeks):
+        for week in weeks:
+            with pool.session():
+                time.sleep(0.01)
+            done.put(week)
+
+    with BrowserPool(4, lambda browser: None, profile=profile) as pool:
+        # Daemon threads, so a hang fails the test instead of blocking it
+        for worker in range(4):
+            Thread(target=scrape_week, args=(range(1 + worker, 19, 4),), daemon=True).start()
+        weeks = []
+        deadline = time.monotonic() + 10
+        while len(weeks) < 18 and time.monotonic() < deadline:
+            if not done.empty():
+                weeks.append(done.get())
+            else:
+                time.sleep(0.01)
+        assert len(weeks) == 18, f"done {len(weeks)} stuck {18 - len(weeks)}, budget in_use {budget.in_use}"
+    profile.close(main_browser)
+
+    assert sorted(weeks) == list(range(1, 19))
+    assert budget.peak == 2 and budget.in_use == 0
+
+
+def test_pools_are_capped_at_their_share_of_the_budget():
+    assert pool_share(2, 1) == 1
+    assert pool_share(6, 2) == 2
+    assert pool_share(8, 3, max_sessions=1) == 1
+    assert pool_share(3, 2) == 1
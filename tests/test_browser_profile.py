@@ -0,0 +1,106 @@
+import json
+
+import espn.browser_profile
+from espn.browser_profile import DEFAULT_BLOCKED_URLS, BrowserProfile, TrafficReport
+
+
+class FakeChrome:
+    """
+    Stands in for a splinter Browser; it is its own WebDriver.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.driver = self
+        self.kwargs = kwargs
+        self.cdp_commands = []
+        self.log = []
+        self.quit_called = False
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append((cmd, params))
+        return {}
+
+    def get_log(self, kind):
+        return self.log
+
+    def quit(self):
+        self.quit_called = True
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def test_the_default_profile_is_lean():
+    capabilities = BrowserProfile().chrome_options().to_capabilities()
+    chrome = capabilities["goog:chromeOptions"]
+
+    assert capabilities["pageLoadStrategy"] == "eager"
+    assert "--blink-settings=imagesEnabled=false" in chrome["args"]
+    assert not any(arg.startswith("--disk-cache-dir") for arg in chrome["args"])
+
+
+def test_images_and_the_shared_cache_are_configurable(tmp_path):
+    profile = BrowserProfile(load_images=True, page_load_strategy="normal", cache_dir=str(tmp_path))
+    capabilities = profile.chrome_options().to_capabilities()
+    args = capabilities["goog:chromeOptions"]["args"]
+
+    assert capabilities["pageLoadStrategy"] == "normal"
+    assert "--blink-settings=imagesEnabled=false" not in args
+    assert f"--disk-cache-dir={tmp_path}" in args
+
+
+def test_launched_browsers_block_the_listed_urls(monkeypatch):
+    monkeypatch.setattr(espn.browser_profile, "Browser", FakeChrome)
+
+    browser = BrowserProfile(blocked_urls=DEFAULT_BLOCKED_URLS + ["*.example.com*"]).launch()
+    assert browser.kwargs["headless"] is True
+    assert browser.cdp_commands == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": DEFAULT_BLOCKED_URLS + ["*.example.com*"]}),
+    ]
+
+    assert BrowserProfile(blocked_urls=[]).launch().cdp_commands == []
+
+
+def test_closed_browsers_add_their_traffic_to_the_report(monkeypatch):
+    monkeypatch.setattr(espn.browser_profile, "Browser", FakeChrome)
+    profile = BrowserProfile()
+    browser = profile.launch()
+    browser.log = [
+        log_entry("Network.requestWillBeSent", requestId="1"),
+        log_entry("Network.requestWillBeSent", requestId="2"),
+        log_entry("Network.requestWillBeSent", requestId="3"),
+        log_entry("Network.loadingFinished", requestId="1", encodedDataLength=1500),
+        log_entry("Network.loadingFailed", requestId="2", errorText="net::ERR_BLOCKED_BY_CLIENT"),
+        log_entry(
+            "Network.responseReceived", requestId="3",
+            response={"fromDiskCache": True, "headers": {"Content-Length": "800"}},
+        ),
+        {"message": "not json"},
+    ]
+
+    profile.close(browser)
+
+    assert browser.quit_called
+    assert profile.traffic.to_dict() == {
+        "sessions": 1,
+        "requests": 3,
+        "bytes_downloaded": 1500,
+        "blocked_requests": 1,
+        "cached_responses": 1,
+        "cached_bytes": 800,
+    }
+
+
+def test_traffic_adds_up_across_sessions():
+    report = TrafficReport()
+    report.add_log([log_entry("Network.requestWillBeSent"), log_entry("Network.requestServedFromCache", requestId="9")])
+    report.add_log([log_entry("Network.loadingFinished", encodedDataLength=2_000_000)])
+
+    assert report.to_dict()["sessions"] == 2
+    assert report.to_dict()["cached_responses"] == 1
+    assert "2 browser session(s): 1 requests, 2.00 MB downloaded" in report.summary()
@@ -0,0 +1,36 @@
+"""
+build_scoreboard.sh, the cron entry point, run against a checkout whose
+virtualenv "python" only echoes its arguments.
+"""
+import os
+import subprocess
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "build_scoreboard.sh")
+
+
+def run_script(tmp_path, **env):
+    venv = tmp_path / ".venv" / "bin"
+    venv.mkdir(parents=True)
+    (venv / "activate").write_text('python() { echo "python $*"; }\ndeactivate() { :; }\n')
+    return subprocess.run(
+        ["bash", SCRIPT],
+        env={"PATH": os.environ["PATH"], "SCOREBOARD_DIR": str(tmp_path), **env},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_every_listed_group_is_passed_to_the_driver(tmp_path):
+    result = run_script(tmp_path, GROUP_IDS="123456 654321")
+
+    assert result.returncode == 0
+    assert result.stdout.split()[:5] == ["python", "driver.py", "--group_id", "123456", "654321"]
+    assert "--site_dir" in result.stdout.split()[5:]
+
+
+def test_the_script_stops_without_a_group_list(tmp_path):
+    result = run_script(tmp_path)
+
+    assert result.returncode != 0
+    assert "GROUP_IDS" in result.stderr
+    assert "driver.py" not in result.stdout
@@ -0,0 +1,91 @@
+"""
+The CDP engine sizes its tab workers from the concurrency controller and
+feeds it page latencies and failures, as the Selenium client does.
+"""
+import asyncio
+
+import pytest
+
+from espn.cdp_engine import CdpPickEmClient
+from espn.concurrency import ConcurrencyController
+from espn.PickEmClient import PaginationTimeout
+from fakes import FakeCdpBrowser, FakeTab, PrevNextGrid
+
+WEEKS = [(week, str(week)) for week in range(1, 9)]
+
+
+def tab_client(initial, on_job, tabs=4):
+    """
+    A client whose tab jobs capture a one-page week after calling
+    on_job(client, week_num), and which records how many jobs ran at once.
+    """
+    controller = ConcurrencyController(initial=initial, max_limit=tabs, increase_every=1, cooldown=0)
+    client = CdpPickEmClient("test", tabs=tabs, concurrency=controller)
+    client.running = []  # (jobs running, limit) as each job starts
+    active = []
+
+    async def open_group_picks(tab):
+        pass
+
+    async def run_tab_job(tab, week_num, week_value, page_range, sessions):
+        client.running.append((len(active) + 1, client.concurrency.limit))
+        active.append(week_num)
+        on_job(client, week_num)
+        await asyncio.sleep(0.01)
+        client.captured_pages[week_num].add(1)
+        client._mark_last_page(week_num, 1)
+        active.remove(week_num)
+        return []
+
+    client._open_group_picks = open_group_picks
+    client._run_tab_job = run_tab_job
+    return client
+
+
+def scrape(client, browser):
+    return asyncio.run(client._scrape_weeks_in_tabs(browser, FakeTab(None), WEEKS))
+
+
+def test_tabs_open_as_the_limit_rises():
+    client = tab_client(1, lambda client, week: client.concurrency.record_latency(0.1))
+    browser = FakeCdpBrowser()
+
+    assert sorted(scrape(client, browser)) == [week for week, _ in WEEKS]
+    assert all(running <= limit for running, limit in client.running)
+    assert max(running for running, _ in client.running) == 4
+    assert len(browser.tabs) == 3
+    assert client.concurrency.on_change is None
+
+
+def test_tabs_close_when_the_limit_drops():
+    def throttle_once(client, week):
+        if week == 5:  # Once all four tabs are open
+            client.concurrency.record_failure("site is throttling us")
+
+    client = tab_client(4, throttle_once)
+    browser = FakeCdpBrowser()
+
+    assert sorted(scrape(client, browser)) == [week for week, _ in WEEKS]
+    assert client.concurrency.limit == 2
+    assert [tab.closed for tab in browser.tabs] == [False, True, True]
+
+
+def test_page_transitions_feed_the_controller():
+    grid = PrevNextGrid(num_pages=3)
+    client = CdpPickEmClient("test")
+    asyncio.run(client._scrape_range_in_tab(FakeTab(grid), 1, 1, None))
+    assert client.concurrency.latency is not None
+    assert not client.concurrency.changes
+
+    class StuckTab(FakeTab):
+        async def wait_for(self, script, *args, timeout=20, poll=0.05):
+            raise asyncio.TimeoutError()
+
+    client = CdpPickEmClient("test", concurrency=ConcurrencyController(initial=4, max_limit=4))
+    with pytest.raises(PaginationTimeout):
+        asyncio.run(client._wait_for_grid_change_in_tab(StuckTab(grid), "before", "next", timeout=0))
+    assert client.concurrency.limit == 2
+
+
+def test_tabs_cap_the_controller():
+    assert CdpPickEmClient("test", tabs=3, max_sessions=1).concurrency.max_limit == 3
@@ -0,0 +1,161 @@
+"""
+The CDP engine against tabs that answer its page scripts the way a pick grid
+with a week dropdown and numbered pagination would.
+"""
+import asyncio
+import json
+
+import pytest
+
+from espn.cdp_engine import (
+    CLICK_PAGINATION_JS,
+    GRID_CHANGED_JS,
+    GRID_PRESENT_JS,
+    SELECT_WEEK_JS,
+    CdpBrowser,
+    CdpError,
+    CdpPickEmClient,
+)
+from espn.grid_parser import GRID_EXTRACT_JS
+from espn.models import Outcome
+from espn.PickEmClient import GRID_FINGERPRINT_JS, PAGE_JUMP_JS
+
+ENTRIES_PER_PAGE = 2
+TEAMS = {1: "Buffalo Bills", 2: "Dallas Cowboys", 3: "Kansas City Chiefs"}
+
+
+class GridTab:
+    """
+    A tab showing a group's pick grid: weeks maps week to its number of pages,
+    and the latest week is shown first. Entry e of page p is "Entry p-e", and
+    it picked TEAMS[week] correctly.
+    """
+
+    def __init__(self, weeks):
+        self.weeks = weeks
+        self.shown_week = max(weeks)
+        self.page = 1
+        self.week = None  # Set by the engine once it selects a week here
+        self.target_id = "tab"
+
+    def fingerprint(self):
+        return f"{self.shown_week}-{self.page}"
+
+    def payload(self):
+        entries = [[i, f"Entry {self.page}-{i}"] for i in range(ENTRIES_PER_PAGE)]
+        rows = [[i, [[TEAMS[self.shown_week], 1]]] for i in range(ENTRIES_PER_PAGE)]
+        return json.dumps({"v": 1, "entries": entries, "rows": rows})
+
+    async def run_script(self, script, *args):
+        if script == GRID_FINGERPRINT_JS:
+            return self.fingerprint()
+        if script == SELECT_WEEK_JS:
+            week = int(args[0])
+            if week == self.shown_week:
+                return "same"
+            self.shown_week, self.page = week, 1
+            return "changed"
+        if script == PAGE_JUMP_JS:
+            state = {"current": self.page, "last": self.weeks[self.shown_week], "clicked": None,
+                     "fingerprint": self.fingerprint()}
+            if args[0] is not None and args[0] != self.page:
+                # Every page number is shown, so the target itself is clicked
+                state["clicked"] = self.page = args[0]
+            return state
+        if script == CLICK_PAGINATION_JS:
+            step = 1 if args[0] == "next" else -1
+            if not 1 <= self.page + step <= self.weeks[self.shown_week]:
+                return None
+            before = self.fingerprint()
+            self.page += step
+            return before
+        if script == GRID_EXTRACT_JS:
+            return self.payload()
+        raise AssertionError(f"unexpected script {script[:40]!r}")
+
+    async def wait_for(self, script, *args, timeout=20, poll=0.05):
+        if script == GRID_CHANGED_JS:
+            assert self.fingerprint() != args[0]
+        else:
+            assert script == GRID_PRESENT_JS
+        return True
+
+    async def close(self):
+        pass
+
+
+class GridBrowser:
+    def __init__(self, weeks):
+        self.weeks = weeks
+        self.tabs = []
+
+    async def new_tab(self):
+        self.tabs.append(GridTab(self.weeks))
+        return self.tabs[-1]
+
+
+def tab_client(**kwargs):
+    client = CdpPickEmClient("group", page_queue_size=100, **kwargs)
+
+    async def open_group_picks(tab):
+        pass
+
+    client._open_group_picks = open_group_picks
+    return client
+
+
+def parsed_picks(client):
+    """
+    Parses everything the engine captured and returns {week: {entry: team}}.
+    """
+    while not client.page_queue.empty():
+        item = client.page_queue.get()
+        client._parse_page(item[0], item[-1])
+    picks = {}
+    for name, team in client.teams.items():
+        for week in TEAMS:
+            for pick in team.get_weekly_picks(week):
+                assert pick.outcome is Outcome.CORRECT
+                picks.setdefault(week, {})[name] = pick.team_picked
+    return picks
+
+
+def test_every_page_of_every_week_is_captured_across_tabs():
+    weeks = {1: 7, 2: 3, 3: 1}
+    client = tab_client(tabs=4)
+    browser = GridBrowser(weeks)
+
+    scraped = asyncio.run(client._scrape_weeks_in_tabs(browser, GridTab(weeks), [(w, str(w)) for w in weeks]))
+
+    assert sorted(scraped) == [1, 2, 3]
+    assert browser.tabs
+    picks = parsed_picks(client)
+    for week, num_pages in weeks.items():
+        expected = {
+            f"Entry {page}-{i}": TEAMS[week] for page in range(1, num_pages + 1) for i in range(ENTRIES_PER_PAGE)
+        }
+        assert picks[week] == expected
+
+
+def test_a_range_starts_at_its_first_page_and_stops_at_its_last():
+    tab = GridTab({1: 6})
+    tab.shown_week = 1
+    client = tab_client()
+
+    assert asyncio.run(client._scrape_range_in_tab(tab, 1, 3, 4)) == 2
+    assert asyncio.run(client._scrape_range_in_tab(tab, 1, 5, None)) == 2
+    assert sorted(parsed_picks(client)[1]) == [f"Entry {page}-{i}" for page in (3, 4, 5, 6) for i in (0, 1)]
+
+
+def test_the_chrome_binary_comes_from_the_argument_the_environment_or_the_path(monkeypatch):
+    monkeypatch.setenv("CHROME_BINARY", "/opt/chrome/env-chrome")
+    assert CdpBrowser(None, "/usr/bin/my-chrome")._find_binary() == "/usr/bin/my-chrome"
+    assert CdpBrowser(None)._find_binary() == "/opt/chrome/env-chrome"
+
+    monkeypatch.delenv("CHROME_BINARY")
+    monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/chromium" if name == "chromium" else None)
+    assert CdpBrowser(None)._find_binary() == "/usr/bin/chromium"
+
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    with pytest.raises(CdpError):
+        CdpBrowser(None)._find_binary()
@@ -0,0 +1,127 @@
+import pytest
+
+import espn.concurrency
+from espn.browser_pool import BrowserPool, BrowserSession
+from espn.concurrency import ConcurrencyController, available_memory_mb
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    """
+    Sets the MB of memory the controller sees as available.
+    """
+    available = {"mb": 64_000}
+    monkeypatch.setattr(espn.concurrency, "available_memory_mb", lambda: available["mb"])
+    return available
+
+
+def controller(**kwargs):
+    kwargs = {"initial": 2, "max_limit": 6, "increase_every": 3, "cooldown": 0, **kwargs}
+    return ConcurrencyController(**kwargs)
+
+
+def test_the_limit_grows_while_latency_stays_healthy(memory):
+    changes = []
+    limits = controller(on_change=changes.append)
+
+    for _ in range(9):
+        limits.record_latency(0.5)
+
+    assert limits.limit == 5
+    assert changes == [3, 4, 5]
+    assert [(old, new) for _, old, new, _ in limits.changes] == [(2, 3), (3, 4), (4, 5)]
+
+    for _ in range(9):
+        limits.record_latency(0.5)
+    assert limits.limit == 6
+
+
+def test_the_limit_halves_when_latency_climbs(memory):
+    limits = controller(initial=6)
+    for _ in range(2):
+        limits.record_latency(0.2)
+
+    limits.record_latency(5.0)
+
+    assert limits.limit == 3
+    assert "latency" in limits.changes[-1][3]
+
+
+def test_failures_halve_the_limit_once_per_cooldown(memory):
+    limits = controller(initial=6, cooldown=60)
+
+    limits.record_failure("navigation timed out")
+    limits.record_failure("site is throttling us")
+
+    assert limits.limit == 3
+    assert [reason for _, _, _, reason in limits.changes] == ["navigation timed out"]
+
+
+def test_the_limit_stays_within_its_bounds(memory):
+    limits = controller(initial=10, max_limit=4, min_limit=1)
+    assert limits.limit == 4
+    for _ in range(5):
+        limits.record_failure("timeout")
+    assert limits.limit == 1
+
+
+def test_the_limit_holds_when_memory_runs_low(memory):
+    limits = controller()
+    memory["mb"] = 600  # Under the reserve plus one more session
+
+    for _ in range(6):
+        limits.record_latency(0.5)
+
+    assert limits.limit == 2
+    assert limits.changes == []
+
+
+def test_host_limit_reads_available_memory(tmp_path, monkeypatch):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("MemTotal:       16000000 kB\nMemAvailable:    1536000 kB\n")
+    assert available_memory_mb(str(meminfo)) == 1500
+    assert available_memory_mb(str(tmp_path / "missing")) is None
+
+    monkeypatch.setattr(espn.concurrency.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(espn.concurrency, "available_memory_mb", lambda: 1500)
+    assert ConcurrencyController.host_limit(session_memory_mb=400, memory_reserve_mb=512) == 2
+    monkeypatch.setattr(espn.concurrency, "available_memory_mb", lambda: None)
+    assert ConcurrencyController.host_limit() == 16
+
+
+class FakeChrome:
+    def __init__(self):
+        self.driver = self
+        self.quit_called = False
+
+    def execute_script(self, script):
+        return "complete"
+
+    def get_log(self, kind):
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_the_browser_pool_follows_the_limit(memory):
+    pool = BrowserPool(3, lambda browser: None)
+    launched = []
+
+    def launch():
+        launched.append(FakeChrome())
+        return BrowserSession(launched[-1])
+
+    pool._launch = launch
+    limits = controller(initial=3, on_change=pool.resize)
+
+    with pool:
+        with pool.session(), pool.session(), pool.session():
+            pass
+        busy = pool._checkout()
+        limits.record_failure("throttled")  # 3 -> 1
+
+        assert pool.size == 1
+        assert sum(browser.quit_called for browser in launched) == 2  # Idle ones close at once
+        pool._checkin(busy)
+        assert not busy.browser.quit_called  # Within the new size, so kept
@@ -0,0 +1,143 @@
+"""
+The fast paths against the code they replaced, on the generated fixtures the
+benchmarks time: the grid parser and JSON payloads against the BeautifulSoup
+parser, SeasonMatrix scoring against Team's per-pick methods, and Standings
+against the sort Scoreboard.render used to do.
+"""
+import os
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from bench.fixtures import OUTCOME_MIXES, RESULT_CLASSES, synthetic_teams, week_pages
+from espn.helpers import Helpers
+from espn.PickEmClient import PickEmClient
+from scoreboard.scoreboard import Scoreboard
+
+NUM_ENTRIES = 120  # Three pages, the last one short
+WEEKS = range(1, 19)
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} [AP]M")  # Scoreboard.render's "now"
+
+
+def parse_with_soup(pages_by_week):
+    client = PickEmClient("test")
+    for week, pages in pages_by_week.items():
+        for html in pages:
+            tables = BeautifulSoup(html, "html.parser").find_all("table")
+            idx_to_name = client._parse_team_names(tables)
+            client._parse_picks(tables, idx_to_name, week)
+    return client
+
+
+def parse_with_grid_parser(pages_by_week):
+    client = PickEmClient("test")
+    client._parse_pages(pages_by_week)
+    return client
+
+
+def picks_by_team(client, weeks):
+    return {
+        name: {
+            week: [(pick.team_picked, pick.outcome, pick.game_index) for pick in team.get_weekly_picks(week)]
+            for week in weeks
+        }
+        for name, team in client.teams.items()
+    }
+
+
+def old_ranking(teams_to_weekly_scores):
+    """
+    (rank, name, total) rows as Scoreboard.render built them before Standings.
+    """
+    totals = {name: sum(scores) for name, scores in teams_to_weekly_scores.items()}
+    ranked = []
+    rank, last_score = 1, None
+    for i, (name, score) in enumerate(sorted(totals.items(), key=lambda item: item[1], reverse=True)):
+        if score != last_score:
+            rank = i + 1
+        ranked.append((rank, name, score))
+        last_score = score
+    return ranked
+
+
+@pytest.fixture
+def ties(monkeypatch):
+    # Some of every outcome land on tied teams
+    for week, tied in {1: ["KC", "BUF"], 2: ["DAL", "PHI", "SF"], 5: ["NE"]}.items():
+        monkeypatch.setitem(Helpers.WEEK_TIE_MAP, week, tied)
+
+
+@pytest.mark.parametrize("outcome_mix", sorted(OUTCOME_MIXES))
+@pytest.mark.parametrize("class_variant", ["mixed"] + sorted(RESULT_CLASSES))
+def test_grid_parser_matches_soup(class_variant, outcome_mix):
+    pages = {
+        week: week_pages(NUM_ENTRIES, week, outcome_mix=outcome_mix, class_variant=class_variant)
+        for week in (1, 2)
+    }
+    soup = parse_with_soup(pages)
+    grid = parse_with_grid_parser(pages)
+
+    assert len(soup.teams) == NUM_ENTRIES
+    assert picks_by_team(grid, pages) == picks_by_team(soup, pages)
+
+
+def test_no_pick_is_matched_as_a_whole_class():
+    # Cells with a class that merely starts with "noPick" still hold a pick
+    pages = {1: [
+        page.replace('GroupPickGrid-column--pick">', 'GroupPickGrid-column--pick noPickable">')
+        for page in week_pages(NUM_ENTRIES, 1)
+    ]}
+    soup = parse_with_soup(pages)
+
+    assert picks_by_team(parse_with_grid_parser(pages), pages) == picks_by_team(soup, pages)
+    assert all(team.get_weekly_picks(1) for team in soup.teams.values())
+
+
+@pytest.mark.parametrize("outcome_mix", sorted(OUTCOME_MIXES))
+def test_json_payloads_match_soup(outcome_mix):
+    # Payloads hold the same picks as the "mixed" HTML pages
+    html = {week: week_pages(NUM_ENTRIES, week, outcome_mix=outcome_mix) for week in (1, 2)}
+    payloads = {
+        week: week_pages(NUM_ENTRIES, week, outcome_mix=outcome_mix, extraction="json") for week in (1, 2)
+    }
+
+    assert picks_by_team(parse_with_grid_parser(payloads), html) == picks_by_team(parse_with_soup(html), html)
+
+
+@pytest.mark.parametrize("outcome_mix", [None] + sorted(OUTCOME_MIXES))
+def test_season_matrix_matches_per_pick_scoring(ties, outcome_mix):
+    teams = synthetic_teams(NUM_ENTRIES, outcome_mix=outcome_mix, seed=3)
+    scoreboard = Scoreboard(teams)
+    scoreboard.submit_weeks(WEEKS)
+
+    for team in teams:
+        assert scoreboard.teams_to_weekly_scores[team.name] == [team.get_weekly_score(week) for week in WEEKS]
+        assert scoreboard.teams_to_weekly_records[team.name] == [team.get_weekly_record(week) for week in WEEKS]
+
+
+def test_standings_match_the_sorted_ranking(ties):
+    # Few weeks played, so many entries share a total
+    teams = synthetic_teams(NUM_ENTRIES, outcome_mix="final", seed=4)
+    scoreboard = Scoreboard(teams)
+    scoreboard.submit_weeks(range(1, 3))
+    assert scoreboard.standings.rows() == old_ranking(scoreboard.teams_to_weekly_scores)
+
+    # The same weeks submitted one team at a time
+    for team in teams:
+        for week in WEEKS:
+            scoreboard.submit_team_week(team, week)
+    assert scoreboard.standings.rows() == old_ranking(scoreboard.teams_to_weekly_scores)
+
+
+def test_a_parsed_season_renders_the_same_from_either_parser(tmp_path, ties):
+    pages = {week: week_pages(NUM_ENTRIES, week, outcome_mix="final") for week in range(1, 4)}
+    rendered = []
+    for client in (parse_with_soup(pages), parse_with_grid_parser(pages)):
+        scoreboard = Scoreboard(client.get_teams())
+        scoreboard.submit_weeks(WEEKS)
+        out_file = os.path.join(tmp_path, f"{len(rendered)}.html")
+        scoreboard.render(out_file)
+        with open(out_file) as f:
+            rendered.append(TIMESTAMP.sub("", f.read()))
+    assert rendered[0] == rendered[1]
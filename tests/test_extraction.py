@@ -0,0 +1,90 @@
+import json
+
+from bench.fixtures import pick_grid_html
+from espn.grid_parser import (
+    CORRECT_FLAG,
+    GRID_EXTRACT_JS,
+    INCORRECT_FLAG,
+    LINK_FLAG,
+    NO_PICK_FLAG,
+    is_extracted,
+    parse_grid,
+)
+from espn.PickEmClient import PickEmClient
+
+
+def payload_for(page):
+    """
+    The GRID_EXTRACT_JS payload of a parsed HTML page.
+    """
+    def flags(cell):
+        return (
+            CORRECT_FLAG * cell.correct
+            | INCORRECT_FLAG * cell.incorrect
+            | NO_PICK_FLAG * cell.no_pick
+            | LINK_FLAG * cell.has_link
+        )
+
+    return json.dumps({
+        "v": 1,
+        "entries": [[idx, name] for idx, name in page.entries.items()],
+        "rows": [[idx, [[cell.team, flags(cell)] for cell in cells]] for idx, cells in page.rows],
+    })
+
+
+class ScriptBrowser:
+    def __init__(self, result):
+        self.result = result
+        self.scripts = []
+
+    def execute_script(self, script):
+        self.scripts.append(script)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_an_extracted_page_decodes_like_its_html():
+    html = pick_grid_html(12, seed=1)
+    page = parse_grid(html)
+    payload = payload_for(page)
+
+    assert is_extracted(payload) and not is_extracted(html)
+    assert parse_grid(payload) == page
+
+
+def test_extracted_pages_give_teams_the_same_picks():
+    html = pick_grid_html(12, seed=2)
+    from_html, from_json = PickEmClient("group"), PickEmClient("group")
+    from_html._parse_page(1, html)
+    from_json._parse_page(1, payload_for(parse_grid(html)))
+
+    def picks(client):
+        return {
+            name: [(pick.team_picked, pick.outcome, pick.game_index) for pick in team.get_weekly_picks(1)]
+            for name, team in client.teams.items()
+        }
+
+    assert len(from_json.teams) == 12
+    assert picks(from_json) == picks(from_html)
+
+
+def test_an_unreadable_payload_is_skipped_not_parsed_as_html():
+    client = PickEmClient("group")
+    client._parse_page(1, '{"v": 1, "entries": [[0, "Entry 0"]')
+
+    assert parse_grid('{"v": 1, "entries": []}') is None
+    assert client.teams == {}
+
+
+def test_pages_fall_back_to_html_when_extraction_finds_nothing():
+    client = PickEmClient("group")
+    browser = ScriptBrowser('{"v": 1}')
+    assert client._extract_pick_grid(browser, 1, 1) == '{"v": 1}'
+    assert browser.scripts == [GRID_EXTRACT_JS]
+    assert client._extract_pick_grid(ScriptBrowser(None), 1, 1) is None
+    assert client._extract_pick_grid(ScriptBrowser(RuntimeError("stale element")), 1, 1) is None
+
+    browser = ScriptBrowser('{"v": 1}')
+    assert PickEmClient("group", extraction="html")._extract_pick_grid(browser, 1, 1) is None
+    assert browser.scripts == []
@@ -0,0 +1,93 @@
+"""
+PickEmHttpClient against responses in the endpoint schema it assumes, kept
+under tests/fixtures/espn_api. Week 3 has no recorded entries, so fetching
+it fails.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+import driver
+from espn.http_client import CHALLENGE, PickEmHttpClient
+from espn.models import Outcome
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "espn_api")
+
+
+class RecordedTransport:
+    """
+    Serves recorded responses: the challenge, and each week's entries page by
+    offset. Unrecorded requests raise, like a failed fetch.
+    """
+
+    def __init__(self, directory=FIXTURES):
+        self.directory = directory
+        self.requests = []
+
+    def get_json(self, path, params=None):
+        self.requests.append((path, params))
+        if path == f"challenges/{CHALLENGE}":
+            name = "challenge.json"
+        else:
+            assert path.endswith("/entries"), path
+            name = f"entries-week-{params['scoringPeriodId']}-offset-{params['offset']}.json"
+        with open(os.path.join(self.directory, name)) as f:
+            return json.load(f)
+
+
+def picks(team, week):
+    return [(pick.team_picked, pick.outcome, pick.game_index) for pick in team.get_weekly_picks(week)]
+
+
+def run_client(week=None):
+    client = PickEmHttpClient("123", transport=RecordedTransport(), max_workers=2)
+    client.PAGE_SIZE = 2
+    client.run(week=week)
+    return client, {team.name: team for team in client.get_teams()}
+
+
+def test_weeks_are_paged_and_mapped_to_picks():
+    client, teams = run_client(week=1)
+
+    assert sorted(teams) == ["Alpha", "Bravo", "Charlie"]
+    assert picks(teams["Alpha"], 1) == [
+        ("Kansas City Chiefs", Outcome.CORRECT, 0),
+        ("Dallas Cowboys", Outcome.INCORRECT, 1),
+    ]
+    assert picks(teams["Bravo"], 1) == [
+        ("Baltimore Ravens", Outcome.INCORRECT, 0),
+        ("Philadelphia Eagles", Outcome.CORRECT, 1),
+    ]
+    # Picks keep their proposition's game index however the entry lists them;
+    # a game with no pick or an unknown proposition is left out
+    assert picks(teams["Charlie"], 1) == [("Philadelphia Eagles", Outcome.CORRECT, 1)]
+    assert [params["offset"] for _, params in client.transport.requests[1:]] == [0, 2]
+    assert client.incomplete_weeks == {}
+    assert teams["Alpha"].get_weekly_score(1) == -1
+
+
+def test_failed_weeks_and_unreadable_entries_are_reported():
+    client, teams = run_client()
+
+    assert sorted(client.incomplete_weeks) == [2, 3]
+    assert "1 of 3 entries unreadable" in client.incomplete_weeks[2]
+    assert client.incomplete_weeks[3].startswith("fetch failed")
+    # The entry without a name is skipped; the rest of its week is kept
+    assert picks(teams["Alpha"], 2) == [
+        ("Buffalo Bills", Outcome.PUSH, 0),
+        ("San Francisco 49ers", Outcome.UNDECIDED, 1),
+    ]
+    assert picks(teams["Charlie"], 2) == [("Miami Dolphins", Outcome.CORRECT, 0)]
+    assert picks(teams["Bravo"], 2) == []
+    assert picks(teams["Alpha"], 1)
+
+
+def test_snapshot_options_are_rejected_for_the_http_backend(monkeypatch, capsys):
+    for option in (["--snapshot_dir", "snaps"], ["--snapshot_dir", "snaps", "--from_snapshots"],
+                   ["--snapshot_dir", "snaps", "--incremental"]):
+        monkeypatch.setattr(sys, "argv", ["driver.py", "--group_id", "123", "--backend", "http"] + option)
+        with pytest.raises(SystemExit):
+            driver.main()
+        assert "--season_file" in capsys.readouterr().err
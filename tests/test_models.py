@@ -0,0 +1,37 @@
+import json
+import logging
+
+from bench.fixtures import pick_grid_payload
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from espn.PickEmClient import PickEmClient
+from scoreboard.season_matrix import SeasonMatrix
+
+
+def test_unknown_team_names_fall_back_to_the_name(monkeypatch, caplog):
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 1, ["KC"])
+    team = Team("Entry", "owner")
+    team.add_weekly_pick(1, Pick("Kansas City Chiefs", Outcome.INCORRECT, 0))
+    team.add_weekly_pick(1, Pick("Oakland Raiders", Outcome.INCORRECT, 1))
+    team.add_weekly_pick(1, Pick("Oakland Raiders", Outcome.CORRECT, 2))
+
+    with caplog.at_level(logging.WARNING, logger="espn.models"):
+        assert team.get_weekly_record(1) == "(1-1-1)"
+        assert SeasonMatrix([team]).weekly_records("Entry")[0] == "(1-1-1)"
+    assert [pick.team_abbr for pick in team.get_weekly_picks(1)] == ["KC", "Oakland Raiders", "Oakland Raiders"]
+    assert [r.getMessage() for r in caplog.records if "Oakland Raiders" in r.getMessage()] == [
+        "No abbreviation for team 'Oakland Raiders'; using the name as is"
+    ]
+
+
+def test_a_page_with_an_unknown_team_still_parses():
+    payload = json.loads(pick_grid_payload(3, games=2, seed=1))
+    payload["rows"][0][1][0][0] = "Washington Football Team"
+    client = PickEmClient("group")
+
+    client._parse_page(1, json.dumps(payload))
+
+    assert len(client.teams) == 3
+    picks = [team.get_weekly_picks(1) for team in client.teams.values()]
+    assert "Washington Football Team" in [pick.team_picked for week in picks for pick in week]
+    assert all(team.get_weekly_record(1) for team in client.teams.values())
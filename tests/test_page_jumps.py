@@ -0,0 +1,70 @@
+from espn.PickEmClient import GRID_FINGERPRINT_JS, PAGE_JUMP_JS, PickEmClient
+
+
+class NumberedGrid:
+    """
+    A pick grid with numbered pagination that shows the first and last pages
+    and the pages next to the current one ("1 ... 6 7 8 ... 20"), answering
+    PAGE_JUMP_JS the way the script does in the page. It is its own WebDriver.
+    """
+
+    def __init__(self, num_pages, page=1, numbered=True):
+        self.num_pages = num_pages
+        self.page = page
+        self.numbered = numbered
+        self.clicks = []
+        self.driver = self
+
+    def shown(self):
+        near = range(self.page - 1, self.page + 2)
+        return sorted({1, self.num_pages} | {num for num in near if 1 <= num <= self.num_pages})
+
+    def execute_script(self, script, *args):
+        if script == GRID_FINGERPRINT_JS:
+            return f"page {self.page}"
+        if script == PAGE_JUMP_JS:
+            if not self.numbered:
+                return None
+            target = args[0]
+            state = {
+                "current": self.page,
+                "last": max(self.shown()),
+                "clicked": None,
+                "fingerprint": self.execute_script(GRID_FINGERPRINT_JS),
+            }
+            if target is not None and target != self.page:
+                closest = min(self.shown(), key=lambda num: abs(num - target))
+                if abs(closest - target) < abs(self.page - target):
+                    self.clicks.append(closest)
+                    self.page = state["clicked"] = closest
+            return state
+        raise AssertionError(f"unexpected script {script!r}")
+
+
+def test_far_pages_are_reached_in_a_few_jumps():
+    grid = NumberedGrid(20)
+
+    assert PickEmClient("group")._go_to_page(grid, 14)
+    assert grid.page == 14
+    # The last page is the closest one shown, then the pages next to it
+    assert grid.clicks == [20, 19, 18, 17, 16, 15, 14]
+
+    assert PickEmClient("group")._go_to_page(grid, 1)
+    assert grid.clicks[-1] == 1
+
+
+def test_grids_without_page_numbers_cannot_jump():
+    grid = NumberedGrid(5, numbered=False)
+
+    assert not PickEmClient("group")._go_to_page(grid, 3)
+    assert grid.page == 1
+
+
+def test_a_week_is_split_into_ranges_of_at_least_three_pages():
+    client = PickEmClient("group")
+
+    assert client._split_pages(NumberedGrid(10), 3) == [(1, 4), (5, 8), (9, None)]
+    assert client._split_pages(NumberedGrid(4), 4) == [(1, 2), (3, None)]
+    assert client._split_pages(NumberedGrid(10), 1) is None
+    assert client._split_pages(NumberedGrid(3), 4) is None
+    assert client._split_pages(NumberedGrid(10, numbered=False), 3) is None
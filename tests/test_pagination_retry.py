@@ -0,0 +1,67 @@
+"""
+Retries and checkpoint resumes start part-way through a week. On a grid with
+only prev/next buttons (no numbered pager) they must still reach their first
+page, in the Selenium client and the CDP engine.
+"""
+import asyncio
+
+from espn.cdp_engine import CdpPickEmClient
+from espn.PickEmClient import PickEmClient
+from fakes import ENTRIES_PER_PAGE, FakeBrowser, FakePool, FakeTab, PrevNextGrid
+
+
+def captured_entries(client, week):
+    while not client.page_queue.empty():
+        week_num, _, page = client.page_queue.get()
+        client._parse_page(week_num, page)
+    return sorted(
+        int(team.name.split()[-1]) for team in client.teams.values() if team.get_weekly_picks(week)
+    )
+
+
+def test_retry_reaches_its_first_page_with_prev_next_only():
+    grid = PrevNextGrid(num_pages=4, start_page=3)
+    client = PickEmClient("test", retry_backoff=0)
+    client.browser_pool = FakePool(FakeBrowser(grid))
+    client._select_week_in_session = lambda browser, wait, week_num, week_value: True
+    client.captured_pages[1] = {1}
+
+    delay, ranges = client._plan_retry(1)
+    assert ranges == [(2, None)]
+    num_pages = client._scrape_week_range_parallel(1, "week-1", *ranges[0], delay)
+
+    assert num_pages == 3
+    assert grid.clicks[:2] == ["prev", "prev"]
+    assert client.captured_pages[1] == {1, 2, 3, 4}
+    assert client.last_pages[1] == 4
+    assert client._missing_ranges(1) == []
+    assert captured_entries(client, 1) == list(range(ENTRIES_PER_PAGE, 4 * ENTRIES_PER_PAGE))
+
+
+def test_retry_past_the_last_page_fails_with_prev_next_only():
+    grid = PrevNextGrid(num_pages=2)
+    client = PickEmClient("test")
+    client.browser_pool = FakePool(FakeBrowser(grid))
+    client._select_week_in_session = lambda browser, wait, week_num, week_value: True
+
+    try:
+        client._scrape_week_range_parallel(1, "week-1", 4, None)
+    except RuntimeError as e:
+        assert "page 4" in str(e)
+    else:
+        raise AssertionError("reached a page the grid does not have")
+    assert not client.captured_pages[1]
+
+
+def test_cdp_retry_reaches_its_first_page_with_prev_next_only():
+    grid = PrevNextGrid(num_pages=3, start_page=2)
+    client = CdpPickEmClient("test")
+    client.captured_pages[1] = {1}
+
+    num_pages = asyncio.run(client._scrape_range_in_tab(FakeTab(grid), 1, 2, None))
+
+    assert num_pages == 2
+    assert grid.clicks[0] == "prev"
+    assert client.captured_pages[1] == {1, 2, 3}
+    assert client._missing_ranges(1) == []
+    assert captured_entries(client, 1) == list(range(ENTRIES_PER_PAGE, 3 * ENTRIES_PER_PAGE))
@@ -0,0 +1,49 @@
+from bench.fixtures import pick_grid_payload
+from espn.PickEmClient import PickEmClient
+from espn.snapshots import SnapshotStore
+
+TRUNCATED = pick_grid_payload(3, games=2, seed=2, first_entry=3)[:40]
+
+
+def scrape(client, pages):
+    """
+    Stands in for the browser scrape: captures week 1's pages in order.
+    """
+    def scrape_with_browser(week=None):
+        for page_num, page in enumerate(pages, start=1):
+            client._submit_page(1, page_num, page)
+        client._mark_last_page(1, len(pages))
+        return [], [1]
+    client._scrape_with_browser = scrape_with_browser
+    client._report_traffic = lambda: None
+    client.run()
+
+
+def test_a_page_that_fails_to_parse_leaves_its_week_incomplete(tmp_path):
+    store = SnapshotStore(str(tmp_path), "group")
+    client = PickEmClient("group", snapshot_store=store)
+    scrape(client, [pick_grid_payload(3, games=2, seed=1), TRUNCATED, pick_grid_payload(3, games=2, seed=3, first_entry=6)])
+
+    assert client.incomplete_weeks == {1: [(2, 2)]}
+    assert client.completeness[1]["status"] == "incomplete"
+    assert client.captured_pages[1] == {1, 3}
+    # Not finished, so never marked final; the checkpoint lacks the bad page
+    assert store.read_manifest(1) is None
+    pages, last_page = store.load_checkpoint(1, max_age=3600)
+    assert sorted(pages) == [1, 3] and last_page == 3
+
+    # The next run resumes the week and only has page 2 left to capture
+    resumed = PickEmClient("group", snapshot_store=SnapshotStore(str(tmp_path), "group"))
+    resumed._resume_checkpoints([1])
+    assert resumed._missing_ranges(1) == [(2, 2)]
+
+
+def test_a_page_parsed_on_retry_completes_its_week():
+    client = PickEmClient("group")
+    # As if an earlier capture of page 2 had failed to parse
+    client._unmark_page(1, 2)
+    scrape(client, [pick_grid_payload(3, games=2, seed=1), pick_grid_payload(3, games=2, seed=2, first_entry=3)])
+
+    assert client.incomplete_weeks == {}
+    assert client.completeness[1]["status"] == "complete"
+    assert len(client.teams) == 6
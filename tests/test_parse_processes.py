@@ -0,0 +1,44 @@
+import pytest
+
+import espn.PickEmClient
+from bench.fixtures import week_pages
+from espn.PickEmClient import PickEmClient, get_parse_pool, shutdown_parse_pool
+
+
+def picks(client):
+    return {
+        team.name: [(pick.team_picked, pick.outcome, pick.game_index) for pick in team.get_weekly_picks(week)]
+        for team in client.get_teams() for week in (1, 2)
+    }
+
+
+@pytest.fixture
+def pages():
+    yield {week: week_pages(60, week, games=4, entries_per_page=20, extraction="json") for week in (1, 2)}
+    shutdown_parse_pool()
+
+
+def test_few_pages_are_parsed_without_starting_the_pool(pages, monkeypatch):
+    def no_pool(processes):
+        raise AssertionError("started the process pool for 6 pages")
+    monkeypatch.setattr(espn.PickEmClient, "get_parse_pool", no_pool)
+
+    client = PickEmClient("group", parse_processes=4)
+    client._parse_in_processes(pages)
+    assert len(client.teams) == 60
+
+
+def test_spawned_pool_is_reused_and_matches_in_process_parsing(pages, monkeypatch):
+    monkeypatch.setattr(espn.PickEmClient, "MIN_PAGES_FOR_PROCESSES", 2)
+    expected = PickEmClient("group", parse_processes=1)
+    expected._parse_in_processes(pages)
+
+    executors = []
+    for _ in range(2):
+        client = PickEmClient("group", parse_processes=2)
+        client._parse_in_processes(pages)
+        assert picks(client) == picks(expected)
+        executors.append(get_parse_pool(2))
+
+    assert executors[0] is executors[1]
+    assert executors[0]._mp_context.get_start_method() == "spawn"
@@ -0,0 +1,52 @@
+import builtins
+import gzip
+import os
+
+import pytest
+
+from scoreboard.publish import LocalBackend, Publisher, available_encodings
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.fixture
+def no_brotli(monkeypatch):
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "brotli":
+            raise ImportError("No module named 'brotli'")
+        return real_import(name, *args, **kwargs)
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+
+
+def test_missing_brotli_fails_instead_of_dropping_variants(no_brotli):
+    with pytest.raises(ImportError, match="--no_brotli"):
+        available_encodings(("gzip", "br"))
+    with pytest.raises(ImportError):
+        Publisher(LocalBackend("unused"))
+    assert available_encodings(("gzip",)) == ["gzip"]
+
+
+def test_only_changed_files_are_uploaded(tmp_path):
+    site, dest = str(tmp_path / "site"), str(tmp_path / "dest")
+    write(os.path.join(site, "index.html"), "<p>week 1</p>")
+    write(os.path.join(site, "weeks", "week-01.html"), "<p>scores</p>")
+
+    publisher = Publisher(LocalBackend(dest), encodings=("gzip",))
+    assert sorted(publisher.publish_directory(site)) == [
+        "index.html", "index.html.gz", "weeks/week-01.html", "weeks/week-01.html.gz",
+    ]
+    with open(os.path.join(dest, "index.html.gz"), "rb") as f:
+        assert gzip.decompress(f.read()) == b"<p>week 1</p>"
+
+    write(os.path.join(site, "index.html"), "<p>week 2</p>")
+    os.remove(os.path.join(site, "weeks", "week-01.html"))
+    publisher = Publisher(LocalBackend(dest), encodings=("gzip",))
+    assert publisher.publish_directory(site) == ["index.html", "index.html.gz"]
+    assert sorted(publisher.deleted) == ["weeks/week-01.html", "weeks/week-01.html.gz"]
+    assert publisher.publish_directory(site) == []
@@ -0,0 +1,80 @@
+import random
+
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from scoreboard.scoring_rules import DEFAULT_RULE, ScoringRule, evaluate_rules
+from scoreboard.season_matrix import SeasonMatrix
+
+TEAM_NAMES = ["Kansas City Chiefs", "Buffalo Bills", "Dallas Cowboys", "Philadelphia Eagles"]
+RULES = [
+    DEFAULT_RULE,
+    ScoringRule("+1/0", 1, 0, 0),
+    ScoringRule("+2/-1/+1", 2, -1, 1),
+    ScoringRule("halves", 0.5, -0.5, 0.25),
+]
+
+
+def random_teams(num_teams, games=3, seed=0):
+    rng = random.Random(seed)
+    teams = []
+    for i in range(num_teams):
+        team = Team(f"Entry {i}", "owner")
+        for week in range(1, 19):
+            for game in range(games):
+                outcome = rng.choice([Outcome.CORRECT, Outcome.INCORRECT])
+                team.add_weekly_pick(week, Pick(rng.choice(TEAM_NAMES), outcome, game))
+        teams.append(team)
+    return teams
+
+
+def ranked(totals):
+    """
+    (rank, name, total) rows the way Scoreboard.render ranks them: ties share
+    a rank and the next rank skips.
+    """
+    rows = []
+    rank, last = 1, None
+    for i, (name, total) in enumerate(sorted(totals.items(), key=lambda item: item[1], reverse=True)):
+        if total != last:
+            rank = i + 1
+        rows.append((rank, name, total))
+        last = total
+    return rows
+
+
+def rule_total(team, rule):
+    return sum(
+        rule.correct * team.get_weekly_num_correct(week)
+        + rule.incorrect * team.get_weekly_num_incorrect(week)
+        + rule.tie * team.get_weekly_num_ties(week)
+        for week in range(1, 19)
+    )
+
+
+def test_every_rule_ranks_like_scoring_it_alone(monkeypatch):
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 3, ["KC"])
+    # Few games, so many teams share a total
+    teams = random_teams(40, games=1)
+
+    standings = evaluate_rules(SeasonMatrix(teams), RULES)
+
+    assert list(standings) == [rule.name for rule in RULES]
+    for rule in RULES:
+        expected = ranked({team.name: rule_total(team, rule) for team in teams})
+        assert standings[rule.name].rows() == expected
+        assert len(standings[rule.name]) == len(teams)
+
+
+def test_the_default_rule_matches_the_season_totals():
+    teams = random_teams(10, seed=2)
+    season = SeasonMatrix(teams)
+
+    rows = evaluate_rules(season, [DEFAULT_RULE])[DEFAULT_RULE.name].rows()
+
+    assert rows == ranked({name: int(total) for name, total in zip(season.names, season.totals.tolist())})
+
+
+def test_rows_can_stop_at_the_leaders():
+    standings = evaluate_rules(SeasonMatrix(random_teams(10, seed=3)), [DEFAULT_RULE])[DEFAULT_RULE.name]
+
+    assert standings.rows(limit=3) == standings.rows()[:3]
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from scoreboard.scoreboard import Scoreboard
+from scoreboard.season_matrix import SeasonMatrix
+
+TEAM_NAMES = ["Kansas City Chiefs", "Buffalo Bills", "Dallas Cowboys", "Philadelphia Eagles"]
+WEEKS = range(1, 19)
+
+
+def random_teams(num_teams, seed=0):
+    rng = random.Random(seed)
+    teams = []
+    for i in range(num_teams):
+        team = Team(f"Entry {i}", f"owner{i}")
+        for week in WEEKS:
+            # Teams play a different number of games some weeks, and some play none
+            for game in range(rng.choice([0, 3, 5])):
+                team.add_weekly_pick(week, Pick(rng.choice(TEAM_NAMES), rng.choice(list(Outcome)), game))
+        teams.append(team)
+    return teams
+
+
+@pytest.fixture
+def ties(monkeypatch):
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 1, ["KC"])
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 2, ["BUF", "DAL"])
+
+
+def test_matrix_scores_match_each_teams_picks(ties):
+    teams = random_teams(12)
+    season = SeasonMatrix(teams)
+
+    for team in teams:
+        assert season.weekly_scores(team.name) == [team.get_weekly_score(week) for week in WEEKS]
+        assert season.weekly_records(team.name) == [team.get_weekly_record(week) for week in WEEKS]
+        assert season.totals[season.index[team.name]] == sum(team.get_weekly_score(week) for week in WEEKS)
+
+
+def test_tied_games_are_never_incorrect(ties):
+    team = Team("Entry", "owner")
+    team.add_weekly_pick(1, Pick("Kansas City Chiefs", Outcome.INCORRECT, 0))
+    team.add_weekly_pick(1, Pick("Kansas City Chiefs", Outcome.CORRECT, 1))
+    team.add_weekly_pick(1, Pick("Buffalo Bills", Outcome.INCORRECT, 2))
+
+    season = SeasonMatrix([team])
+
+    assert season.weekly_scores("Entry")[0] == 1 - 2
+    assert season.weekly_records("Entry")[0] == "(1-1-2)"
+
+
+def test_a_season_without_picks_scores_zero():
+    season = SeasonMatrix([Team("Entry", "owner")])
+
+    assert season.weekly_scores("Entry") == [0] * 18
+    assert season.weekly_records("Entry") == ["(0-0-0)"] * 18
+
+
+def test_submitting_all_weeks_matches_one_team_week_at_a_time(ties):
+    teams = random_teams(6, seed=1)
+    by_week = Scoreboard(teams)
+    for team in teams:
+        for week in WEEKS:
+            by_week.submit_team_week(team, week)
+    at_once = Scoreboard(teams)
+    at_once.submit_weeks(WEEKS)
+
+    assert at_once.teams_to_weekly_scores == by_week.teams_to_weekly_scores
+    assert at_once.teams_to_weekly_records == by_week.teams_to_weekly_records
@@ -0,0 +1,64 @@
+from bench.fixtures import pick_grid_html
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from espn.PickEmClient import PickEmClient
+from espn.snapshots import SnapshotStore
+from espn.week_state import WeekState
+
+
+def test_snapshot_final_flag_decides_reuse_without_week_state(tmp_path):
+    store = SnapshotStore(str(tmp_path), "group")
+    store.save_week(1, [pick_grid_html(3, seed=1)], final=True)
+    store.save_week(2, [pick_grid_html(3, seed=2)], final=False)
+    client = PickEmClient("group", snapshot_store=store)
+
+    assert client._load_snapshot(1)
+    assert client._load_snapshot(2) is None
+
+
+def test_incremental_runs_scrape_only_unsettled_and_new_weeks(tmp_path):
+    store = SnapshotStore(str(tmp_path), "group")
+    for week in (1, 2, 3):
+        store.save_week(week, [pick_grid_html(3, seed=week)], final=week != 2)
+    # The last run saw week 1 settled and week 2 with a game still to play;
+    # week 3 had a snapshot but no recorded outcomes, week 4 is new
+    path = str(tmp_path / "week_state.json")
+    week_state = WeekState(path)
+    week_state.weeks[1] = {"picks": 48, "undecided": 0}
+    week_state.weeks[2] = {"picks": 48, "undecided": 3}
+    week_state.save()
+
+    client = PickEmClient("group", snapshot_store=store, week_state=WeekState(path))
+    loaded, to_scrape = client._plan_weeks([(week, str(week)) for week in (1, 2, 3, 4)])
+
+    assert loaded == [1]
+    assert to_scrape == [(2, "2"), (3, "3"), (4, "4")]
+    assert all(team.get_weekly_picks(1) for team in client.get_teams())
+
+
+def test_week_state_counts_pushes_and_ties_as_settled(tmp_path, monkeypatch):
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 1, ["DAL"])
+    team = Team("Entry", "owner")
+    team.add_weekly_pick(1, Pick("Kansas City Chiefs", Outcome.PUSH, 0))
+    team.add_weekly_pick(1, Pick("Dallas Cowboys", Outcome.UNDECIDED, 1))
+    team.add_weekly_pick(2, Pick("Buffalo Bills", Outcome.UNDECIDED, 0))
+    week_state = WeekState(str(tmp_path / "week_state.json"))
+    for week in (1, 2):
+        week_state.update_from_teams([team], week)
+
+    assert week_state.is_settled(1)
+    assert not week_state.is_settled(2)
+    assert not week_state.is_settled(3)
+
+
+def test_pushes_and_ties_count_as_decided():
+    client = PickEmClient("group")
+    team = client.teams["Entry"] = Team("Entry", "owner")
+    team.add_weekly_pick(1, Pick("Kansas City Chiefs", Outcome.CORRECT, 0))
+    team.add_weekly_pick(1, Pick("Dallas Cowboys", Outcome.PUSH, 1))
+    team.add_weekly_pick(2, Pick("Buffalo Bills", Outcome.INCORRECT, 0))
+    team.add_weekly_pick(2, Pick("Miami Dolphins", Outcome.UNDECIDED, 1))
+
+    assert client._is_week_final(1)
+    assert not client._is_week_final(2)
+    assert not client._is_week_final(3)
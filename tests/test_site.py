@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from scoreboard.scoreboard import Scoreboard
+from scoreboard.site import SiteGenerator, entry_slug
+
+WEEKS = range(1, 19)
+
+
+@pytest.fixture(autouse=True)
+def no_ties(monkeypatch):
+    for week in WEEKS:
+        monkeypatch.setitem(Helpers.WEEK_TIE_MAP, week, [])
+
+
+def season(results):
+    """
+    A submitted Scoreboard from {entry: {week: [correct?, ...]}}.
+    """
+    teams = []
+    for name, weeks in results.items():
+        team = Team(name, "owner")
+        for week, picks in weeks.items():
+            for game, correct in enumerate(picks):
+                team.add_weekly_pick(week, Pick("Buffalo Bills", Outcome.CORRECT if correct else Outcome.INCORRECT, game))
+        teams.append(team)
+    scoreboard = Scoreboard(teams)
+    scoreboard.submit_weeks(WEEKS)
+    return scoreboard
+
+
+RESULTS = {
+    "Alpha": {1: [True, True], 2: [True, False]},
+    "Bravo": {1: [True, False], 2: [True, True]},
+    "Charlie": {1: [False, False], 2: [True, True]},
+}
+
+
+def test_a_page_per_week_played_and_per_entry(tmp_path, monkeypatch):
+    # Templates are found from any working directory
+    monkeypatch.chdir(tmp_path)
+    site = SiteGenerator(str(tmp_path / "site"))
+
+    written = site.build(season(RESULTS), WEEKS)
+
+    entries = [SiteGenerator.entry_path(name) for name in RESULTS]
+    assert sorted(written) == sorted(["index.html", "weeks/week-01.html", "weeks/week-02.html"] + entries)
+    for path in written:
+        assert os.path.exists(tmp_path / "site" / path)
+    with open(tmp_path / "site" / "index.html") as f:
+        index = f.read()
+    assert "Alpha" in index and entries[0] in index
+
+
+def test_unchanged_pages_are_not_rewritten(tmp_path):
+    SiteGenerator(str(tmp_path)).build(season(RESULTS), WEEKS)
+    site = SiteGenerator(str(tmp_path))
+
+    assert site.build(season(RESULTS), WEEKS) == []
+    assert len(site.skipped) == 6
+
+
+def test_a_correction_rewrites_only_the_pages_it_shows_on(tmp_path):
+    SiteGenerator(str(tmp_path)).build(season(RESULTS), WEEKS)
+    corrected = {**RESULTS, "Charlie": {1: [False, True], 2: [True, True]}}
+
+    written = SiteGenerator(str(tmp_path)).build(season(corrected), WEEKS)
+
+    # Charlie's week 1 changes, and Charlie moves up to share first place
+    # without changing anyone else's rank
+    assert sorted(written) == sorted(["index.html", "weeks/week-01.html", SiteGenerator.entry_path("Charlie")])
+
+
+def test_pages_of_removed_entries_are_deleted(tmp_path):
+    SiteGenerator(str(tmp_path)).build(season(RESULTS), WEEKS)
+    remaining = {name: weeks for name, weeks in RESULTS.items() if name != "Bravo"}
+
+    SiteGenerator(str(tmp_path)).build(season(remaining), WEEKS)
+
+    assert not os.path.exists(tmp_path / SiteGenerator.entry_path("Bravo"))
+    assert os.path.exists(tmp_path / SiteGenerator.entry_path("Alpha"))
+
+
+def test_entry_slugs_keep_similar_names_apart():
+    assert entry_slug("Go Bills!") != entry_slug("go bills")
+    assert entry_slug("Go Bills!").startswith("go-bills-")
+    assert entry_slug("!!!").startswith("entry-")
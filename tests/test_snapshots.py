@@ -0,0 +1,61 @@
+import gzip
+import json
+import os
+
+from espn.snapshots import SnapshotStore
+
+PAGES = ["<table>page one</table>", "<table>page two</table>", "<table>page three</table>"]
+
+
+def test_a_saved_week_reads_back_page_by_page(tmp_path):
+    store = SnapshotStore(str(tmp_path), 123)
+    store.save_week(2, PAGES, final=True)
+
+    week_dir = os.path.join(tmp_path, "123", "week-02")
+    assert sorted(os.listdir(week_dir)) == ["manifest.json", "page-01.html.gz", "page-02.html.gz", "page-03.html.gz"]
+    assert store.load_week(2) == PAGES
+    assert store.is_final(2)
+    assert store.load_week(3) is None
+    assert not store.is_final(3)
+
+    # Other groups keep their own snapshots
+    assert SnapshotStore(str(tmp_path), 456).load_week(2) is None
+
+
+def test_weeks_are_only_final_when_saved_as_final(tmp_path):
+    store = SnapshotStore(str(tmp_path), 123)
+    store.save_week(1, PAGES)
+
+    assert store.load_week(1) == PAGES
+    assert not store.is_final(1)
+
+
+def test_a_page_that_fails_its_hash_check_is_not_served(tmp_path):
+    store = SnapshotStore(str(tmp_path), 123)
+    store.save_week(1, PAGES, final=True)
+    with gzip.open(os.path.join(tmp_path, "123", "week-01", "page-02.html.gz"), "wt", encoding="utf-8") as f:
+        f.write("<table>edited</table>")
+
+    assert store.load_week(1) is None
+
+
+def test_an_unreadable_manifest_reads_as_nothing_stored(tmp_path):
+    store = SnapshotStore(str(tmp_path), 123)
+    store.save_week(1, PAGES, final=True)
+    with open(os.path.join(tmp_path, "123", "week-01", "manifest.json"), "w") as f:
+        f.write("{")
+
+    assert store.read_manifest(1) is None
+    assert store.load_week(1) is None
+    assert not store.is_final(1)
+
+
+def test_a_shorter_capture_drops_the_old_extra_pages(tmp_path):
+    store = SnapshotStore(str(tmp_path), 123)
+    store.save_week(1, PAGES)
+    store.save_week(1, PAGES[:2], final=True)
+
+    assert store.load_week(1) == PAGES[:2]
+    assert not os.path.exists(os.path.join(tmp_path, "123", "week-01", "page-03.html.gz"))
+    with open(os.path.join(tmp_path, "123", "week-01", "manifest.json")) as f:
+        assert [entry["page"] for entry in json.load(f)["pages"]] == [1, 2]
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from espn.helpers import Helpers
+from espn.models import Outcome, Pick, Team
+from scoreboard.scoreboard import Scoreboard
+from scoreboard.standings import Standings
+
+
+def sorted_rows(weekly):
+    """
+    (rank, name, total) rows from a full sort: ties share a rank, the next
+    rank skips, and tied entries keep the order they were added in.
+    """
+    totals = sorted(((sum(scores), name) for name, scores in weekly.items()), key=lambda item: -item[0])
+    rows = []
+    for i, (total, name) in enumerate(totals):
+        rank = rows[-1][0] if rows and rows[-1][2] == total else i + 1
+        rows.append((rank, name, total))
+    return rows
+
+
+def test_random_updates_keep_the_same_rows_as_a_full_sort():
+    rng = random.Random(7)
+    standings = Standings()
+    weekly = {}
+    for i in range(60):
+        weekly[f"Entry {i}"] = [0] * 18
+        standings.add(f"Entry {i}")
+
+    for step in range(2000):
+        name = f"Entry {rng.randrange(60)}"
+        week = rng.randint(1, 18)
+        # Mostly small changes, with the odd one far outside the current spread
+        delta = rng.choice([-2, -1, 1, 2, 3]) if step % 97 else rng.choice([-500, 700])
+        standings.apply_delta(name, week, delta)
+        weekly[name][week - 1] += delta
+
+        if step % 50 == 0:
+            assert standings.rows() == sorted_rows(weekly)
+    assert standings.rows() == sorted_rows(weekly)
+    for name in weekly:
+        assert standings.weekly_scores(name) == weekly[name]
+        assert standings.total(name) == sum(weekly[name])
+        assert standings.rank(name) == next(rank for rank, row_name, _ in standings.rows() if row_name == name)
+
+
+def test_ties_share_a_rank_and_the_next_rank_skips():
+    standings = Standings()
+    for name, total in [("a", 5), ("b", 9), ("c", 5), ("d", 1), ("e", 5)]:
+        standings.add(name, [total] + [0] * 17)
+
+    assert standings.rows() == [(1, "b", 9), (2, "a", 5), (2, "c", 5), (2, "e", 5), (5, "d", 1)]
+    assert standings.top(3) == [(1, "b", 9), (2, "a", 5), (2, "c", 5)]
+    assert standings.rank("e") == 2
+    assert standings.rank("d") == 5
+
+
+def test_set_score_applies_the_difference():
+    standings = Standings()
+    standings.add("a", [1, 2] + [0] * 16)
+    standings.add("b")
+
+    standings.set_score("a", 2, -3)
+    standings.set_score("b", 18, 4)
+
+    assert standings.weekly_scores("a")[:2] == [1, -3]
+    assert standings.rows() == [(1, "b", 4), (2, "a", -2)]
+
+
+def test_entries_are_added_once():
+    standings = Standings()
+    standings.add("a")
+    assert "a" in standings and len(standings) == 1
+    with pytest.raises(ValueError):
+        standings.add("a")
+
+
+def test_the_scoreboard_keeps_its_standings_current(monkeypatch):
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 1, [])
+    monkeypatch.setitem(Helpers.WEEK_TIE_MAP, 2, [])
+    teams = [Team(f"Entry {i}", "owner") for i in range(4)]
+    for i, team in enumerate(teams):
+        for week in (1, 2):
+            for game in range(3):
+                outcome = Outcome.CORRECT if (i + game + week) % 3 else Outcome.INCORRECT
+                team.add_weekly_pick(week, Pick("Buffalo Bills", outcome, game))
+    scoreboard = Scoreboard(teams)
+
+    scoreboard.submit_weeks([1])
+    assert scoreboard.standings.rows() == sorted_rows(scoreboard.teams_to_weekly_scores)
+    scoreboard.submit_team_week(teams[0], 2)
+    scoreboard.submit_team_week(teams[3], 2)
+    assert scoreboard.standings.rows() == sorted_rows(scoreboard.teams_to_weekly_scores)
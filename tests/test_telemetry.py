@@ -0,0 +1,40 @@
+from espn.browser_profile import count_webdriver_calls
+from espn.telemetry import Tracer, tracer
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {"value": None}
+
+
+def test_webdriver_calls_counts_every_command(monkeypatch):
+    monkeypatch.setattr(tracer, "enabled", True)
+    monkeypatch.setattr(tracer, "counters", type(tracer.counters)(int))
+    driver = count_webdriver_calls(FakeDriver())
+
+    with tracer.span("paginate") as span:
+        driver.execute("executeScript", {"script": "return 1"})
+        driver.execute("findElements")
+    driver.execute("get")
+
+    assert driver.commands == ["executeScript", "findElements", "get"]
+    assert span.counters["webdriver_calls"] == 2
+    assert tracer.counters["webdriver_calls"] == 3
+
+
+def test_spans_are_bounded_but_totals_cover_every_span():
+    spans = Tracer(enabled=True, max_spans=3)
+    for _ in range(10):
+        with spans.span("grid-capture"):
+            pass
+
+    assert len(spans.spans) == 3
+    assert spans.summary()["grid-capture"]["count"] == 10
+    assert '"count": 10' in spans.to_json()
+
+    spans.reset()
+    assert not spans.spans and spans.summary() == {}
@@ -0,0 +1,59 @@
+import time
+
+from espn.PickEmClient import PickEmClient
+from espn.snapshots import SnapshotStore
+from espn.watch import WatchDaemon
+from fakes import FakeBrowser, PrevNextGrid, _Wait
+
+
+def scraped_client(grid, snapshot_store=None):
+    """
+    A client that has just scraped every page of week 1 from grid, and is left
+    with a live session on it, as the driver hands it to the daemon.
+    """
+    client = PickEmClient("group", snapshot_store=snapshot_store)
+    for page_num in range(1, grid.num_pages + 1):
+        grid.page = page_num
+        client._submit_page(1, page_num, grid.payload())
+    client._mark_last_page(1, grid.num_pages)
+    while not client.page_queue.empty():
+        week_num, _, page = client.page_queue.get()
+        client._parse_page(week_num, page)
+    client.browser, client.wait = FakeBrowser(grid), _Wait()
+    client._get_week_options = lambda: []
+    return client
+
+
+def watch(client):
+    changes = []
+    daemon = WatchDaemon(client, lambda teams, weeks: changes.append(weeks))
+    daemon._session_started = time.monotonic()
+    return daemon, changes
+
+
+def test_first_cycle_after_a_scrape_reports_no_change():
+    grid = PrevNextGrid(num_pages=3)
+    daemon, changes = watch(scraped_client(grid))
+
+    assert 1 in daemon.fingerprints
+    assert daemon.cycle() is False
+    grid.version += 1
+    assert daemon.cycle() is True
+    assert changes == [[1]]
+
+
+def test_fingerprints_are_seeded_from_snapshots(tmp_path):
+    grid = PrevNextGrid(num_pages=2)
+    store = SnapshotStore(str(tmp_path), "group")
+    scraped = scraped_client(grid, snapshot_store=store)
+    store.finish_week(1)
+
+    # A run that reused the snapshot instead of scraping week 1
+    client = PickEmClient("group", snapshot_store=store)
+    client.browser, client.wait = scraped.browser, scraped.wait
+    client._get_week_options = scraped._get_week_options
+    daemon, changes = watch(client)
+
+    assert daemon.fingerprints[1] == watch(scraped)[0].fingerprints[1]
+    assert daemon.cycle() is False
+    assert changes == []